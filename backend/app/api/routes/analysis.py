@@ -0,0 +1,22 @@
+from fastapi import APIRouter, HTTPException
+
+from app.schemas.analysis import AnalysisJob
+from app.services.analysis_job_service import AnalysisJobService
+
+router = APIRouter(prefix="/analysis", tags=["analysis"])
+
+
+@router.post("/{year}", response_model=AnalysisJob, status_code=202)
+def enqueue_season_analysis(year: int):
+    """Queue a background wet analysis for `year`; poll the returned job for progress."""
+    if year < 2018 or year > 2030:
+        raise HTTPException(status_code=400, detail="Wet analysis needs FastF1 timing data (2018 onwards)")
+    return AnalysisJobService.enqueue(year)
+
+
+@router.get("/jobs/{job_id}", response_model=AnalysisJob)
+def get_analysis_job(job_id: int):
+    job = AnalysisJobService.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Analysis job {job_id} not found")
+    return job
@@ -10,6 +10,7 @@ from app.schemas.drivers import (
 from app.services.driver_service import DriverService
 from app.services.highlight_service import HighlightService
 from app.services.wet import F1Service
+from app.services.analysis_job_service import AnalysisJobService
 from app.core.cache import CACHE
 
 router = APIRouter(prefix="/drivers", tags=["drivers"])
@@ -34,6 +35,7 @@ def get_driver_career(driver_code: str):
 
 @router.get("/{driver_code}/wet", response_model=DriverWetPerformance)
 def get_driver_wet_performance(driver_code: str):
+    AnalysisJobService.sync_analysis_cache()
     code = driver_code.upper()
     cache_key = f"wet_{code}"
 
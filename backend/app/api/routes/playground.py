@@ -1,31 +1,183 @@
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Query
 
-from app.services.playground_service import PlaygroundService, UnknownIdentifierError
+from app.core.config import settings
+from app.schemas.playground import (
+    DEFAULT_UNCERTAINTY_SAMPLES,
+    MAX_LEADERBOARD_LIMIT,
+    MAX_UNCERTAINTY_SAMPLES,
+    BestPartnersResponse,
+    ChallengeEvaluation,
+    ChallengeSolutions,
+    LapBatchRequest,
+    LapBatchResponse,
+    LapEstimate,
+    LapPercentile,
+    LeaderboardResponse,
+    Slot,
+)
+from app.services.playground_service import (
+    DEFAULT_TRACK,
+    DEFAULT_YEAR,
+    TRACK_PATTERN,
+    BundleNotFoundError,
+    PlaygroundService,
+    UncertaintySamplesError,
+    UncertaintyUnavailableError,
+    UnknownIdentifierError,
+)
 
 router = APIRouter(prefix="/playground", tags=["playground"])
 
 
-@router.get("/lap")
+def _bundle_unavailable(e: BundleNotFoundError) -> HTTPException:
+    """503 when the default bundle is missing (as before bundles were per track), 404 for
+    a season/track nobody derived."""
+    if (e.year, e.track) == (DEFAULT_YEAR, DEFAULT_TRACK):
+        return HTTPException(status_code=503, detail="Playground coefficients are not available.")
+    return HTTPException(
+        status_code=404,
+        detail=f"No Playground coefficients for {e.year} {e.track}. Use /api/playground/bundles for available ones.",
+    )
+
+
+@router.get("/bundles")
+def get_bundles():
+    """Seasons and tracks with coefficient bundles, from the manifest index."""
+    return PlaygroundService.list_bundles()
+
+
+@router.get("/lap", response_model=LapEstimate)
 def get_lap_estimate(
     driver: str = Query(..., description="3-letter driver code, e.g. LEC"),
     chassis: str = Query(..., description="Team chassis slug, e.g. redbull"),
     engine: str = Query(..., description="3-letter engine code, e.g. MER"),
+    year: int = Query(DEFAULT_YEAR, description="Season of the coefficient bundle"),
+    track: str = Query(DEFAULT_TRACK, pattern=TRACK_PATTERN, description="Circuit of the coefficient bundle, e.g. bahrain"),
+    uncertainty: bool = Query(False, description="Add Monte Carlo percentile bands for the total and sectors "
+                                                 "(if enabled; needs a bundle with uncertainty_replicates)"),
+    samples: int = Query(DEFAULT_UNCERTAINTY_SAMPLES, ge=100, le=MAX_UNCERTAINTY_SAMPLES,
+                         description="Monte Carlo draws, each a distinct stored bootstrap replicate; "
+                                     "at most the bundle's replicate count"),
+    seed: Optional[int] = Query(None, ge=0, description="Seed for reproducible bands"),
+):
+    if uncertainty and not settings.PLAYGROUND_UNCERTAINTY_ENABLED:
+        raise HTTPException(
+            status_code=404,
+            detail="Uncertainty bands are not enabled on this server (PLAYGROUND_UNCERTAINTY_ENABLED).",
+        )
+    try:
+        result = PlaygroundService.simulate_lap(driver=driver, chassis=chassis, engine=engine, year=year, track=track)
+        if uncertainty:
+            result["uncertainty"] = PlaygroundService.lap_uncertainty(
+                driver, chassis, engine, samples=samples, seed=seed, year=year, track=track,
+            )
+        return result
+    except UnknownIdentifierError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown {e.identifier_type} '{e.value}'. Use /api/playground/choices for valid options.",
+        )
+    except UncertaintySamplesError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=f"samples must be at most {e.replicates}, the bootstrap replicates stored for {e.year} {e.track}.",
+        )
+    except UncertaintyUnavailableError as e:
+        raise HTTPException(
+            status_code=409,
+            detail=f"The {e.year} {e.track} coefficients were derived without bootstrap residuals, "
+                   "so uncertainty bands are unavailable. Re-derive them with "
+                   "scripts/derive_playground_coefficients.py --force.",
+        )
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
+
+
+@router.post("/lap/batch", response_model=LapBatchResponse)
+def get_lap_estimates_batch(
+    request: LapBatchRequest,
+    year: int = Query(DEFAULT_YEAR, description="Season of the coefficient bundle"),
+    track: str = Query(DEFAULT_TRACK, pattern=TRACK_PATTERN, description="Circuit of the coefficient bundle, e.g. bahrain"),
+):
+    """Estimate every combo in one round-trip; results are in request order."""
+    try:
+        return PlaygroundService.simulate_laps(
+            [(c.driver, c.chassis, c.engine) for c in request.combos], year=year, track=track,
+        )
+    except UnknownIdentifierError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown {e.identifier_type} '{e.value}'. Use /api/playground/choices for valid options.",
+        )
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
+
+
+@router.get("/lap/percentile", response_model=LapPercentile)
+def get_lap_percentile(
+    driver: str = Query(..., description="3-letter driver code, e.g. LEC"),
+    chassis: str = Query(..., description="Team chassis slug, e.g. redbull"),
+    engine: str = Query(..., description="3-letter engine code, e.g. MER"),
+    year: int = Query(DEFAULT_YEAR, description="Season of the coefficient bundle"),
+    track: str = Query(DEFAULT_TRACK, pattern=TRACK_PATTERN, description="Circuit of the coefficient bundle, e.g. bahrain"),
 ):
     try:
-        return PlaygroundService.simulate_lap(driver=driver, chassis=chassis, engine=engine)
+        return PlaygroundService.percentile_rank(driver=driver, chassis=chassis, engine=engine, year=year, track=track)
     except UnknownIdentifierError as e:
         raise HTTPException(
             status_code=400,
             detail=f"Unknown {e.identifier_type} '{e.value}'. Use /api/playground/choices for valid options.",
         )
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
+
+
+@router.get("/leaderboard", response_model=LeaderboardResponse)
+def get_leaderboard(
+    limit: int = Query(10, ge=1, le=MAX_LEADERBOARD_LIMIT, description="Number of fastest combos"),
+    year: int = Query(DEFAULT_YEAR, description="Season of the coefficient bundle"),
+    track: str = Query(DEFAULT_TRACK, pattern=TRACK_PATTERN, description="Circuit of the coefficient bundle, e.g. bahrain"),
+):
+    try:
+        return PlaygroundService.leaderboard(limit=limit, year=year, track=track)
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
+
+
+@router.get("/best-partners/{slot}", response_model=BestPartnersResponse)
+def get_best_partners(
+    slot: Slot,
+    year: int = Query(DEFAULT_YEAR, description="Season of the coefficient bundle"),
+    track: str = Query(DEFAULT_TRACK, pattern=TRACK_PATTERN, description="Circuit of the coefficient bundle, e.g. bahrain"),
+):
+    """Each driver, chassis or engine with its fastest pairing of the other two slots."""
+    try:
+        return PlaygroundService.best_partners(slot, year=year, track=track)
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
     except FileNotFoundError:
         raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
 
 
 @router.get("/choices")
-def get_choices():
+def get_choices(
+    year: int = Query(DEFAULT_YEAR, description="Season of the coefficient bundle"),
+    track: str = Query(DEFAULT_TRACK, pattern=TRACK_PATTERN, description="Circuit of the coefficient bundle, e.g. bahrain"),
+):
     try:
-        return PlaygroundService.list_eligible_choices()
+        return PlaygroundService.list_eligible_choices(year=year, track=track)
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
     except FileNotFoundError:
         raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
 
@@ -35,9 +187,61 @@ def get_challenges():
     return PlaygroundService.list_challenges()
 
 
+def _get_challenge(challenge_id: str):
+    challenge = PlaygroundService.get_challenge(challenge_id)
+    if not challenge:
+        raise HTTPException(status_code=404, detail=f"Challenge '{challenge_id}' not found")
+    return challenge
+
+
+@router.post("/challenges/{challenge_id}/evaluate", response_model=ChallengeEvaluation)
+def evaluate_challenge(challenge_id: str, request: LapBatchRequest):
+    """Pass/fail for each submitted combo against the challenge's locks and target.
+
+    Challenges are pinned to the bundle their target was set on (reported as year and
+    track), so there are no year/track parameters."""
+    challenge = _get_challenge(challenge_id)
+    try:
+        return PlaygroundService.evaluate_challenge(challenge, [(c.driver, c.chassis, c.engine) for c in request.combos])
+    except UnknownIdentifierError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown {e.identifier_type} '{e.value}'. Use /api/playground/choices for valid options.",
+        )
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
+
+
+@router.get("/challenges/{challenge_id}/solutions", response_model=ChallengeSolutions)
+def get_challenge_solutions(
+    challenge_id: str,
+    limit: Optional[int] = Query(None, ge=1, description="Return only the N best solutions (count is still total)"),
+):
+    """Every passing combo on the challenge's bundle, best first, with the optimal one and the solution count."""
+    challenge = _get_challenge(challenge_id)
+    try:
+        return PlaygroundService.solve_challenge(challenge, limit=limit)
+    except UnknownIdentifierError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Challenge '{challenge_id}' locks an unknown {e.identifier_type} '{e.value}'",
+        )
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
+
+
 @router.get("/methodology")
-def get_methodology():
+def get_methodology(
+    year: int = Query(DEFAULT_YEAR, description="Season of the coefficient bundle"),
+    track: str = Query(DEFAULT_TRACK, pattern=TRACK_PATTERN, description="Circuit of the coefficient bundle, e.g. bahrain"),
+):
     try:
-        return PlaygroundService.get_methodology()
+        return PlaygroundService.get_methodology(year=year, track=track)
+    except BundleNotFoundError as e:
+        raise _bundle_unavailable(e)
     except FileNotFoundError:
         raise HTTPException(status_code=503, detail="Playground coefficients are not available.")
@@ -1,12 +1,17 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.schemas.season import SeasonAnalysisResponse
 from app.schemas.drivers import DriverCareerStats
 from app.services.wet import F1Service
+from app.services.analysis_job_service import AnalysisJobService
 from app.core.cache import CACHE
+from app.core.config import settings
 import logging
 import json
+import threading
+import time
 from pathlib import Path
-from typing import List
+from typing import List, Dict, Any, Iterator, Optional
 
 
 router = APIRouter()
@@ -15,8 +20,12 @@ f1_service = F1Service()
 APP_DIR = Path(__file__).resolve().parent.parent
 ANALYSIS_DIR = APP_DIR / "analysis_results"
 
+# Each open stream holds a threadpool thread while it polls its job
+_open_streams = threading.BoundedSemaphore(settings.ANALYSIS_MAX_STREAMS)
+
 @router.get("/season/{year}", response_model=SeasonAnalysisResponse)
 def get_season_analysis(year: int):
+    AnalysisJobService.sync_analysis_cache()
     cache_key = f"analysis_{year}"
 
     if cache_key in CACHE:
@@ -40,8 +49,89 @@ def get_season_analysis(year: int):
     
     return {"season": year, "standings": standings_data}
 
+@router.get("/season/{year}/stream")
+def stream_season_analysis(year: int):
+    """Streams the season's background analysis as server-sent events: a `start` event,
+    one `event` per finished race weekend with the standings so far, then `complete`
+    (or `error`).
+
+    Streaming never starts an analysis; that is POST /api/analysis/{year}. The stream
+    attaches to the season's queued or running job, so every client of a season shares
+    one run on the job pool. With no active job, a season that was already analysed is
+    replayed from its analysis file as `start` and `complete`, and any other season is a
+    404. Open streams are capped per API worker."""
+    if year < 2018 or year > 2030:
+        raise HTTPException(status_code=400, detail="Wet analysis needs FastF1 timing data (2018 onwards)")
+
+    job = AnalysisJobService.get_active_job(year)
+    analysis_file = ANALYSIS_DIR / f"{year}.json"
+    if job is None and not analysis_file.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"No analysis of the {year} season is running; queue one with POST /api/analysis/{year}.",
+        )
+    if not _open_streams.acquire(blocking=False):
+        raise HTTPException(status_code=503, detail="Too many analysis streams open; try again shortly")
+
+    def events():
+        try:
+            if job is None:
+                yield from _saved_events(year)
+            else:
+                yield from _job_events(year, job.id)
+        finally:
+            _open_streams.release()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def _saved_events(year: int) -> Iterator[str]:
+    """A finished season replayed from its analysis file."""
+    yield _sse("start", {"season": year, "job_id": None, "events_total": None})
+    yield _sse("complete", {"type": "complete", "season": year, "standings": _saved_standings(year, "written")})
+
+def _job_events(year: int, job_id: int) -> Iterator[str]:
+    """Polls the job row and relays each newly recorded event until the job finishes."""
+    started = False
+    last_done = None
+    while True:
+        job, progress = AnalysisJobService.get_job_progress(job_id)
+        if job is None:
+            yield _sse("error", {"season": year, "detail": f"Analysis job {job_id} disappeared"})
+            return
+
+        if not started and job.events_total is not None:
+            yield _sse("start", {"season": year, "job_id": job_id, "events_total": job.events_total})
+            started = True
+        if progress is not None and progress["events_done"] != last_done:
+            last_done = progress["events_done"]
+            yield _sse("event", progress)
+
+        if job.status == "failed":
+            yield _sse("error", {"season": year, "detail": job.error})
+            return
+        if job.status == "succeeded":
+            yield _sse("complete", {"type": "complete", "season": year, "standings": _saved_standings(year, job.result)})
+            return
+        time.sleep(settings.ANALYSIS_STREAM_POLL_SECONDS)
+
+def _saved_standings(year: int, result: Optional[str]) -> List[Dict[str, Any]]:
+    """The finished job's standings, from the analysis file it wrote."""
+    analysis_file = ANALYSIS_DIR / f"{year}.json"
+    if result != "written" or not analysis_file.exists():
+        return []
+    with open(analysis_file) as f:
+        return json.load(f)
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 @router.get("/driver/{driver_code}", response_model=DriverCareerStats)
 def get_driver_career(driver_code: str):
+    AnalysisJobService.sync_analysis_cache()
     driver_code = driver_code.upper()
     cache_key = f"driver_{driver_code}"
 
@@ -92,6 +182,7 @@ def get_driver_career(driver_code: str):
 
 @router.get("/", response_model=list[str])
 def list_all_drivers():
+    AnalysisJobService.sync_analysis_cache()
     cache_key = "driver_list"
 
     if cache_key in CACHE:
@@ -11,6 +11,22 @@ class Settings(BaseSettings):
     API_TITLE: str = "F1 Driver Statistics API"
     API_VERSION: str = "1.0.0"
     
+    # Background analysis jobs (process pool size)
+    ANALYSIS_JOB_WORKERS: int = 1
+    # A running job's worker refreshes its lease this often (a quarter of it); a job whose
+    # lease lapsed is treated as abandoned and queued again
+    ANALYSIS_JOB_LEASE_SECONDS: int = 120
+    
+    # Open /season/{year}/stream connections per worker, and how often each polls its job
+    ANALYSIS_MAX_STREAMS: int = 16
+    ANALYSIS_STREAM_POLL_SECONDS: float = 1.0
+    
+    # Bytes of Playground bundles (and their grids) kept in memory per worker, least recently used evicted
+    PLAYGROUND_BUNDLE_CACHE_BYTES: int = 64 * 1024 * 1024
+    # /playground/lap?uncertainty=true; off until a bundle derived with bootstrap residuals
+    # ships (the shipped 2024 Bahrain bundle has none). /playground/bundles lists which do.
+    PLAYGROUND_UNCERTAINTY_ENABLED: bool = False
+    
     # Paths
     ANALYSIS_DIR: Path = Path("./analysis_results")
     
@@ -1,86 +1,144 @@
 import json
+import time
 from pathlib import Path
+from typing import Optional
 import sqlite3
 from core.config import settings
 
-def migrate_from_json(analysis_dir: Path = None):
-    """Migrate existing JSON data to SQLite"""
+# Secondary indexes on the tables the migration fills; dropped during the load and
+# rebuilt once at the end instead of being maintained on every inserted row
+DEFERRED_INDEX_TABLES = ("team_history", "season_standings")
+
+
+def _season_drivers(file: Path):
+    """Driver rows from one analysis file, or None when the format is not recognised"""
+    with open(file) as f:
+        data = json.load(f)
+
+    # Handle both data formats
+    if isinstance(data, dict) and "standings" in data:
+        return data["standings"]
+    if isinstance(data, list):
+        return data
+    return None
+
+
+def migrate_from_json(analysis_dir: Optional[Path] = None):
+    """
+    Migrate existing JSON data to SQLite.
+
+    Season files are streamed one at a time and written with executemany in a
+    single transaction, so memory stays bounded by the largest file rather than
+    the whole archive. Career aggregates are computed in SQL from
+    season_standings once every file is loaded.
+    """
     if analysis_dir is None:
         analysis_dir = settings.ANALYSIS_DIR
-    
+
+    started = time.perf_counter()
     conn = sqlite3.connect(settings.DATABASE_PATH)
     cursor = conn.cursor()
-    
-    driver_data = {}  # Collect all driver data first
-    
-    # Read all JSON files
-    for file in analysis_dir.glob("*.json"):
-        season = int(file.stem)
-        
-        with open(file) as f:
-            data = json.load(f)
-        
-        # Handle both data formats
-        if isinstance(data, dict) and "standings" in data:
-            drivers = data["standings"]
-        elif isinstance(data, list):
-            drivers = data
-        else:
-            print(f"⚠️ Skipping unexpected format: {file}")
-            continue
-        
-        # Process each driver
-        for d in drivers:
-            driver_code = d["driver_code"].upper()
-            
-            if driver_code not in driver_data:
-                driver_data[driver_code] = {
-                    "full_name": d.get("full_name", ""),
-                    "seasons": {},
-                    "teams": {}
-                }
-            
-            # Store season data
-            driver_data[driver_code]["seasons"][season] = {
-                "position": d.get("position"),
-                "points": d.get("points"),
-                "wins": d.get("wins", 0),
-                "podiums": d.get("podiums", 0),
-                "pole_positions": d.get("pole_positions", 0),
-                "fastest_laps": d.get("fastest_laps", 0),
-                "dnfs": d.get("dnfs", 0)
-            }
-            
-            driver_data[driver_code]["teams"][season] = d.get("team_name", "Unknown")
-    
-    # Insert into database
-    for driver_code, data in driver_data.items():
-        positions = [s["position"] for s in data["seasons"].values() if s["position"]]
-        avg_position = sum(positions) / len(positions) if positions else None
-        
-        # Insert driver
-        cursor.execute("""
-            INSERT OR REPLACE INTO drivers (driver_code, full_name, average_position, total_seasons)
-            VALUES (?, ?, ?, ?)
-        """, (driver_code, data["full_name"], avg_position, len(data["seasons"])))
-        
-        # Insert team history
-        for season, team_name in data["teams"].items():
-            cursor.execute("""
+
+    cursor.execute("PRAGMA synchronous = OFF")
+    cursor.execute("BEGIN")
+    try:
+        placeholders = ",".join("?" * len(DEFERRED_INDEX_TABLES))
+        cursor.execute(f"""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})
+        """, DEFERRED_INDEX_TABLES)
+        deferred_indexes = cursor.fetchall()
+        for name, _ in deferred_indexes:
+            cursor.execute(f"DROP INDEX {name}")
+
+        # Drivers touched by this migration, for the career recompute at the end
+        cursor.execute("CREATE TEMP TABLE migrated_drivers (driver_code TEXT PRIMARY KEY)")
+
+        seasons = rows = 0
+        for file in sorted(analysis_dir.glob("*.json")):
+            if not file.stem.isdigit():
+                continue  # playground bundles and other non-season outputs
+            season = int(file.stem)
+
+            drivers = _season_drivers(file)
+            if drivers is None:
+                print(f"⚠️ Skipping unexpected format: {file}")
+                continue
+
+            # Later duplicates of a driver within a file win, as with INSERT OR REPLACE
+            by_code = {d["driver_code"].upper(): d for d in drivers}
+
+            # Existing drivers keep their other columns; the latest season's name wins
+            cursor.executemany("""
+                INSERT INTO drivers (driver_code, full_name) VALUES (?, ?)
+                ON CONFLICT(driver_code) DO UPDATE SET full_name = excluded.full_name
+            """, [(code, d.get("full_name", "")) for code, d in by_code.items()])
+            cursor.executemany(
+                "INSERT OR IGNORE INTO migrated_drivers (driver_code) VALUES (?)",
+                [(code,) for code in by_code],
+            )
+
+            cursor.executemany("""
                 INSERT OR REPLACE INTO team_history (driver_code, season, team_name)
                 VALUES (?, ?, ?)
-            """, (driver_code, season, team_name))
-        
-        # Insert season standings
-        for season, stats in data["seasons"].items():
-            cursor.execute("""
-                INSERT OR REPLACE INTO season_standings 
+            """, [(code, season, d.get("team_name", "Unknown")) for code, d in by_code.items()])
+
+            cursor.executemany("""
+                INSERT OR REPLACE INTO season_standings
                 (driver_code, season, position, points, wins, podiums, pole_positions, fastest_laps, dnfs)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (driver_code, season, stats["position"], stats["points"], 
-                  stats["wins"], stats["podiums"], stats["pole_positions"], 
-                  stats["fastest_laps"], stats["dnfs"]))
-    
-    conn.commit()
-    conn.close()
-    print(f"✅ Migrated {len(driver_data)} drivers to database")
\ No newline at end of file
+            """, [
+                (code, season, d.get("position"), d.get("points"),
+                 d.get("wins", 0), d.get("podiums", 0), d.get("pole_positions", 0),
+                 d.get("fastest_laps", 0), d.get("dnfs", 0))
+                for code, d in by_code.items()
+            ])
+
+            seasons += 1
+            rows += 3 * len(by_code)
+            del drivers, by_code
+
+        # Career aggregates from scratch for the migrated drivers; the scraper keeps
+        # them up to date incrementally from these sums
+        cursor.execute("""
+            UPDATE drivers SET
+                total_seasons = agg.seasons,
+                classified_seasons = agg.classified,
+                position_sum = agg.position_sum,
+                average_position = agg.average_position,
+                total_wins = agg.wins,
+                total_points = agg.points,
+                updated_at = CURRENT_TIMESTAMP
+            FROM (
+                SELECT driver_code,
+                       COUNT(*) AS seasons,
+                       COUNT(CASE WHEN position > 0 THEN 1 END) AS classified,
+                       COALESCE(SUM(CASE WHEN position > 0 THEN position END), 0) AS position_sum,
+                       AVG(CASE WHEN position > 0 THEN position END) AS average_position,
+                       COALESCE(SUM(wins), 0) AS wins,
+                       COALESCE(SUM(points), 0) AS points
+                FROM season_standings
+                GROUP BY driver_code
+            ) AS agg
+            WHERE agg.driver_code = drivers.driver_code
+              AND drivers.driver_code IN (SELECT driver_code FROM migrated_drivers)
+        """)
+        cursor.execute("SELECT COUNT(*) FROM migrated_drivers")
+        driver_count = cursor.fetchone()[0]
+        cursor.execute("DROP TABLE migrated_drivers")
+
+        for _, sql in deferred_indexes:
+            cursor.execute(sql)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed else 0.0
+    print(f"✅ Migrated {driver_count} drivers from {seasons} seasons to database "
+          f"({rows} rows in {elapsed:.2f}s, {rate:,.0f} rows/s)")
+    return {"drivers": driver_count, "seasons": seasons, "rows": rows, "seconds": elapsed, "rows_per_second": rate}
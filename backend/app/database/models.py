@@ -20,6 +20,8 @@ def init_database():
             country_code TEXT,
             total_wins INTEGER DEFAULT 0,
             total_points REAL DEFAULT 0,
+            position_sum INTEGER DEFAULT 0,
+            classified_seasons INTEGER DEFAULT 0,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
@@ -34,9 +36,14 @@ def init_database():
         ("country_code", "TEXT"),
         ("total_wins", "INTEGER DEFAULT 0"),
         ("total_points", "REAL DEFAULT 0"),
+        ("position_sum", "INTEGER DEFAULT 0"),
+        ("classified_seasons", "INTEGER DEFAULT 0"),
     ):
         if col not in existing_cols:
             cursor.execute(f"ALTER TABLE drivers ADD COLUMN {col} {definition}")
+    # Career aggregates are maintained incrementally from here on; recompute them
+    # once, with the new running sums, from the standings already stored
+    backfill_career_sums = "classified_seasons" not in existing_cols
     
     # Team history - tracks which team a driver was with each season
     cursor.execute("""
@@ -82,11 +89,129 @@ def init_database():
         )
     """)
     
+    # Driver bios - DOB and nationality per driver code, looked up from Ergast once
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS driver_bios (
+            driver_code TEXT PRIMARY KEY,
+            date_of_birth TEXT,
+            nationality TEXT,
+            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # Scraped rounds - which race weekends each season's standings already include
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scraped_rounds (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            event_name TEXT NOT NULL,
+            scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (season, round)
+        )
+    """)
+    
+    # Per-round results - each driver's race and qualifying classification, kept so
+    # new season stats can be computed in SQL without reloading FastF1 sessions
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS race_results (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            driver_code TEXT NOT NULL,
+            result_order INTEGER NOT NULL,
+            driver_number TEXT,
+            team_name TEXT,
+            position INTEGER,
+            grid_position INTEGER,
+            points REAL,
+            status TEXT,
+            fastest_lap INTEGER DEFAULT 0,
+            PRIMARY KEY (season, round, driver_code),
+            FOREIGN KEY (driver_code) REFERENCES drivers(driver_code)
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS qualifying_results (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            driver_code TEXT NOT NULL,
+            result_order INTEGER NOT NULL,
+            team_name TEXT,
+            position INTEGER,
+            q1 REAL,
+            q2 REAL,
+            q3 REAL,
+            PRIMARY KEY (season, round, driver_code),
+            FOREIGN KEY (driver_code) REFERENCES drivers(driver_code)
+        )
+    """)
+    
+    # Analysis jobs - background seasonal wet analyses queued through the API
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS analysis_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            season INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            result TEXT,
+            error TEXT,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            finished_at TEXT,
+            duration_seconds REAL,
+            events_done INTEGER DEFAULT 0,
+            events_total INTEGER,
+            progress TEXT,
+            owner TEXT,
+            heartbeat_at TEXT
+        )
+    """)
+
+    # Migrate analysis_jobs tables that pre-date progress reporting and worker leases
+    cursor.execute("PRAGMA table_info(analysis_jobs)")
+    existing_job_cols = {row[1] for row in cursor.fetchall()}
+    for col, definition in (
+        ("events_done", "INTEGER DEFAULT 0"),
+        ("events_total", "INTEGER"),
+        ("progress", "TEXT"),
+        ("owner", "TEXT"),
+        ("heartbeat_at", "TEXT"),
+    ):
+        if col not in existing_job_cols:
+            cursor.execute(f"ALTER TABLE analysis_jobs ADD COLUMN {col} {definition}")
+    
     # Create indexes for better query performance
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_history_driver ON team_history(driver_code)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_standings_driver ON season_standings(driver_code)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_standings_season ON season_standings(season)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_highlights_driver ON driver_highlights(driver_code)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_race_results_driver ON race_results(driver_code, season)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_qualifying_results_driver ON qualifying_results(driver_code, season)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status ON analysis_jobs(status)")
+    # At most one queued or running job per season; enqueue relies on this to stay atomic
+    # across API processes. Older tables may hold duplicates, so retire all but the first.
+    cursor.execute("""
+        UPDATE analysis_jobs
+        SET status = 'failed', error = 'Superseded by an earlier job for this season'
+        WHERE status IN ('queued', 'running')
+          AND id NOT IN (
+              SELECT MIN(id) FROM analysis_jobs WHERE status IN ('queued', 'running') GROUP BY season
+          )
+    """)
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_analysis_jobs_active_season
+        ON analysis_jobs(season) WHERE status IN ('queued', 'running')
+    """)
+
+    if backfill_career_sums:
+        cursor.execute("""
+            UPDATE drivers SET
+                position_sum = COALESCE((SELECT SUM(position) FROM season_standings s WHERE s.driver_code = drivers.driver_code AND s.position > 0), 0),
+                classified_seasons = (SELECT COUNT(position) FROM season_standings s WHERE s.driver_code = drivers.driver_code AND s.position > 0),
+                average_position = (SELECT AVG(position) FROM season_standings s WHERE s.driver_code = drivers.driver_code AND s.position > 0),
+                total_seasons = (SELECT COUNT(*) FROM season_standings s WHERE s.driver_code = drivers.driver_code),
+                total_wins = COALESCE((SELECT SUM(wins) FROM season_standings s WHERE s.driver_code = drivers.driver_code), 0),
+                total_points = COALESCE((SELECT SUM(points) FROM season_standings s WHERE s.driver_code = drivers.driver_code), 0)
+        """)
     
     conn.commit()
     conn.close()
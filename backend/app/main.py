@@ -2,9 +2,11 @@ from fastapi import FastAPI
 from app.api import season
 from app.api.routes import drivers
 from app.api.routes import playground
+from app.api.routes import analysis
 from fastapi.middleware.cors import CORSMiddleware
 from app.database.models import init_database
 from app.core.config import settings
+from app.services.analysis_job_service import AnalysisJobService
 
 init_database()
 
@@ -39,3 +41,14 @@ app.include_router(
     prefix="/api",
     tags=["Playground"]
 )
+
+app.include_router(
+    analysis.router,
+    prefix="/api",
+    tags=["Analysis"]
+)
+
+
+@app.on_event("startup")
+def resume_analysis_jobs():
+    AnalysisJobService.resume_unfinished()
@@ -1,31 +1,197 @@
+import argparse
+import hashlib
 import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from services.wet import F1Service 
+from typing import Any, Dict, List, Optional
+
+import services.lap_extracts as lap_extracts
+import services.session_cache as session_cache
+import services.wet as wet
+import services.wet_verdicts as wet_verdicts
+from services.wet import F1Service, ANALYSIS_DIR
+from services.wet_checkpoints import EventCheckpoints, PIPELINE_CACHE_DIR
+
+FINGERPRINT_DIR = PIPELINE_CACHE_DIR / "fingerprints"
+
+# Modules whose code decides what a season's output contains
+FINGERPRINT_MODULES = (wet, session_cache, lap_extracts, wet_verdicts)
+
+def season_fingerprint(year: int, include_practice: bool = True) -> str:
+    """Hash of everything a season's output depends on: the analysis code, the
+    analysis options, and for that year the FastF1 cache contents, the stored wet
+    verdicts and the lap extracts."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "year": year,
+        "include_practice": include_practice,
+        "extract_version": lap_extracts.EXTRACT_VERSION,
+    }).encode())
+    for module in FINGERPRINT_MODULES:
+        digest.update(Path(module.__file__).read_bytes())
+
+    _hash_tree(digest, "ff1_cache", Path(wet.cache_path) / str(year))
+    _hash_tree(digest, "extracts", lap_extracts.DEFAULT_EXTRACT_DIR / str(year))
+    verdicts = wet_verdicts.WetVerdictStore(wet_verdicts.DEFAULT_VERDICT_DB)
+    digest.update(json.dumps(verdicts.season_summaries(year)).encode())
+    return digest.hexdigest()
+
+def _hash_tree(digest, label: str, root: Path) -> None:
+    """Adds every file's relative path, size and mtime under `root` to the digest."""
+    digest.update(f"{label}/".encode())
+    if root.exists():
+        for path in sorted(p for p in root.rglob("*") if p.is_file()):
+            stat = path.stat()
+            digest.update(f"{path.relative_to(root)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+def season_is_current(year: int, fingerprint: str) -> bool:
+    """True if the last recorded run used the same inputs and its output is untouched."""
+    record_file = FINGERPRINT_DIR / f"{year}.json"
+    if not record_file.exists():
+        return False
+    try:
+        with open(record_file) as f:
+            record = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return False
+
+    if record.get("fingerprint") != fingerprint:
+        return False
+    output_sha256 = record.get("output_sha256")
+    if output_sha256 is None:
+        # Last run found no wet data; nothing to compare
+        return True
+    output_file = ANALYSIS_DIR / f"{year}.json"
+    return output_file.exists() and _sha256(output_file) == output_sha256
+
+def _record_fingerprint(year: int, fingerprint: str, output_file: Optional[Path]) -> None:
+    record = {
+        "fingerprint": fingerprint,
+        "output_sha256": _sha256(output_file) if output_file is not None else None,
+    }
+    _write_atomic(FINGERPRINT_DIR / f"{year}.json", json.dumps(record, indent=2))
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write via a temp file in the same directory so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def run_and_save_analysis(year: int, workers: int = 1, resume: bool = False, force: bool = False) -> Dict[str, Any]:
+    """Runs the analysis for a year and saves the output to a JSON file.
+
+    `workers` > 1 analyses the season's events in a process pool. Finished events are
+    checkpointed as they complete; `resume` skips events a previous run already finished.
+    Seasons whose inputs are unchanged since the last run are skipped unless `force`.
+    Returns a summary dict (season, status, seconds, error)."""
+    started = time.perf_counter()
+    summary = {"season": year, "status": None, "seconds": 0.0, "error": None}
+
+    if not force and season_is_current(year, season_fingerprint(year)):
+        print(f"⏭  Skipping {year} — output is current (use --force to re-run)")
+        summary["status"] = "skipped"
+        return summary
 
-def run_and_save_analysis(year: int):
-    """Runs the analysis for a year and saves the output to a JSON file."""
     print(f"Starting analysis for the {year} season...")
-    f1_service = F1Service()
-    
+    f1_service = F1Service(workers=workers)
+    checkpoints = EventCheckpoints(year, include_practice=True)
+
     # The results will be saved here
-    output_dir = Path("analysis_results")
-    output_dir.mkdir(exist_ok=True)
-    output_file = output_dir / f"{year}.json"
+    output_file = ANALYSIS_DIR / f"{year}.json"
 
     try:
-        results = f1_service.calculate_seasonal_wet_performance(year)
+        results = f1_service.calculate_seasonal_wet_performance(
+            year, include_practice=True, checkpoints=checkpoints, resume=resume
+        )
         if results:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            _write_atomic(output_file, json.dumps(results, indent=2))
             print(f"✅ Successfully saved analysis for {year} to {output_file}")
+            summary["status"] = "written"
         else:
             print(f"⚠️ No wet race data found for {year}. No file created.")
+            summary["status"] = "no data"
+        # Fingerprint after the run: loading sessions is what fills the FastF1 cache
+        _record_fingerprint(year, season_fingerprint(year), output_file if results else None)
+        # Season is complete either way; a later run starts fresh
+        checkpoints.clear()
     except Exception as e:
         print(f"❌ An error occurred during analysis for {year}: {e}")
+        print(f"   Finished events are checkpointed in {checkpoints.directory}; rerun with --resume to continue.")
+        summary["status"] = "failed"
+        summary["error"] = str(e)
+
+    summary["seconds"] = time.perf_counter() - started
+    return summary
+
+def run_seasons(years: List[int], jobs: int = 1, workers: int = 1, resume: bool = False, force: bool = False) -> List[Dict[str, Any]]:
+    """Analyse several seasons, `jobs` at a time in separate processes."""
+    if jobs > 1 and len(years) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(years))) as pool:
+            futures = [pool.submit(run_and_save_analysis, year, workers, resume, force) for year in years]
+            summaries = []
+            for year, future in zip(years, futures):
+                try:
+                    summaries.append(future.result())
+                except Exception as e:
+                    # Worker process died; run_and_save_analysis reports ordinary errors itself
+                    summaries.append({"season": year, "status": "failed", "seconds": 0.0, "error": str(e)})
+            return summaries
+
+    return [run_and_save_analysis(year, workers, resume, force) for year in years]
+
+def print_summary(summaries: List[Dict[str, Any]], wall_seconds: float) -> None:
+    print("\n" + "=" * 50)
+    print(f"{'Season':<8}{'Status':<12}{'Time':>10}")
+    print("-" * 50)
+    for s in summaries:
+        print(f"{s['season']:<8}{s['status']:<12}{s['seconds']:>9.1f}s" + (f"  {s['error']}" if s['error'] else ""))
+    print("-" * 50)
+    print(f"{'Total':<20}{wall_seconds:>9.1f}s wall")
+
+def parse_years(spec: str) -> List[int]:
+    """'2021-2023,2025' -> [2021, 2022, 2023, 2025]"""
+    years = []
+    for part in spec.split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = map(int, part.split('-'))
+            years.extend(range(start, end + 1))
+        elif part:
+            years.append(int(part))
+    return sorted(set(years))
 
 if __name__ == '__main__':
-    # Define which seasons you want to pre-calculate
-    seasons_to_analyze = [2023]
-    
-    for season in seasons_to_analyze:
-        run_and_save_analysis(season)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Pre-calculate seasonal wet-vs-dry analysis')
+    parser.add_argument('--year', type=int, help='Analyse a single season')
+    parser.add_argument('--years', type=str, help='Seasons to analyse, e.g. 2018-2023 or 2019,2021-2023')
+    parser.add_argument('--jobs', type=int, default=1, help='Seasons analysed concurrently (one process each)')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes per season for analysing events in parallel')
+    parser.add_argument('--resume', action='store_true', help='Skip events finished by a previous interrupted run')
+    parser.add_argument('--force', action='store_true', help='Re-run seasons whose output is already current')
+    args = parser.parse_args()
+
+    if args.year:
+        seasons_to_analyze = [args.year]
+    elif args.years:
+        try:
+            seasons_to_analyze = parse_years(args.years)
+        except ValueError:
+            print("❌ Invalid format. Use: --years 2018-2023 or --years 2019,2021-2023")
+            sys.exit(1)
+    else:
+        seasons_to_analyze = [2023]
+
+    started = time.perf_counter()
+    summaries = run_seasons(seasons_to_analyze, jobs=args.jobs, workers=args.workers, resume=args.resume, force=args.force)
+    print_summary(summaries, time.perf_counter() - started)
+
+    if any(s['status'] == 'failed' for s in summaries):
+        sys.exit(1)
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class AnalysisJob(BaseModel):
+    id: int
+    season: int
+    status: str
+    result: Optional[str] = None
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    events_done: int = 0
+    events_total: Optional[int] = None
@@ -0,0 +1,120 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+
+# Upper bound on combos per batch request; the full 2024 grid is 24 x 10 x 4 = 960
+MAX_BATCH_COMBOS = 5000
+MAX_LEADERBOARD_LIMIT = 100
+
+# Monte Carlo draws for /lap?uncertainty=true. Each draw is a distinct stored bootstrap
+# replicate, so the limit is derive_playground_coefficients' DEFAULT_BOOTSTRAP_REPLICATES;
+# a bundle derived with fewer rejects larger requests
+DEFAULT_UNCERTAINTY_SAMPLES = 1000
+MAX_UNCERTAINTY_SAMPLES = 1000
+
+Slot = Literal["driver", "chassis", "engine"]
+
+class LapCombo(BaseModel):
+    driver: str = Field(..., description="3-letter driver code, e.g. LEC")
+    chassis: str = Field(..., description="Team chassis slug, e.g. redbull")
+    engine: str = Field(..., description="3-letter engine code, e.g. MER")
+
+class LapBatchRequest(BaseModel):
+    combos: List[LapCombo] = Field(..., min_length=1, max_length=MAX_BATCH_COMBOS)
+
+class LapUncertainty(BaseModel):
+    method: Optional[str] = None
+    replicates: int = Field(..., description="Bootstrap replicates stored in the bundle")
+    samples: int = Field(..., description="Replicates evaluated, each once; equals `replicates` when every one was used")
+    total_time_seconds: Dict[str, float] = Field(..., description="Percentile bands keyed p5 ... p95")
+    sectors: List[Dict[str, float]]
+
+class LapEstimate(BaseModel):
+    total_time_seconds: float
+    sectors: List[float]
+    components: Dict[str, Any]
+    comparisons: Dict[str, Optional[float]]
+    methodology_version: Optional[str] = None
+    uncertainty: Optional[LapUncertainty] = None
+
+class LapBatchResult(BaseModel):
+    driver: str
+    chassis: str
+    engine: str
+    total_time_seconds: float
+    sectors: List[float]
+    baseline_delta: float
+
+class LapBatchResponse(BaseModel):
+    results: List[LapBatchResult]
+    baseline_seconds: float
+    reference_pole_time_seconds: Optional[float] = None
+    methodology_version: Optional[str] = None
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    driver: str
+    chassis: str
+    engine: str
+    total_time_seconds: float
+    sectors: List[float]
+
+class LeaderboardResponse(BaseModel):
+    combos: int
+    entries: List[LeaderboardEntry]
+
+class LapPercentile(BaseModel):
+    driver: str
+    chassis: str
+    engine: str
+    total_time_seconds: float
+    rank: int
+    combos: int
+    faster_than_percent: float
+
+class BestPartner(BaseModel):
+    driver: str
+    chassis: str
+    engine: str
+    total_time_seconds: float
+
+class BestPartnersResponse(BaseModel):
+    slot: Slot
+    partners: List[BestPartner]
+
+class ChallengeResult(BaseModel):
+    driver: str
+    chassis: str
+    engine: str
+    total_time_seconds: float
+    gap_seconds: float
+    respects_locks: bool
+    passed: bool
+
+class ChallengeEvaluation(BaseModel):
+    challenge_id: str
+    year: int
+    track: str
+    pass_criterion: str
+    target_lap_time_seconds: float
+    match_tolerance_seconds: Optional[float] = None
+    passed_count: int
+    results: List[ChallengeResult]
+
+class ChallengeSolution(BaseModel):
+    driver: str
+    chassis: str
+    engine: str
+    total_time_seconds: float
+    gap_seconds: float
+
+class ChallengeSolutions(BaseModel):
+    challenge_id: str
+    year: int
+    track: str
+    pass_criterion: str
+    target_lap_time_seconds: float
+    match_tolerance_seconds: Optional[float] = None
+    combos_considered: int
+    solution_count: int
+    optimal: Optional[ChallengeSolution] = None
+    solutions: List[ChallengeSolution]
@@ -0,0 +1,101 @@
+"""Time and memory saved per season by the scraper's minimal session load profiles.
+
+For every round of a season, loads the race and qualifying sessions twice: once with
+a bare `session.load()` (the scraper's old behaviour: laps, telemetry, weather and
+messages) and once with scraper_utils.RACE_LOAD_PROFILE / QUALI_LOAD_PROFILE. Reports
+wall time and the memory each loaded session retains (tracemalloc). Run it once first,
+or pass --warm, so both sides read from a warm FastF1 cache instead of timing downloads.
+Offline tooling; the FastAPI app never imports it.
+
+    cd backend/app/scripts
+    python bench_load_profiles.py --year 2024 --warm
+    python bench_load_profiles.py --year 2024 --rounds 5
+    python bench_load_profiles.py --synthetic --rounds 24
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parents[1]            # backend/app
+sys.path.insert(0, str(APP_DIR))
+
+import scraper_utils  # noqa: E402
+from scraper_utils import RACE_LOAD_PROFILE, QUALI_LOAD_PROFILE  # noqa: E402
+from synthetic_fastf1 import SyntheticFastF1, SyntheticSeasonConfig, use_synthetic_fastf1  # noqa: E402
+
+FULL_LOAD_PROFILE = {}                                   # session.load() defaults
+
+
+def measure_load(year: int, round_num: int, identifier: str, profile: dict):
+    """(seconds, retained bytes) for one get_session + load with `profile`."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    session = scraper_utils.fastf1.get_session(year, round_num, identifier)
+    session.load(**profile)
+    seconds = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del session
+    return seconds, retained
+
+
+def compare_season(year: int, rounds: int, warm: bool):
+    schedule = scraper_utils.fastf1.get_event_schedule(year)
+    races = schedule[schedule['EventFormat'] != 'testing']
+    round_numbers = list(races['RoundNumber'])[:rounds] if rounds else list(races['RoundNumber'])
+
+    if warm:
+        print(f"Warming the FastF1 cache for {len(round_numbers)} rounds...")
+        for round_num in round_numbers:
+            for identifier in ('R', 'Q'):
+                scraper_utils.fastf1.get_session(year, round_num, identifier).load()
+
+    totals = {'full': [0.0, 0], 'minimal': [0.0, 0]}
+    print(f"\n{'Round':<7}{'Session':<9}{'Full s':>9}{'Min s':>9}{'Full MB':>10}{'Min MB':>9}")
+    for round_num in round_numbers:
+        for identifier, minimal in (('R', RACE_LOAD_PROFILE), ('Q', QUALI_LOAD_PROFILE)):
+            full_s, full_b = measure_load(year, round_num, identifier, FULL_LOAD_PROFILE)
+            min_s, min_b = measure_load(year, round_num, identifier, minimal)
+            totals['full'][0] += full_s
+            totals['full'][1] += full_b
+            totals['minimal'][0] += min_s
+            totals['minimal'][1] += min_b
+            print(f"{round_num:<7}{identifier:<9}{full_s:>9.2f}{min_s:>9.2f}{full_b / 1e6:>10.1f}{min_b / 1e6:>9.1f}")
+
+    (full_s, full_b), (min_s, min_b) = totals['full'], totals['minimal']
+    print(f"\nSeason {year}, {len(round_numbers)} rounds:")
+    print(f"  load time : {full_s:8.1f} s -> {min_s:8.1f} s  (saved {full_s - min_s:.1f} s, {_pct(full_s - min_s, full_s)})")
+    print(f"  memory    : {full_b / 1e6:8.1f} MB -> {min_b / 1e6:8.1f} MB  (saved {(full_b - min_b) / 1e6:.1f} MB, {_pct(full_b - min_b, full_b)})")
+
+
+def _pct(part: float, whole: float) -> str:
+    return f"{100 * part / whole:.0f}%" if whole else "n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full and minimal session loads for the scraper")
+    parser.add_argument("--year", type=int, default=2024, help="Season to measure")
+    parser.add_argument("--rounds", type=int, default=0, help="Only the first N rounds (default: all)")
+    parser.add_argument("--warm", action="store_true", help="Load every session fully once before timing")
+    parser.add_argument("--synthetic", action="store_true", help="Use the synthetic FastF1 stand-in (no network)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("fastf1").setLevel(logging.WARNING)
+
+    if args.synthetic:
+        provider = SyntheticFastF1(SyntheticSeasonConfig(rounds=args.rounds or 24))
+        with use_synthetic_fastf1(provider, scraper_utils):
+            compare_season(args.year, args.rounds, args.warm)
+    else:
+        compare_season(args.year, args.rounds, args.warm)
+
+
+if __name__ == "__main__":
+    main()
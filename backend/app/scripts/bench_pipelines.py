@@ -0,0 +1,121 @@
+"""Benchmark / profile the FastF1 pipelines offline against a synthetic season.
+
+Runs the wet analysis (services/wet.py), the season scraper (scripts/scraper_utils.py)
+and the Playground coefficient derivation (scripts/derive_playground_coefficients.py)
+against synthetic_fastf1 instead of FastF1, so timings are repeatable and need no network.
+Every database, verdict store and extract it touches lives in a temporary directory; the
+real f1_drivers.db, pipeline_cache/ and data/ are never written. The FastAPI app never
+imports it.
+
+    cd backend/app/scripts
+    python bench_pipelines.py
+    python bench_pipelines.py --rounds 24 --drivers 20 --laps 30 --load-delay 0.05
+    python bench_pipelines.py --only wet --profile
+    python bench_pipelines.py --only derive --bootstrap 1000
+"""
+
+import argparse
+import cProfile
+import contextlib
+import functools
+import io
+import logging
+import pstats
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parents[1]            # backend/app
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(APP_DIR))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import services.session_cache as session_cache  # noqa: E402
+import services.wet as wet  # noqa: E402
+from services.wet_verdicts import WetVerdictStore  # noqa: E402
+import scraper_utils  # noqa: E402
+import scrape_f1_data  # noqa: E402
+import derive_playground_coefficients as derive  # noqa: E402
+from synthetic_fastf1 import SyntheticFastF1, SyntheticSeasonConfig, use_synthetic_fastf1  # noqa: E402
+
+PIPELINES = ("wet", "scrape", "derive")
+
+
+def run_wet(year: int, workdir: Path) -> None:
+    service = wet.F1Service(
+        workers=1,
+        verdict_db=workdir / "verdicts.sqlite",
+        extract_dir=workdir / "extracts",
+    )
+    service.calculate_seasonal_wet_performance(year, include_practice=True)
+
+
+def run_scrape(year: int, workdir: Path) -> None:
+    db_path = workdir / "f1_drivers.db"
+    scraper_utils.DB_PATH = db_path
+    scrape_f1_data.DB_PATH = db_path
+    scrape_f1_data.ensure_database_exists()
+    scraper_utils.scrape_season(year, force=True)
+
+
+def run_derive(year: int, workdir: Path, bootstrap: int = 0) -> None:
+    derive.WetVerdictStore = functools.partial(WetVerdictStore, workdir / "derive_verdicts.sqlite")
+    # dry_run prints the coefficients JSON; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        derive.derive(year, force=True, dry_run=True, bootstrap=bootstrap)
+
+
+RUNNERS = {"wet": run_wet, "scrape": run_scrape, "derive": run_derive}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the FastF1 pipelines on synthetic data")
+    parser.add_argument("--year", type=int, default=2024, help="Season label for the synthetic data")
+    parser.add_argument("--rounds", type=int, default=24, help="Events in the season")
+    parser.add_argument("--drivers", type=int, default=20, help="Drivers on the grid")
+    parser.add_argument("--laps", type=int, default=25, help="Laps per driver in practice/qualifying")
+    parser.add_argument("--race-laps", type=int, default=57, help="Laps per driver in the race")
+    parser.add_argument("--wet", type=float, default=0.08, help="Probability a session is wet")
+    parser.add_argument("--load-delay", type=float, default=0.0, help="Seconds each session.load() sleeps, to model deserialization")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic season")
+    parser.add_argument("--only", choices=PIPELINES, action="append", help="Pipeline(s) to run (default: all)")
+    parser.add_argument("--profile", action="store_true", help="Print the top cProfile entries for each pipeline")
+    parser.add_argument("--bootstrap", type=int, default=0,
+                        help="Bootstrap replicates in the derive pipeline (its script defaults to "
+                             f"{derive.DEFAULT_BOOTSTRAP_REPLICATES}; 0 times the point fit alone)")
+    args = parser.parse_args()
+    runners = dict(RUNNERS, derive=functools.partial(run_derive, bootstrap=args.bootstrap))
+
+    logging.getLogger().setLevel(logging.ERROR)
+    for name in ("scraper_utils", "derive_playground_coefficients", "fastf1"):
+        logging.getLogger(name).setLevel(logging.ERROR)
+
+    config = SyntheticSeasonConfig(
+        rounds=args.rounds, drivers=args.drivers, laps_per_session=args.laps,
+        race_laps=args.race_laps, wet_session_probability=args.wet,
+        load_delay_s=args.load_delay, seed=args.seed,
+    )
+    print(f"Synthetic {args.year}: {args.rounds} rounds x {args.drivers} drivers, "
+          f"{args.laps} laps/session, {args.race_laps} race laps, wet p={args.wet}, load delay {args.load_delay}s")
+
+    for name in args.only or PIPELINES:
+        provider = SyntheticFastF1(config)
+        with tempfile.TemporaryDirectory() as tmp, \
+                use_synthetic_fastf1(provider, wet, session_cache, scraper_utils, derive):
+            profiler = cProfile.Profile() if args.profile else None
+            started = time.perf_counter()
+            if profiler:
+                profiler.enable()
+            runners[name](args.year, Path(tmp))
+            if profiler:
+                profiler.disable()
+            elapsed = time.perf_counter() - started
+
+        print(f"  {name:<7}: {elapsed:8.2f} s  ({len(provider.loads)} session loads)")
+        if profiler:
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark for the season aggregation step of the scraper.
+
+Compares the original per-row loop (results.iterrows() with one dict update per cell,
+then a per-round merge) with the single-groupby scraper_utils.aggregate_season on
+synthetic multi-season race results, and checks both produce the same driver stats.
+Drivers miss rounds and switch teams mid-season so the first/latest rules are exercised.
+Offline and network-free; the FastAPI app never imports it.
+
+    cd backend/app/scripts
+    python bench_scrape_aggregation.py
+    python bench_scrape_aggregation.py --seasons 10 --rounds 24 --drivers 22 --repeat 5
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+APP_DIR = Path(__file__).resolve().parents[1]            # backend/app
+sys.path.insert(0, str(APP_DIR))
+
+from scraper_utils import RESULT_FRAME_COLUMNS, aggregate_season  # noqa: E402
+from synthetic_fastf1 import SyntheticFastF1, SyntheticSeasonConfig, TEAMS  # noqa: E402
+
+
+def make_season_partials(provider: SyntheticFastF1, year: int, rng: np.random.Generator):
+    """scrape_round-shaped partials for every round of a synthetic season."""
+    partials = []
+    for round_num in range(1, provider.config.rounds + 1):
+        session = provider.get_session(year, round_num, "R")
+        session.load(laps=False, telemetry=False, weather=False, messages=False)
+        results = session.results.copy()
+
+        # Some drivers sit rounds out (late debuts, stand-ins) and some change teams
+        results = results[rng.random(len(results)) > 0.1].reset_index(drop=True)
+        swap = rng.random(len(results)) < 0.05
+        results.loc[swap, "TeamName"] = rng.choice(TEAMS, swap.sum())
+
+        frame = results.reindex(columns=list(RESULT_FRAME_COLUMNS))
+        fastest_driver = frame["Abbreviation"].iloc[int(rng.integers(len(frame)))]
+        pole_driver = provider.drivers(year)[int(rng.integers(len(provider.drivers(year))))]["code"]
+        frame["round"] = round_num
+        frame["result_order"] = range(1, len(frame) + 1)
+        frame["fastest_lap"] = frame["Abbreviation"].eq(fastest_driver)
+        partials.append({
+            "round": round_num,
+            "results": frame,
+            "pole_driver": pole_driver,
+            "fastest_driver": fastest_driver,
+        })
+    return partials
+
+
+def legacy_aggregate_season(partials, driver_bio):
+    """The pre-vectorisation per-row reduction and per-round merge from scrape_season."""
+    driver_stats = {}
+    for partial in partials:
+        for _, driver_result in partial["results"].iterrows():
+            driver_code = driver_result["Abbreviation"]
+            if driver_code not in driver_stats:
+                country_code = driver_result.get("CountryCode")
+                bio = driver_bio.get(driver_code, {})
+                driver_stats[driver_code] = {
+                    "full_name": driver_result["FullName"],
+                    "team_name": driver_result["TeamName"],
+                    "current_team": driver_result["TeamName"],
+                    "driver_number": driver_result.get("DriverNumber"),
+                    "date_of_birth": bio.get("date_of_birth"),
+                    "nationality": bio.get("nationality"),
+                    "country_code": country_code if pd.notna(country_code) else None,
+                    "points": 0, "wins": 0, "podiums": 0, "pole_positions": 0,
+                    "fastest_laps": 0, "dnfs": 0, "races": 0,
+                }
+            stats = driver_stats[driver_code]
+            stats["races"] += 1
+            stats["current_team"] = driver_result["TeamName"]
+            points = driver_result.get("Points", 0)
+            if pd.notna(points):
+                stats["points"] += float(points)
+            position = driver_result.get("Position")
+            if pd.notna(position) and position == 1.0:
+                stats["wins"] += 1
+            if pd.notna(position) and position <= 3.0:
+                stats["podiums"] += 1
+            status = driver_result.get("Status", "")
+            if not pd.isna(status) and status != "Finished" and "+" not in str(status):
+                if pd.isna(position) or position > 20:
+                    stats["dnfs"] += 1
+            stats["team_name"] = driver_result["TeamName"]
+
+        if partial["pole_driver"] in driver_stats:
+            driver_stats[partial["pole_driver"]]["pole_positions"] += 1
+        if partial["fastest_driver"] in driver_stats:
+            driver_stats[partial["fastest_driver"]]["fastest_laps"] += 1
+    return driver_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper's season aggregation")
+    parser.add_argument("--seasons", type=int, default=5, help="Synthetic seasons")
+    parser.add_argument("--rounds", type=int, default=24, help="Rounds per season")
+    parser.add_argument("--drivers", type=int, default=22, help="Drivers on the grid")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed iterations per implementation")
+    args = parser.parse_args()
+
+    provider = SyntheticFastF1(SyntheticSeasonConfig(rounds=args.rounds, drivers=args.drivers, dnf_probability=0.12))
+    rng = np.random.default_rng(0)
+    seasons = [make_season_partials(provider, 2000 + i, rng) for i in range(args.seasons)]
+    bios = [{d["code"]: {"date_of_birth": d["date_of_birth"], "nationality": d["nationality"]}
+             for d in provider.drivers(2000 + i)} for i in range(args.seasons)]
+
+    for partials, bio in zip(seasons, bios):
+        legacy = legacy_aggregate_season(partials, bio)
+        vectorized = aggregate_season(partials, bio)
+        if list(legacy.items()) != list(vectorized.items()):
+            print("❌ Vectorized season totals differ from the per-row loop")
+            sys.exit(1)
+
+    def run(aggregate):
+        for partials, bio in zip(seasons, bios):
+            aggregate(partials, bio)
+
+    legacy_s = timeit.timeit(lambda: run(legacy_aggregate_season), number=args.repeat) / args.repeat
+    vectorized_s = timeit.timeit(lambda: run(aggregate_season), number=args.repeat) / args.repeat
+
+    rows = sum(len(p["results"]) for partials in seasons for p in partials)
+    print(f"{args.seasons} seasons x {args.rounds} rounds ({rows} result rows), {args.repeat} iterations")
+    print(f"  iterrows loop : {legacy_s * 1e3:8.1f} ms")
+    print(f"  groupby       : {vectorized_s * 1e3:8.1f} ms")
+    print(f"  speedup       : {legacy_s / vectorized_s:8.1f}x  (results identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Micro-benchmark for the per-driver wet/dry pace step of the wet analysis.
+
+Compares the original per-driver loop (pick_driver + median + Compound.mode() for every
+driver) with the single-groupby services.wet.compare_driver_pace on a synthetic session,
+and checks both produce the same numbers. Offline and network-free; the FastAPI app
+never imports it.
+
+    cd backend/app/scripts
+    python bench_wet_pace.py
+    python bench_wet_pace.py --drivers 20 --laps 60 --repeat 200
+"""
+
+import argparse
+import sys
+import timeit
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from fastf1.core import Laps
+
+APP_DIR = Path(__file__).resolve().parents[1]            # backend/app
+sys.path.insert(0, str(APP_DIR))
+from services.wet import compare_driver_pace  # noqa: E402
+
+
+def make_session_laps(drivers: int, laps: int, wet: bool, seed: int) -> Laps:
+    """One session's quick laps: `drivers` x `laps` rows with Driver, LapTime and Compound."""
+    rng = np.random.default_rng(seed)
+    codes = [f"D{i:02d}" for i in range(drivers)]
+    base = 90.0 + (8.0 if wet else 0.0)
+    compounds = ["INTERMEDIATE", "WET"] if wet else ["SOFT", "MEDIUM"]
+
+    frame = pd.DataFrame({
+        "Driver": np.repeat(codes, laps),
+        "LapTime": pd.to_timedelta(base + rng.normal(0.0, 0.8, drivers * laps), unit="s"),
+        "Compound": rng.choice(compounds, drivers * laps),
+    })
+    return Laps(frame)
+
+
+def legacy_driver_pace(dry_laps: Laps, wet_laps: Laps):
+    """The pre-vectorisation loop from F1Service.analyze_event, reduced to its outputs."""
+    rows = []
+    for driver in wet_laps["Driver"].unique():
+        driver_dry_laps = dry_laps.pick_driver(driver)
+        if driver_dry_laps.empty:
+            continue
+        dry_pace = driver_dry_laps["LapTime"].dt.total_seconds().median()
+        driver_wet_laps = wet_laps.pick_driver(driver)
+        wet_pace = driver_wet_laps["LapTime"].dt.total_seconds().median()
+        delta = ((wet_pace - dry_pace) / dry_pace) * 100
+        compound = driver_wet_laps["Compound"].mode()[0] if not driver_wet_laps.empty else "N/A"
+        rows.append((driver, dry_pace, len(driver_dry_laps), wet_pace, len(driver_wet_laps), compound, delta))
+    return rows
+
+
+def vectorized_driver_pace(dry_laps: Laps, wet_laps: Laps):
+    pace = compare_driver_pace(dry_laps, wet_laps)
+    return list(zip(
+        pace.index, pace["dry_pace"], pace["dry_laps"], pace["wet_pace"],
+        pace["wet_laps"], pace["compound"], pace["delta"],
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-driver wet/dry pace aggregation")
+    parser.add_argument("--drivers", type=int, default=20, help="Drivers in the session")
+    parser.add_argument("--laps", type=int, default=60, help="Quick laps per driver per session")
+    parser.add_argument("--repeat", type=int, default=100, help="Timed iterations per implementation")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", FutureWarning)  # pick_driver is deprecated upstream
+
+    dry_laps = make_session_laps(args.drivers, args.laps, wet=False, seed=1)
+    wet_laps = make_session_laps(args.drivers, args.laps, wet=True, seed=2)
+
+    legacy = legacy_driver_pace(dry_laps, wet_laps)
+    vectorized = vectorized_driver_pace(dry_laps, wet_laps)
+    if legacy != vectorized:
+        print("❌ Vectorized results differ from the per-driver loop")
+        sys.exit(1)
+
+    legacy_s = timeit.timeit(lambda: legacy_driver_pace(dry_laps, wet_laps), number=args.repeat) / args.repeat
+    vectorized_s = timeit.timeit(lambda: vectorized_driver_pace(dry_laps, wet_laps), number=args.repeat) / args.repeat
+
+    print(f"Session: {args.drivers} drivers x {args.laps} laps (dry + wet), {args.repeat} iterations")
+    print(f"  per-driver loop : {legacy_s * 1e3:8.2f} ms")
+    print(f"  groupby         : {vectorized_s * 1e3:8.2f} ms")
+    print(f"  speedup         : {legacy_s / vectorized_s:8.1f}x  (results identical)")
+
+
+if __name__ == "__main__":
+    main()
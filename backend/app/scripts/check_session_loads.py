@@ -0,0 +1,80 @@
+"""Check that the wet analysis deserializes no session twice.
+
+Runs services/wet.py over a synthetic season (synthetic_fastf1) with the weather
+prefilter on and counts, from the provider's record of every session.load() and every
+weather-only api read, how often each session was loaded and how often its weather was
+read. Each may happen at most once per session: the prefilter reads weather alone and
+only sessions whose laps are needed are loaded. Exits non-zero and lists the offending
+sessions otherwise. The FastAPI app never imports it.
+
+    cd backend/app/scripts
+    python check_session_loads.py
+    python check_session_loads.py --rounds 24 --wet 0.3
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parents[1]            # backend/app
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(APP_DIR))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import services.session_cache as session_cache  # noqa: E402
+import services.wet as wet  # noqa: E402
+from synthetic_fastf1 import SyntheticFastF1, SyntheticSeasonConfig, use_synthetic_fastf1  # noqa: E402
+
+
+def count_reads(provider: SyntheticFastF1) -> Counter:
+    """(year, round, session, what) -> times the session was loaded ("load") or its weather read ("weather")."""
+    counts = Counter()
+    for year, round_number, identifier, laps, weather in provider.loads:
+        counts[(year, round_number, identifier, "load")] += 1
+        if weather:
+            counts[(year, round_number, identifier, "weather")] += 1
+    for year, round_number, identifier in provider.weather_reads:
+        counts[(year, round_number, identifier, "weather")] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count session loads in the wet analysis")
+    parser.add_argument("--year", type=int, default=2024, help="Season label for the synthetic data")
+    parser.add_argument("--rounds", type=int, default=12, help="Events in the season")
+    parser.add_argument("--wet", type=float, default=0.25, help="Probability a session is wet")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic season")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.ERROR)
+
+    config = SyntheticSeasonConfig(rounds=args.rounds, wet_session_probability=args.wet, seed=args.seed)
+    provider = SyntheticFastF1(config)
+    with tempfile.TemporaryDirectory() as tmp, use_synthetic_fastf1(provider, wet, session_cache):
+        service = wet.F1Service(
+            workers=1,
+            weather_prefilter=True,
+            verdict_db=Path(tmp) / "verdicts.sqlite",
+            extract_dir=Path(tmp) / "extracts",
+        )
+        service.calculate_seasonal_wet_performance(args.year, include_practice=True)
+
+    counts = count_reads(provider)
+    repeated = {key: n for key, n in counts.items() if n > 1}
+    sessions = {key[:3] for key in counts}
+    print(f"{len(sessions)} sessions seen: {len(provider.weather_reads)} weather-only reads, "
+          f"{len(provider.loads)} session loads")
+
+    if repeated:
+        for (year, round_number, identifier, what), n in sorted(repeated.items()):
+            label = "loaded" if what == "load" else "weather read"
+            print(f"  ❌ {year} round {round_number} {identifier}: {label} {n} times")
+        sys.exit(1)
+    print("✅ No session was deserialized twice")
+
+
+if __name__ == "__main__":
+    main()
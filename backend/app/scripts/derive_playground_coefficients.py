@@ -1,6 +1,6 @@
 """Offline derivation of Playground lap-time coefficients from FastF1 qualifying data.
 
-Produces backend/app/analysis_results/playground_{year}.json — a transparent additive
+Produces backend/app/analysis_results/playground_{year}_bahrain.json — a transparent additive
 model (baseline + driver + chassis + engine deltas) for the Bahrain lap-time estimator.
 See playground-math-spec.md for the full methodology. This is offline tooling; the
 FastAPI app never imports it.
@@ -9,6 +9,7 @@ FastAPI app never imports it.
     python derive_playground_coefficients.py --year 2024
     python derive_playground_coefficients.py --year 2024 --force
     python derive_playground_coefficients.py --year 2024 --dry-run
+    python derive_playground_coefficients.py --year 2024 --force --bootstrap 500
 """
 
 import argparse
@@ -18,6 +19,7 @@ import sys
 from datetime import datetime, timezone
 from itertools import combinations
 from pathlib import Path
+from typing import Optional
 
 import fastf1
 import numpy as np
@@ -34,11 +36,16 @@ CACHE_DIR = REPO_ROOT / "ff1_cache"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 fastf1.Cache.enable_cache(CACHE_DIR)
 
+sys.path.insert(0, str(APP_DIR))
+from services.wet_verdicts import WetVerdictStore, summarize_rainfall  # noqa: E402
+
 METHOD_VERSION = "1.0"
 BAHRAIN_ROUND = 1                       # 2024 season opener
+TRACK = "bahrain"                       # bundle file suffix and metadata.track
 OUTLIER_THRESHOLD_S = 3.0               # spec §4.2.4
 SEGMENTS = ["q3", "q2", "q1"]           # latest-first, for shared-segment matching
 RENAULT_ENGINE_DELTA = 0.15             # spec §4.4.2, hand-assigned (retuned from 0.10 — see notes)
+DEFAULT_BOOTSTRAP_REPLICATES = 1000     # session-resampled refits stored for the API's uncertainty bands
 
 # Per-component sector weights (spec §3.2). Each column sums to 1.0.
 SECTOR_WEIGHTS = {
@@ -128,13 +135,16 @@ def load_qualifying_sessions(year: int):
 
     rows = []
     driver_info = {}
+    verdicts = WetVerdictStore()
 
     for _, event in races.iterrows():
         event_name = event["EventName"]
         round_num = int(event["RoundNumber"])
         try:
             session = fastf1.get_session(year, round_num, "Q")
-            session.load(laps=False, telemetry=False, weather=True, messages=False)
+            # Weather is only needed for the wet check; skip it once the verdict is stored.
+            known = verdicts.get(year, event_name, "Q") is not None
+            session.load(laps=False, telemetry=False, weather=not known, messages=False)
         except Exception as e:
             logger.warning(f"  Could not load qualifying for {event_name}: {e}")
             continue
@@ -144,7 +154,7 @@ def load_qualifying_sessions(year: int):
             logger.warning(f"  No qualifying results for {event_name}")
             continue
 
-        is_wet = _session_is_wet(session, event_name)
+        is_wet = _session_is_wet(session, event_name, verdicts, year)
         if is_wet:
             logger.info(f"  {event_name}: wet/mixed qualifying — excluded from derivation")
 
@@ -171,20 +181,26 @@ def load_qualifying_sessions(year: int):
     return df, driver_info
 
 
-def _session_is_wet(session, event_name: str) -> bool:
+def _session_is_wet(session, event_name: str, verdicts: Optional[WetVerdictStore] = None, year: Optional[int] = None) -> bool:
     """True if the session was wet/mixed.
 
     The hand-curated list is authoritative (spec §4.2.4 explicitly sanctions it and names
     Brazil as the notable wet 2024 quali). FastF1's `Rainfall` series proved unreliable here
     — a bare `.any()` false-flagged 5 dry 2024 qualis, and even a majority threshold flags
     Hungary, whose qualifying was dry. So weather is advisory only: we log a disagreement but
-    do not let it drive exclusions. (v1 is 2024-only per spec §2; extend the list for new years.)"""
+    do not let it drive exclusions. (v1 is 2024-only per spec §2; extend the list for new years.)
+
+    With a `verdicts` store the rain summary is shared with the wet pipeline (services/wet.py)
+    and read back on reruns instead of from the session's weather data."""
     if event_name in WET_QUALI_FALLBACK:
         return True
     try:
-        weather = session.weather_data
-        rain = weather.get("Rainfall") if weather is not None else None
-        if rain is not None and not rain.empty and float(rain.astype(bool).mean()) > 0.5:
+        rain = verdicts.get(year, event_name, "Q") if verdicts is not None else None
+        if rain is None:
+            rain = summarize_rainfall(session.weather_data)
+            if verdicts is not None:
+                verdicts.put(year, event_name, "Q", rain)
+        if rain.rain_fraction is not None and rain.rain_fraction > 0.5:
             logger.warning(f"  {event_name}: FastF1 weather suggests wet, but it's not in the "
                            f"curated wet list — included. Verify if a new season.")
     except Exception:
@@ -402,9 +418,72 @@ def compute_baseline_and_sectors(year: int):
     return baseline, proportions, reference_pole
 
 
+def _fit_components(df: pd.DataFrame, baseline: float, driver_team):
+    """Driver, chassis (by team) and engine deltas from a cleaned qualifying frame."""
+    observations, sessions_count = compute_teammate_observations(df)
+    driver_deltas = solve_driver_deltas(observations, baseline, driver_team)
+    car_pace = compute_team_car_pace(df, driver_deltas, baseline)
+    chassis, engines = isolate_chassis_engine(car_pace)
+    return driver_deltas, sessions_count, car_pace, chassis, engines
+
+
+def bootstrap_residuals(df: pd.DataFrame, baseline: float, driver_team, driver_deltas, chassis, engines,
+                        replicates: int, seed: int = 0):
+    """Cluster bootstrap of the whole fit over qualifying sessions.
+
+    Each replicate resamples sessions with replacement (a session drawn twice counts
+    as two sessions) and refits drivers, car pace and the chassis/engine split. A
+    residual is replicate delta minus point delta, kept per replicate so the API can
+    draw all three components from the same replicate and keep their correlation
+    (a driver's delta and the car's delta trade off within a team). A component
+    missing from a replicate (its sessions were never drawn) gets None rather than 0,
+    and so does the hand-assigned Renault engine, which the data never estimates; the
+    API fills those gaps with spread instead of treating them as certain.
+
+    Returns {"drivers": {code: [...]}, "chassis": {team: [...]}, "engines": {code: [...]}}.
+    """
+    rng = np.random.default_rng(seed)
+    sessions = [df_race for _, df_race in df.groupby("race")]
+    residuals = {
+        "drivers": {code: [] for code in driver_deltas},
+        "chassis": {team: [] for team in chassis},
+        "engines": {code: [] for code in engines},
+    }
+
+    # The refits log per call; keep the bootstrap quiet apart from progress
+    previous_level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        for b in range(replicates):
+            drawn = rng.integers(len(sessions), size=len(sessions))
+            resampled = pd.concat(
+                [sessions[i].assign(race=f"{sessions[i]['race'].iloc[0]}#{k}") for k, i in enumerate(drawn)],
+                ignore_index=True,
+            )
+            rep_drivers, _, _, rep_chassis, rep_engines = _fit_components(resampled, baseline, driver_team)
+            for kind, point, replicate in (
+                ("drivers", driver_deltas, rep_drivers),
+                ("chassis", chassis, rep_chassis),
+                ("engines", engines, rep_engines),
+            ):
+                for key, value in point.items():
+                    if key not in replicate or (kind == "engines" and key == "REN"):
+                        residuals[kind][key].append(None)
+                    else:
+                        residuals[kind][key].append(round(replicate[key] - value, 5))
+            if (b + 1) % 50 == 0:
+                print(f"  bootstrap {b + 1}/{replicates}")
+    finally:
+        logger.setLevel(previous_level)
+
+    return residuals
+
+
 def assemble_coefficients(year, baseline, proportions, reference_pole,
-                          driver_deltas, sessions_count, chassis, engines, driver_info):
-    """Build the dict matching the spec §8 JSON schema."""
+                          driver_deltas, sessions_count, chassis, engines, driver_info,
+                          residuals=None, bootstrap_seed=0):
+    """Build the dict matching the spec §8 JSON schema, plus an "uncertainty" section
+    holding the bootstrap residuals when `residuals` is given."""
     drivers_out = {}
     for code, delta in sorted(driver_deltas.items()):
         info = driver_info.get(code, {})
@@ -452,9 +531,9 @@ def assemble_coefficients(year, baseline, proportions, reference_pole,
         "2024. Sector weights are editorial."
     )
 
-    return {
+    bundle = {
         "metadata": {
-            "track": "bahrain",
+            "track": TRACK,
             "season": year,
             "derived_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "method_version": METHOD_VERSION,
@@ -471,6 +550,22 @@ def assemble_coefficients(year, baseline, proportions, reference_pole,
         "engines": engines_out,
     }
 
+    if residuals is not None:
+        # Keyed like the sections above: chassis by slug, only the ids that made it in
+        bundle["uncertainty"] = {
+            "method": "session_cluster_bootstrap",
+            "replicates": len(next(iter(residuals["drivers"].values()), [])),
+            "seed": bootstrap_seed,
+            "drivers": {code: residuals["drivers"][code] for code in drivers_out},
+            "chassis": {
+                TEAM_SLUG_BY_FASTF1_NAME[team]: r for team, r in residuals["chassis"].items()
+                if TEAM_SLUG_BY_FASTF1_NAME.get(team) in chassis_out
+            },
+            "engines": {code: residuals["engines"][code] for code in engines_out},
+        }
+
+    return bundle
+
 
 def run_sanity_checks(coeffs) -> None:
     """Print the spec §9 checks; raise on hard failures (sums that must reconcile)."""
@@ -531,7 +626,8 @@ def _slug_to_team(slug: str) -> str:
 
 
 def write_output(coeffs, year: int, force: bool, dry_run: bool) -> None:
-    out_path = ANALYSIS_DIR / f"playground_{year}.json"
+    # The API also reads pre-track playground_{year}.json files as Bahrain
+    out_path = ANALYSIS_DIR / f"playground_{year}_{TRACK}.json"
 
     if dry_run:
         print(json.dumps(coeffs, indent=2))
@@ -548,29 +644,29 @@ def write_output(coeffs, year: int, force: bool, dry_run: bool) -> None:
     logger.info(f"✅ Wrote {out_path}")
 
 
-def derive(year: int, force: bool, dry_run: bool) -> None:
+def derive(year: int, force: bool, dry_run: bool, bootstrap: int = DEFAULT_BOOTSTRAP_REPLICATES) -> None:
     baseline, proportions, reference_pole = compute_baseline_and_sectors(year)
 
     df, driver_info = load_qualifying_sessions(year)
     df = filter_clean(df)
 
-    observations, sessions_count = compute_teammate_observations(df)
-
     # Primary team per driver (most sessions) — used to anchor driver skills per team.
     driver_team = {}
     for driver, sub in df.groupby("driver"):
         driver_team[driver] = sub["team"].value_counts().idxmax()
 
-    driver_deltas = solve_driver_deltas(observations, baseline, driver_team)
-
-    car_pace = compute_team_car_pace(df, driver_deltas, baseline)
+    driver_deltas, sessions_count, car_pace, chassis, engines = _fit_components(df, baseline, driver_team)
     logger.info("Car pace by team: " + ", ".join(f"{t}={p:+.3f}" for t, p in sorted(car_pace.items(), key=lambda kv: kv[1])))
 
-    chassis, engines = isolate_chassis_engine(car_pace)
+    residuals = None
+    if bootstrap > 0:
+        logger.info(f"Bootstrapping {bootstrap} session-resampled refits for uncertainty bands...")
+        residuals = bootstrap_residuals(df, baseline, driver_team, driver_deltas, chassis, engines, bootstrap)
 
     coeffs = assemble_coefficients(
         year, baseline, proportions, reference_pole,
         driver_deltas, sessions_count, chassis, engines, driver_info,
+        residuals=residuals,
     )
 
     run_sanity_checks(coeffs)
@@ -582,10 +678,12 @@ def main():
     parser.add_argument("--year", type=int, required=True, help="Season to derive (v1 supports 2024)")
     parser.add_argument("--force", action="store_true", help="Overwrite an existing coefficient JSON")
     parser.add_argument("--dry-run", action="store_true", help="Compute and print, but do not write the JSON")
+    parser.add_argument("--bootstrap", type=int, default=DEFAULT_BOOTSTRAP_REPLICATES,
+                        help="Session-bootstrap replicates stored for uncertainty bands (0 to skip)")
     args = parser.parse_args()
 
     try:
-        derive(args.year, force=args.force, dry_run=args.dry_run)
+        derive(args.year, force=args.force, dry_run=args.dry_run, bootstrap=args.bootstrap)
     except Exception as e:
         logger.error(f"❌ Derivation failed: {e}")
         import traceback
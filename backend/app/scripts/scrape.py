@@ -5,49 +5,86 @@ import argparse
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scraper_utils import scrape_season, scrape_multiple_seasons
+from scraper_utils import (
+    scrape_season, scrape_multiple_seasons, rebuild_standings_from_results, check_career_aggregates,
+    DEFAULT_ROUND_WORKERS,
+)
 from scrape_f1_data import ensure_database_exists
+from scrape_report import ScrapeReport
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Quick F1 data scraper')
-    parser.add_argument('--year', type=int, help='Scrape a single year')
-    parser.add_argument('--years', type=str, help='Scrape year range (e.g., 2020-2024)')
-    parser.add_argument('--recent', action='store_true', help='Scrape recent years (2020-2024)')
-    parser.add_argument('--all', action='store_true', help='Scrape all years (2010-2024)')
-    parser.add_argument('--force', action='store_true', help='Re-scrape years that already have data')
-
-    args = parser.parse_args()
-
-    # Ensure database exists
-    ensure_database_exists()
-
+def run_scrape(args, report: ScrapeReport):
     if args.year:
         print(f"🏁 Scraping {args.year}...")
-        scrape_season(args.year, force=args.force)
+        scrape_season(args.year, force=args.force, workers=args.workers, report=report)
 
     elif args.years:
         try:
             start, end = map(int, args.years.split('-'))
             print(f"🏁 Scraping {start} to {end}...")
-            scrape_multiple_seasons(start, end, force=args.force)
+            scrape_multiple_seasons(start, end, force=args.force, workers=args.workers, report=report)
         except ValueError:
             print("❌ Invalid format. Use: --years 2020-2024")
             sys.exit(1)
 
     elif args.recent:
         print("🏁 Scraping recent seasons (2020-2024)...")
-        scrape_multiple_seasons(2020, 2024, force=args.force)
+        scrape_multiple_seasons(2020, 2024, force=args.force, workers=args.workers, report=report)
 
     elif args.all:
         print("🏁 Scraping all seasons (2010-2024)...")
-        scrape_multiple_seasons(2010, 2024, force=args.force)
+        scrape_multiple_seasons(2010, 2024, force=args.force, workers=args.workers, report=report)
 
     else:
         # Default: scrape recent years
         print("🏁 Scraping recent seasons (2020-2024)...")
         print("💡 Tip: Use --help to see all options")
-        scrape_multiple_seasons(2020, 2024, force=args.force)
+        scrape_multiple_seasons(2020, 2024, force=args.force, workers=args.workers, report=report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Quick F1 data scraper')
+    parser.add_argument('--year', type=int, help='Scrape a single year')
+    parser.add_argument('--years', type=str, help='Scrape year range (e.g., 2020-2024)')
+    parser.add_argument('--recent', action='store_true', help='Scrape recent years (2020-2024)')
+    parser.add_argument('--all', action='store_true', help='Scrape all years (2010-2024)')
+    parser.add_argument('--force', action='store_true', help='Re-scrape every round and replace stored seasons (default: only new rounds)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_ROUND_WORKERS, help='Rounds loaded concurrently per season')
+    parser.add_argument('--from-results', action='store_true', help='Rebuild --year/--years standings from stored per-round results (no FastF1)')
+    parser.add_argument('--report', type=Path, help='Where to write the JSON run report (default: pipeline_cache/scrape_reports/)')
+    parser.add_argument('--check-aggregates', action='store_true', help='Verify drivers career totals against a full recompute and exit')
+    parser.add_argument('--repair-aggregates', action='store_true', help='Like --check-aggregates, but overwrite mismatching drivers with the recompute')
+
+    args = parser.parse_args()
+
+    # Ensure database exists
+    ensure_database_exists()
+
+    if args.check_aggregates or args.repair_aggregates:
+        mismatches = check_career_aggregates(repair=args.repair_aggregates)
+        for m in mismatches:
+            print(f"  {m['driver_code']} {m['column']}: stored {m['stored']}, expected {m['expected']}")
+        if mismatches and not args.repair_aggregates:
+            sys.exit(1)
+        return
+
+    if args.from_results:
+        try:
+            start, end = map(int, args.years.split('-')) if args.years else (args.year, args.year)
+        except (AttributeError, ValueError):
+            print("❌ --from-results needs --year or --years 2020-2024")
+            sys.exit(1)
+        if start is None:
+            print("❌ --from-results needs --year or --years 2020-2024")
+            sys.exit(1)
+        for year in range(start, end + 1):
+            rebuild_standings_from_results(year)
+        return
+
+    report = ScrapeReport()
+    with report.capture_fastf1_cache():
+        run_scrape(args, report)
+    print(f"📊 Run report written to {report.write(args.report)}")
 
 
 if __name__ == "__main__":
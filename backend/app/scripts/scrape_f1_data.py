@@ -31,6 +31,8 @@ def ensure_database_exists():
             country_code TEXT,
             total_wins INTEGER DEFAULT 0,
             total_points REAL DEFAULT 0,
+            position_sum INTEGER DEFAULT 0,
+            classified_seasons INTEGER DEFAULT 0,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
@@ -45,9 +47,14 @@ def ensure_database_exists():
         ("country_code", "TEXT"),
         ("total_wins", "INTEGER DEFAULT 0"),
         ("total_points", "REAL DEFAULT 0"),
+        ("position_sum", "INTEGER DEFAULT 0"),
+        ("classified_seasons", "INTEGER DEFAULT 0"),
     ):
         if col not in existing_cols:
             cursor.execute(f"ALTER TABLE drivers ADD COLUMN {col} {definition}")
+    # Career aggregates are maintained incrementally from here on; recompute them
+    # once, with the new running sums, from the standings already stored
+    backfill_career_sums = "classified_seasons" not in existing_cols
     
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS team_history (
@@ -90,11 +97,81 @@ def ensure_database_exists():
         )
     """)
     
+    # Driver bios - DOB and nationality per driver code, looked up from Ergast once
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS driver_bios (
+            driver_code TEXT PRIMARY KEY,
+            date_of_birth TEXT,
+            nationality TEXT,
+            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # Scraped rounds - which race weekends each season's standings already include
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scraped_rounds (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            event_name TEXT NOT NULL,
+            scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (season, round)
+        )
+    """)
+    
+    # Per-round results - each driver's race and qualifying classification, kept so
+    # new season stats can be computed in SQL without reloading FastF1 sessions
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS race_results (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            driver_code TEXT NOT NULL,
+            result_order INTEGER NOT NULL,
+            driver_number TEXT,
+            team_name TEXT,
+            position INTEGER,
+            grid_position INTEGER,
+            points REAL,
+            status TEXT,
+            fastest_lap INTEGER DEFAULT 0,
+            PRIMARY KEY (season, round, driver_code),
+            FOREIGN KEY (driver_code) REFERENCES drivers(driver_code)
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS qualifying_results (
+            season INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            driver_code TEXT NOT NULL,
+            result_order INTEGER NOT NULL,
+            team_name TEXT,
+            position INTEGER,
+            q1 REAL,
+            q2 REAL,
+            q3 REAL,
+            PRIMARY KEY (season, round, driver_code),
+            FOREIGN KEY (driver_code) REFERENCES drivers(driver_code)
+        )
+    """)
+    
     # Create indexes
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_history_driver ON team_history(driver_code)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_standings_driver ON season_standings(driver_code)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_standings_season ON season_standings(season)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_highlights_driver ON driver_highlights(driver_code)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_race_results_driver ON race_results(driver_code, season)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_qualifying_results_driver ON qualifying_results(driver_code, season)")
+
+    if backfill_career_sums:
+        cursor.execute("""
+            UPDATE drivers SET
+                position_sum = COALESCE((SELECT SUM(position) FROM season_standings s WHERE s.driver_code = drivers.driver_code AND s.position > 0), 0),
+                classified_seasons = (SELECT COUNT(position) FROM season_standings s WHERE s.driver_code = drivers.driver_code AND s.position > 0),
+                average_position = (SELECT AVG(position) FROM season_standings s WHERE s.driver_code = drivers.driver_code AND s.position > 0),
+                total_seasons = (SELECT COUNT(*) FROM season_standings s WHERE s.driver_code = drivers.driver_code),
+                total_wins = COALESCE((SELECT SUM(wins) FROM season_standings s WHERE s.driver_code = drivers.driver_code), 0),
+                total_points = COALESCE((SELECT SUM(points) FROM season_standings s WHERE s.driver_code = drivers.driver_code), 0)
+        """)
     
     conn.commit()
     conn.close()
@@ -0,0 +1,134 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+current_dir = Path(__file__).resolve().parent
+REPORT_DIR = current_dir.parent / "pipeline_cache" / "scrape_reports"
+
+# FastF1's pickle-cache messages (fastf1/req.py), used to count cache hits and fetches
+FASTF1_CACHE_HIT = "Using cached data for"
+FASTF1_CACHE_FETCHES = ("No cached data found for", "Updating cache for")
+
+
+class ScrapeReport:
+    """
+    Stage timers and counters for one scraper invocation, written as a JSON report.
+
+    Stages are schedule, bio, session_load, reduce and db_save. Stages timed inside
+    the round worker threads (session_load, reduce) add up per-thread time, so with
+    several workers they can exceed the season's wall time. Counters include FastF1
+    cache hits and fetches while `capture_fastf1_cache()` is active.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages: Dict[str, float] = defaultdict(float)
+        self.counters: Counter = Counter()
+        self.seasons: Dict[int, Dict[str, Any]] = {}
+        self.current_season: Optional[int] = None
+
+    @contextmanager
+    def stage(self, name: str, season: Optional[int] = None):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started, season)
+
+    def add_time(self, name: str, seconds: float, season: Optional[int] = None) -> None:
+        with self._lock:
+            self.stages[name] += seconds
+            if season is not None:
+                self._season(season)['stages'][name] += seconds
+
+    def count(self, name: str, n: int = 1, season: Optional[int] = None) -> None:
+        season = self.current_season if season is None else season
+        with self._lock:
+            self.counters[name] += n
+            if season is not None:
+                self._season(season)['counters'][name] += n
+
+    def start_season(self, season: int) -> None:
+        self.current_season = season
+        with self._lock:
+            self._season(season)['started'] = time.perf_counter()
+
+    def finish_season(self, season: int, status: str) -> None:
+        with self._lock:
+            entry = self._season(season)
+            entry['status'] = status
+            # A season scraped twice in one run (e.g. --force then incremental) adds up
+            entry['seconds'] = entry.get('seconds', 0.0) + time.perf_counter() - entry.pop('started', time.perf_counter())
+        self.current_season = None
+
+    @contextmanager
+    def capture_fastf1_cache(self):
+        """Count FastF1 cache hits / fetches from its log records while active."""
+        handler = _FastF1CacheHandler(self)
+        fastf1_logger = logging.getLogger('fastf1')
+        fastf1_logger.addHandler(handler)
+        try:
+            yield
+        finally:
+            fastf1_logger.removeHandler(handler)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def summary(stages, counters):
+            hits, fetches = counters.get('fastf1_cache_hits', 0), counters.get('fastf1_cache_fetches', 0)
+            return {
+                'stages': {name: round(seconds, 3) for name, seconds in stages.items()},
+                'counters': dict(counters),
+                'fastf1_cache_hit_rate': round(hits / (hits + fetches), 3) if hits + fetches else None,
+            }
+
+        with self._lock:
+            return {
+                'started_at': self.started_at.isoformat(),
+                'wall_seconds': round(time.perf_counter() - self._started, 3),
+                **summary(self.stages, self.counters),
+                'seasons': {
+                    str(season): {
+                        'status': entry.get('status'),
+                        'seconds': round(entry['seconds'], 3) if 'seconds' in entry else None,
+                        **summary(entry['stages'], entry['counters']),
+                    }
+                    for season, entry in sorted(self.seasons.items())
+                },
+            }
+
+    def write(self, path: Optional[Path] = None) -> Path:
+        """Write the report atomically; defaults to REPORT_DIR/scrape_<UTC timestamp>.json."""
+        if path is None:
+            path = REPORT_DIR / f"scrape_{self.started_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+    def _season(self, season: int) -> Dict[str, Any]:
+        return self.seasons.setdefault(season, {'stages': defaultdict(float), 'counters': Counter()})
+
+
+class _FastF1CacheHandler(logging.Handler):
+    def __init__(self, report: ScrapeReport):
+        super().__init__(level=logging.INFO)
+        self.report = report
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if message.startswith(FASTF1_CACHE_HIT):
+            self.report.count('fastf1_cache_hits')
+        elif message.startswith(FASTF1_CACHE_FETCHES):
+            self.report.count('fastf1_cache_fetches')
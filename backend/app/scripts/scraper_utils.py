@@ -1,11 +1,15 @@
 import fastf1
 from fastf1.ergast import Ergast
 import sqlite3
-from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 import logging
+import time
 from pathlib import Path
 import pandas as pd
 
+from scrape_report import ScrapeReport
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,18 @@ fastf1.Cache.enable_cache(cache_path)
 current_dir = Path(__file__).resolve().parent
 DB_PATH = current_dir.parent / "f1_drivers.db"
 
+# Rounds loaded concurrently per season
+DEFAULT_ROUND_WORKERS = 4
+
+# session.load() arguments per session: only what scrape_round reads, directly or through
+# FastF1's post-processing. Results are always loaded. The race needs laps for the fastest
+# lap, and race-control messages so FastF1 marks deleted laps and clears their
+# IsPersonalBest before pick_fastest(). Qualifying needs laps and messages so FastF1 can
+# rebuild the classification from non-deleted lap times when Ergast has no results.
+# Telemetry, position data and weather are never used.
+RACE_LOAD_PROFILE = {'laps': True, 'telemetry': False, 'weather': False, 'messages': True}
+QUALI_LOAD_PROFILE = {'laps': True, 'telemetry': False, 'weather': False, 'messages': True}
+
 
 def get_db_connection():
     """Get database connection"""
@@ -26,10 +42,10 @@ def get_db_connection():
     return conn
 
 
-def fetch_driver_bio(year: int) -> Dict[str, Dict]:
+def _fetch_ergast_bio(year: int) -> Optional[Dict[str, Dict]]:
     """Look up DOB + nationality for each driver in a season via Ergast.
-    Returns {driver_code: {'date_of_birth': 'YYYY-MM-DD', 'nationality': 'Dutch'}}.
-    Falls back to {} on failure so a missing Ergast response doesn't break scraping."""
+    Returns {driver_code: {'date_of_birth': 'YYYY-MM-DD', 'nationality': 'Dutch'}},
+    or None on failure so a missing Ergast response doesn't break scraping."""
     try:
         info = Ergast().get_driver_info(season=year)
         bio: Dict[str, Dict] = {}
@@ -46,7 +62,54 @@ def fetch_driver_bio(year: int) -> Dict[str, Dict]:
         return bio
     except Exception as e:
         logger.warning(f"  Could not fetch driver bio from Ergast for {year}: {e}")
-        return {}
+        return None
+
+
+def fetch_driver_bio(year: int, driver_codes: Set[str], report: Optional[ScrapeReport] = None) -> Dict[str, Dict]:
+    """DOB + nationality for `driver_codes`, from the driver_bios table where known.
+    Ergast is only asked (once, for the season) if some codes have never been looked
+    up, so a backfill runs offline once the table is warm. Codes Ergast has no entry
+    for are stored empty so they are not looked up again."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        placeholders = ', '.join('?' * len(driver_codes))
+        cursor.execute(
+            f"SELECT driver_code, date_of_birth, nationality FROM driver_bios WHERE driver_code IN ({placeholders})",
+            tuple(driver_codes),
+        )
+        bio = {
+            row['driver_code']: {'date_of_birth': row['date_of_birth'], 'nationality': row['nationality']}
+            for row in cursor.fetchall()
+        }
+
+        missing = set(driver_codes) - bio.keys()
+        if not missing:
+            logger.info(f"  Driver bio for all {len(bio)} drivers already stored")
+            return bio
+
+        if report is not None:
+            report.count('ergast_fetches', season=year)
+        fetched = _fetch_ergast_bio(year)
+        if fetched is None:
+            return bio
+
+        empty = {'date_of_birth': None, 'nationality': None}
+        new_bio = {**{code: empty for code in missing}, **fetched}
+        cursor.executemany("""
+            INSERT INTO driver_bios (driver_code, date_of_birth, nationality)
+            VALUES (?, ?, ?)
+            ON CONFLICT(driver_code) DO UPDATE SET
+                date_of_birth = COALESCE(excluded.date_of_birth, driver_bios.date_of_birth),
+                nationality = COALESCE(excluded.nationality, driver_bios.nationality),
+                fetched_at = CURRENT_TIMESTAMP
+        """, [(code, b['date_of_birth'], b['nationality']) for code, b in new_bio.items()])
+        conn.commit()
+
+        bio.update((code, new_bio[code]) for code in missing)
+        return bio
+    finally:
+        conn.close()
 
 
 def season_already_scraped(year: int) -> bool:
@@ -60,139 +123,337 @@ def season_already_scraped(year: int) -> bool:
         conn.close()
 
 
-def scrape_season(year: int, force: bool = False) -> bool:
+def scraped_rounds(year: int) -> Set[int]:
+    """Round numbers whose results are already included in season_standings for this year."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT round FROM scraped_rounds WHERE season = ?", (year,))
+        return {row['round'] for row in cursor.fetchall()}
+    finally:
+        conn.close()
+
+
+# Columns of a race results frame the season aggregation reads
+RESULT_FRAME_COLUMNS = (
+    'Abbreviation', 'FullName', 'TeamName', 'DriverNumber', 'CountryCode',
+    'Position', 'GridPosition', 'Points', 'Status',
+)
+
+RACE_RESULT_COLUMNS = (
+    'season', 'round', 'driver_code', 'result_order', 'driver_number', 'team_name',
+    'position', 'grid_position', 'points', 'status', 'fastest_lap',
+)
+QUALIFYING_RESULT_COLUMNS = (
+    'season', 'round', 'driver_code', 'result_order', 'team_name',
+    'position', 'q1', 'q2', 'q3',
+)
+
+
+def _values(column: pd.Series, cast) -> List:
+    """cast() of each value, with None for NaN / NaT / missing values."""
+    return [None if pd.isna(v) else cast(v) for v in column.to_numpy(dtype=object)]
+
+
+def _seconds(value) -> float:
+    """pd.Timedelta -> float seconds."""
+    return value.total_seconds() if isinstance(value, pd.Timedelta) else float(value)
+
+
+def _race_result_rows(year: int, results: pd.DataFrame) -> List[Tuple]:
+    """race_results rows for a frame of one or more rounds' annotated race results."""
+    return list(zip(
+        [year] * len(results),
+        results['round'].astype(int).tolist(),
+        results['Abbreviation'].tolist(),
+        results['result_order'].astype(int).tolist(),
+        _values(results['DriverNumber'], str),
+        results['TeamName'].tolist(),
+        _values(results['Position'], int),
+        _values(results['GridPosition'], int),
+        _values(results['Points'], float),
+        _values(results['Status'], str),
+        results['fastest_lap'].astype(int).tolist(),
+    ))
+
+
+def _qualifying_result_rows(year: int, round_num: int, results: pd.DataFrame) -> List[Tuple]:
+    return list(zip(
+        [year] * len(results),
+        [int(round_num)] * len(results),
+        results['Abbreviation'].tolist(),
+        range(1, len(results) + 1),
+        results['TeamName'].tolist(),
+        _values(results['Position'], int),
+        _values(results['Q1'], _seconds),
+        _values(results['Q2'], _seconds),
+        _values(results['Q3'], _seconds),
+    ))
+
+
+def scrape_round(year: int, round_num: int, event_name: str, report: Optional[ScrapeReport] = None,
+                 sessions: Optional[Dict[str, object]] = None) -> Optional[Dict]:
+    """
+    Load one round's race and qualifying sessions:
+    {'round': round_num, 'results': race results frame, 'pole_driver': code or None,
+    'fastest_driver': code or None, 'qualifying_results': [row], 'load_seconds': time in session.load()}.
+    The results frame holds RESULT_FRAME_COLUMNS in FastF1's classification order, plus
+    'round', 'result_order' and 'fastest_lap'; aggregate_season() reduces it.
+    `sessions` holds unloaded Session objects by identifier ('R', 'Q') from
+    _prepare_sessions; any missing one is looked up here.
+    Returns None if the race could not be processed, so the round is skipped.
+    """
+    report = report or ScrapeReport()
+    sessions = sessions or {}
+    logger.info(f"  Processing Round {round_num}: {event_name}")
+
+    try:
+        # Load the race session
+        started = time.perf_counter()
+        session = sessions.get('R') or fastf1.get_session(year, round_num, 'R')
+        session.load(**RACE_LOAD_PROFILE)
+        load_seconds = time.perf_counter() - started
+        report.add_time('session_load', load_seconds, year)
+        report.count('sessions_loaded', season=year)
+
+        # Get race results
+        results = session.results
+
+        if results.empty:
+            logger.warning(f"    No results for {event_name}")
+            report.count('rounds_failed', season=year)
+            return None
+
+        # Get qualifying results for pole positions
+        pole_driver = None
+        qualifying_results = []
+        try:
+            started = time.perf_counter()
+            quali = sessions.get('Q') or fastf1.get_session(year, round_num, 'Q')
+            quali.load(**QUALI_LOAD_PROFILE)
+            quali_seconds = time.perf_counter() - started
+            load_seconds += quali_seconds
+            report.add_time('session_load', quali_seconds, year)
+            report.count('sessions_loaded', season=year)
+
+            if quali.results['Position'].isna().all():
+                # Unclassified (no Ergast results and no laps to rank): the order means nothing
+                logger.warning(f"    No qualifying classification for {event_name}; pole not counted")
+            elif not quali.results.empty:
+                with report.stage('reduce', year):
+                    pole_driver = quali.results.iloc[0]['Abbreviation']
+                    qualifying_results = _qualifying_result_rows(year, round_num, quali.results)
+
+        except Exception as e:
+            logger.warning(f"    Could not load qualifying for {event_name}: {e}")
+
+        # Check for fastest lap
+        fastest_driver = None
+        try:
+            fastest_lap = session.laps.pick_fastest()
+            if fastest_lap is not None and not fastest_lap.empty:
+                fastest_driver = fastest_lap['Driver']
+        except Exception as e:
+            logger.warning(f"    Could not get fastest lap for {event_name}: {e}")
+
+        with report.stage('reduce', year):
+            frame = pd.DataFrame(results).reindex(columns=list(RESULT_FRAME_COLUMNS)).reset_index(drop=True)
+            frame['round'] = int(round_num)
+            frame['result_order'] = range(1, len(frame) + 1)
+            frame['fastest_lap'] = frame['Abbreviation'].eq(fastest_driver)
+
+        report.count('rounds_scraped', season=year)
+
+        return {
+            'round': int(round_num),
+            'results': frame,
+            'pole_driver': pole_driver,
+            'fastest_driver': fastest_driver,
+            'qualifying_results': qualifying_results,
+            'load_seconds': load_seconds,
+        }
+
+    except Exception as e:
+        logger.warning(f"    Error processing {event_name}: {e}")
+        report.count('rounds_failed', season=year)
+        return None
+
+
+def _prepare_sessions(year: int, rounds: List[Tuple[int, str]]) -> Dict[int, Dict[str, object]]:
+    """
+    Unloaded race and qualifying Session objects per round, built on the calling thread.
+
+    fastf1.get_session reads (and on a cold cache writes) the season schedule on every
+    call; doing it up front keeps those cache writes off the worker threads. A session
+    that can't be built is left out, and scrape_round reports the error when it retries.
+    """
+    prepared = {}
+    for round_num, _ in rounds:
+        prepared[round_num] = {}
+        for identifier in ('R', 'Q'):
+            try:
+                prepared[round_num][identifier] = fastf1.get_session(year, round_num, identifier)
+            except Exception:
+                pass
+    return prepared
+
+
+def aggregate_season(partials: List[Dict], driver_bio: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Season totals per driver from the rounds' partials, in one groupby over their
+    concatenated results. Partials must be in round order: identity fields come from a
+    driver's first race, team fields from their latest, and drivers appear in
+    first-race order (the tie-break for equal points and wins).
     """
-    Scrape complete season using FastF1 Session API.
-    Skips if season_standings already has rows for `year` unless force=True.
+    results = pd.concat([p['results'] for p in partials], ignore_index=True)
+    position = results['Position']
+    status = results['Status']
+
+    # DNF: a status other than 'Finished' / '+N Laps', and no classified position within the field
+    retired = status.notna() & status.ne('Finished') & ~status.astype(str).str.contains('+', regex=False)
+    results['win'] = position.eq(1)
+    results['podium'] = position.le(3)
+    results['dnf'] = retired & (position.isna() | position.gt(20))
+
+    grouped = results.groupby('Abbreviation', sort=False)
+    totals = grouped[['Points', 'win', 'podium', 'dnf', 'fastest_lap']].sum()
+    totals['races'] = grouped.size()
+    totals['first_round'] = grouped['round'].min()
+
+    # Poles only count for drivers who had raced by that round (their first race included)
+    poles = pd.Series([p['pole_driver'] for p in partials], index=[p['round'] for p in partials]).dropna()
+    first_round = totals['first_round'].reindex(poles.to_numpy()).to_numpy()
+    pole_counts = poles[first_round <= poles.index.to_numpy()].value_counts()
+    totals['pole_positions'] = pole_counts.reindex(totals.index, fill_value=0)
+
+    first = results.drop_duplicates('Abbreviation', keep='first').set_index('Abbreviation').reindex(totals.index)
+    latest_team = results.drop_duplicates('Abbreviation', keep='last').set_index('Abbreviation')['TeamName'].reindex(totals.index)
+
+    driver_stats = {}
+    for code, full_name, driver_number, country_code, team, points, wins, podiums, pole_positions, fastest, dnfs, races in zip(
+        totals.index, first['FullName'], first['DriverNumber'], first['CountryCode'], latest_team,
+        totals['Points'], totals['win'], totals['podium'], totals['pole_positions'],
+        totals['fastest_lap'], totals['dnf'], totals['races'],
+    ):
+        bio = driver_bio.get(code, {})
+        driver_stats[code] = {
+            'full_name': full_name,
+            'team_name': team,
+            'current_team': team,
+            'driver_number': driver_number,
+            'date_of_birth': bio.get('date_of_birth'),
+            'nationality': bio.get('nationality'),
+            'country_code': country_code if pd.notna(country_code) else None,
+            'points': float(points),
+            'wins': int(wins),
+            'podiums': int(podiums),
+            'pole_positions': int(pole_positions),
+            'fastest_laps': int(fastest),
+            'dnfs': int(dnfs),
+            'races': int(races),
+        }
+    return driver_stats
+
+
+def scrape_season(year: int, force: bool = False, workers: int = DEFAULT_ROUND_WORKERS,
+                  report: Optional[ScrapeReport] = None) -> bool:
+    """
+    Scrape a season using FastF1 Session API.
+    Only rounds missing from scraped_rounds are scraped, and their results are added to
+    the existing standings, so an in-progress season picks up just the newest weekend.
+    Seasons scraped before rounds were tracked are skipped as complete. force=True
+    re-scrapes every round and replaces the season.
+    Up to `workers` rounds are loaded concurrently; their partials are merged in round order.
+    Stage timings and counters are recorded in `report` if given.
     Returns True if successful (or if skipped — both are non-error outcomes).
     """
-    if not force and season_already_scraped(year):
+    report = report or ScrapeReport()
+    report.start_season(year)
+    status = _scrape_season(year, force, workers, report)
+    report.finish_season(year, status)
+    return status not in ('failed', 'no data')
+
+
+def _scrape_season(year: int, force: bool, workers: int, report: ScrapeReport) -> str:
+    """scrape_season's work; returns the season's status for the run report."""
+    done_rounds = set() if force else scraped_rounds(year)
+    if not force and not done_rounds and season_already_scraped(year):
         logger.info(f"⏭  Skipping {year} — already scraped (use force=True to re-scrape)")
-        return True
+        return 'skipped'
+    incremental = bool(done_rounds)
 
-    logger.info(f"🏁 Scraping season {year}...")
+    logger.info(f"🏁 Scraping season {year}{' (new rounds only)' if incremental else ''}...")
 
     try:
         # Get the event schedule for the year
-        schedule = fastf1.get_event_schedule(year)
+        with report.stage('schedule', year):
+            schedule = fastf1.get_event_schedule(year)
         
         if schedule.empty:
             logger.warning(f"No events found for {year}")
-            return False
+            return 'no data'
         
         # Filter only race events (exclude testing, sprints shown separately)
         races = schedule[schedule['EventFormat'] != 'testing']
+        # Future rounds have no results yet
+        if 'EventDate' in races.columns:
+            races = races[races['EventDate'] <= pd.Timestamp.now()]
         
         logger.info(f"Found {len(races)} events in {year}")
 
-        # One-shot lookup for DOB/nationality across all drivers in this season
-        driver_bio = fetch_driver_bio(year)
+        rounds = [
+            (event['RoundNumber'], event['EventName'])
+            for _, event in races.iterrows()
+            if event['RoundNumber'] not in done_rounds
+        ]
+        if not rounds:
+            logger.info(f"⏭  {year} is up to date — all {len(done_rounds)} completed rounds already scraped")
+            return 'up to date'
+        if incremental:
+            logger.info(f"  {len(done_rounds)} rounds already scraped; scraping {len(rounds)} new")
 
-        # Dictionary to store driver stats across the season
-        driver_stats = {}
-        
-        # Process each race
-        for idx, event in races.iterrows():
-            event_name = event['EventName']
-            round_num = event['RoundNumber']
-            
-            logger.info(f"  Processing Round {round_num}: {event_name}")
-            
-            try:
-                # Load the race session
-                session = fastf1.get_session(year, round_num, 'R')
-                session.load()
-                
-                # Get race results
-                results = session.results
-                
-                if results.empty:
-                    logger.warning(f"    No results for {event_name}")
-                    continue
-                
-                # Process each driver's result
-                for _, driver_result in results.iterrows():
-                    driver_code = driver_result['Abbreviation']
-                    
-                    # Initialize driver if not seen before
-                    if driver_code not in driver_stats:
-                        country_code = driver_result.get('CountryCode')
-                        bio = driver_bio.get(driver_code, {})
-                        driver_stats[driver_code] = {
-                            'full_name': driver_result['FullName'],
-                            'team_name': driver_result['TeamName'],
-                            'current_team': driver_result['TeamName'],
-                            'driver_number': driver_result.get('DriverNumber'),
-                            'date_of_birth': bio.get('date_of_birth'),
-                            'nationality': bio.get('nationality'),
-                            'country_code': country_code if pd.notna(country_code) else None,
-                            'points': 0,
-                            'wins': 0,
-                            'podiums': 0,
-                            'pole_positions': 0,
-                            'fastest_laps': 0,
-                            'dnfs': 0,
-                            'races': 0
-                        }
-                    
-                    driver_stats[driver_code]['races'] += 1
-                    driver_stats[driver_code]['current_team'] = driver_result['TeamName']
-                    
-                    # Add points
-                    points = driver_result.get('Points', 0)
-                    if pd.notna(points):
-                        driver_stats[driver_code]['points'] += float(points)
-                    
-                    # Check for win (Position == 1)
-                    position = driver_result.get('Position')
-                    if pd.notna(position) and position == 1.0:
-                        driver_stats[driver_code]['wins'] += 1
-                    
-                    # Check for podium (Position 1-3)
-                    if pd.notna(position) and position <= 3.0:
-                        driver_stats[driver_code]['podiums'] += 1
-                    
-                    # Check for DNF (Status not 'Finished' and no position or position > race finishers)
-                    status = driver_result.get('Status', '')
-                    if not pd.isna(status) and status != 'Finished' and '+' not in str(status):
-                        if pd.isna(position) or position > 20:
-                            driver_stats[driver_code]['dnfs'] += 1
-                    
-                    # Update team name (use latest)
-                    driver_stats[driver_code]['team_name'] = driver_result['TeamName']
-                
-                # Get qualifying results for pole positions
-                try:
-                    quali = fastf1.get_session(year, round_num, 'Q')
-                    quali.load()
-                    
-                    if not quali.results.empty:
-                        pole_sitter = quali.results.iloc[0]
-                        pole_driver = pole_sitter['Abbreviation']
-                        
-                        if pole_driver in driver_stats:
-                            driver_stats[pole_driver]['pole_positions'] += 1
-                
-                except Exception as e:
-                    logger.warning(f"    Could not load qualifying for {event_name}: {e}")
-                
-                # Check for fastest lap
-                try:
-                    fastest_lap = session.laps.pick_fastest()
-                    if fastest_lap is not None and not fastest_lap.empty:
-                        fastest_driver = fastest_lap['Driver']
-                        if fastest_driver in driver_stats:
-                            driver_stats[fastest_driver]['fastest_laps'] += 1
-                except Exception as e:
-                    logger.warning(f"    Could not get fastest lap for {event_name}: {e}")
-                
-            except Exception as e:
-                logger.warning(f"    Error processing {event_name}: {e}")
-                continue
-        
-        if not driver_stats:
+        # Session loading is dominated by HTTP and cache I/O, so threads overlap it well.
+        # FastF1 doesn't document thread safety, so everything shared is done here first:
+        # the schedule lookups behind get_session run on this thread, and each worker only
+        # calls load() on its own round's sessions, whose cache files no other round touches.
+        if workers > 1 and len(rounds) > 1:
+            round_sessions = _prepare_sessions(year, rounds)
+            with ThreadPoolExecutor(max_workers=min(workers, len(rounds))) as pool:
+                partials = list(pool.map(
+                    lambda r: scrape_round(year, r[0], r[1], report, round_sessions[r[0]]), rounds
+                ))
+        else:
+            partials = [scrape_round(year, round_num, event_name, report) for round_num, event_name in rounds]
+
+        completed = [r for r, partial in zip(rounds, partials) if partial is not None]
+        partials = [p for p in partials if p is not None]
+
+        load_seconds = sum(p['load_seconds'] for p in partials)
+        logger.info(f"  Session loads took {load_seconds:.1f}s across {len(rounds)} rounds")
+
+        if not partials:
             logger.error(f"No driver data collected for {year}")
-            return False
+            return 'no data'
+
+        # DOB/nationality for the season's drivers, fetched only for codes not yet stored
+        with report.stage('bio', year):
+            driver_codes = set(pd.concat([p['results']['Abbreviation'] for p in partials]).dropna())
+            driver_bio = fetch_driver_bio(year, driver_codes, report)
+
+        with report.stage('reduce', year):
+            # Dictionary to store driver stats across the season
+            driver_stats = aggregate_season(partials, driver_bio)
+
+            race_results = _race_result_rows(year, pd.concat([p['results'] for p in partials], ignore_index=True))
+            qualifying_results = [row for p in partials for row in p['qualifying_results']]
+        report.count('result_rows', len(race_results) + len(qualifying_results), season=year)
+
+        if incremental:
+            # Positions are re-ranked in SQL over the whole season's totals
+            with report.stage('db_save', year):
+                save_season_to_db(year, driver_stats, completed, race_results, qualifying_results, incremental=True)
+            logger.info(f"✅ Added {len(completed)} rounds to {year} - {len(driver_stats)} drivers")
+            return 'updated'
         
         # Calculate final positions based on points
         sorted_drivers = sorted(
@@ -206,116 +467,157 @@ def scrape_season(year: int, force: bool = False) -> bool:
             driver_stats[driver_code]['position'] = position
         
         # Save to database
-        save_season_to_db(year, driver_stats)
+        with report.stage('db_save', year):
+            save_season_to_db(year, driver_stats, completed, race_results, qualifying_results)
         
         logger.info(f"✅ Successfully scraped {year} - {len(driver_stats)} drivers")
-        return True
+        return 'scraped'
         
     except Exception as e:
         logger.error(f"❌ Error scraping season {year}: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        return False
+        return 'failed'
+
+
+STAGED_COLUMNS = (
+    'driver_code', 'full_name', 'driver_number', 'current_team', 'team_name',
+    'date_of_birth', 'nationality', 'country_code',
+    'position', 'points', 'wins', 'podiums', 'pole_positions', 'fastest_laps', 'dnfs',
+)
+
 
+def save_season_to_db(year: int, driver_stats: Dict, rounds: List[Tuple[int, str]] = (),
+                      race_results: List[Tuple] = (), qualifying_results: List[Tuple] = (),
+                      incremental: bool = False):
+    """Save scraped season data to database.
 
-def save_season_to_db(year: int, driver_stats: Dict):
-    """Save scraped season data to database"""
+    The season's rows are staged in a temp table with one executemany, then applied to
+    drivers, team_history and season_standings with one upsert each. Career aggregates
+    are updated by the change in this season's standings (see _apply_career_deltas).
+
+    `rounds` are the (round, event name) pairs driver_stats covers, and `race_results` /
+    `qualifying_results` their per-driver rows. With incremental=True driver_stats holds
+    only those rounds: its counts are added to the stored standings and the season's
+    positions are re-ranked. Otherwise it replaces the season."""
     logger.info(f"💾 Saving {year} data to database...")
     
     conn = get_db_connection()
     cursor = conn.cursor()
     
     try:
-        for driver_code, stats in driver_stats.items():
-            # Check if driver exists
-            cursor.execute(
-                "SELECT total_seasons FROM drivers WHERE driver_code = ?",
-                (driver_code,)
+        cursor.execute(f"""
+            CREATE TEMP TABLE season_stage (
+                {', '.join(STAGED_COLUMNS)},
+                PRIMARY KEY (driver_code)
             )
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing driver. COALESCE on bio fields so a re-scrape
-                # of an older season doesn't wipe out info from a newer one.
-                cursor.execute("""
-                    UPDATE drivers
-                    SET full_name = ?,
-                        total_seasons = total_seasons + 1,
-                        driver_number = ?,
-                        current_team = ?,
-                        date_of_birth = COALESCE(?, date_of_birth),
-                        nationality = COALESCE(?, nationality),
-                        country_code = COALESCE(?, country_code),
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE driver_code = ?
-                """, (
-                    stats['full_name'],
-                    stats['driver_number'],
-                    stats['current_team'],
-                    stats.get('date_of_birth'),
-                    stats.get('nationality'),
-                    stats.get('country_code'),
-                    driver_code,
-                ))
-            else:
-                # Insert new driver
-                cursor.execute("""
-                    INSERT INTO drivers (
-                        driver_code, full_name, total_seasons, average_position,
-                        driver_number, current_team,
-                        date_of_birth, nationality, country_code
-                    )
-                    VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?)
-                """, (
-                    driver_code,
-                    stats['full_name'],
-                    stats['position'],
-                    stats['driver_number'],
-                    stats['current_team'],
-                    stats.get('date_of_birth'),
-                    stats.get('nationality'),
-                    stats.get('country_code'),
-                ))
-            
-            # Insert team history
-            cursor.execute("""
-                INSERT OR REPLACE INTO team_history (driver_code, season, team_name)
-                VALUES (?, ?, ?)
-            """, (driver_code, year, stats['team_name']))
-            
-            # Insert season standings
+        """)
+        cursor.executemany(
+            f"INSERT INTO season_stage ({', '.join(STAGED_COLUMNS)}) VALUES ({', '.join('?' * len(STAGED_COLUMNS))})",
+            [
+                (driver_code, *(stats.get(col) for col in STAGED_COLUMNS[1:]))
+                for driver_code, stats in driver_stats.items()
+            ],
+        )
+
+        # New drivers are inserted; existing ones are updated. COALESCE on bio fields so
+        # a re-scrape of an older season doesn't wipe out info from a newer one.
+        # (WHERE true disambiguates the upsert clause from a join in INSERT ... SELECT.)
+        cursor.execute("""
+            INSERT INTO drivers (
+                driver_code, full_name, driver_number, current_team,
+                date_of_birth, nationality, country_code
+            )
+            SELECT driver_code, full_name, driver_number, current_team,
+                   date_of_birth, nationality, country_code
+            FROM season_stage WHERE true
+            ON CONFLICT(driver_code) DO UPDATE SET
+                full_name = excluded.full_name,
+                driver_number = excluded.driver_number,
+                current_team = excluded.current_team,
+                date_of_birth = COALESCE(excluded.date_of_birth, drivers.date_of_birth),
+                nationality = COALESCE(excluded.nationality, drivers.nationality),
+                country_code = COALESCE(excluded.country_code, drivers.country_code),
+                updated_at = CURRENT_TIMESTAMP
+        """)
+
+        _snapshot_season_standings(cursor, year)
+
+        cursor.execute("""
+            INSERT INTO team_history (driver_code, season, team_name)
+            SELECT driver_code, ?, team_name FROM season_stage WHERE true
+            ON CONFLICT(driver_code, season) DO UPDATE SET team_name = excluded.team_name
+        """, (year,))
+
+        if incremental:
             cursor.execute("""
-                INSERT OR REPLACE INTO season_standings 
-                (driver_code, season, position, points, wins, podiums, 
+                INSERT INTO season_standings
+                (driver_code, season, position, points, wins, podiums,
                  pole_positions, fastest_laps, dnfs)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                driver_code, year, stats['position'], stats['points'],
-                stats['wins'], stats['podiums'], stats['pole_positions'],
-                stats['fastest_laps'], stats['dnfs']
-            ))
-        
-        # Recompute career aggregates from season_standings — idempotent.
-        cursor.execute("""
-            UPDATE drivers
-            SET average_position = (
-                    SELECT AVG(position)
-                    FROM season_standings
-                    WHERE season_standings.driver_code = drivers.driver_code
-                    AND position IS NOT NULL
-                ),
-                total_wins = COALESCE((
-                    SELECT SUM(wins)
-                    FROM season_standings
-                    WHERE season_standings.driver_code = drivers.driver_code
-                ), 0),
-                total_points = COALESCE((
-                    SELECT SUM(points)
+                SELECT driver_code, ?, NULL, points, wins, podiums,
+                       pole_positions, fastest_laps, dnfs
+                FROM season_stage WHERE true ORDER BY rowid
+                ON CONFLICT(driver_code, season) DO UPDATE SET
+                    points = season_standings.points + excluded.points,
+                    wins = season_standings.wins + excluded.wins,
+                    podiums = season_standings.podiums + excluded.podiums,
+                    pole_positions = season_standings.pole_positions + excluded.pole_positions,
+                    fastest_laps = season_standings.fastest_laps + excluded.fastest_laps,
+                    dnfs = season_standings.dnfs + excluded.dnfs
+            """, (year,))
+
+            # Same order as a full scrape: points, then wins, then first appearance
+            cursor.execute("""
+                WITH ranked AS (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY points DESC, wins DESC, id) AS rank
                     FROM season_standings
-                    WHERE season_standings.driver_code = drivers.driver_code
-                ), 0)
-        """)
+                    WHERE season = ?
+                )
+                UPDATE season_standings
+                SET position = (SELECT rank FROM ranked WHERE ranked.id = season_standings.id)
+                WHERE season = ?
+            """, (year, year))
+        else:
+            cursor.execute("""
+                INSERT INTO season_standings
+                (driver_code, season, position, points, wins, podiums,
+                 pole_positions, fastest_laps, dnfs)
+                SELECT driver_code, ?, position, points, wins, podiums,
+                       pole_positions, fastest_laps, dnfs
+                FROM season_stage WHERE true ORDER BY rowid
+                ON CONFLICT(driver_code, season) DO UPDATE SET
+                    position = excluded.position,
+                    points = excluded.points,
+                    wins = excluded.wins,
+                    podiums = excluded.podiums,
+                    pole_positions = excluded.pole_positions,
+                    fastest_laps = excluded.fastest_laps,
+                    dnfs = excluded.dnfs
+            """, (year,))
+            for table in ('scraped_rounds', 'race_results', 'qualifying_results'):
+                cursor.execute(f"DELETE FROM {table} WHERE season = ?", (year,))
+
+        for table, columns, rows in (
+            ('race_results', RACE_RESULT_COLUMNS, race_results),
+            ('qualifying_results', QUALIFYING_RESULT_COLUMNS, qualifying_results),
+        ):
+            cursor.executemany(
+                f"DELETE FROM {table} WHERE season = ? AND round = ?",
+                [(year, int(round_num)) for round_num, _ in rounds],
+            )
+            cursor.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                rows,
+            )
+
+        cursor.executemany(
+            "INSERT OR REPLACE INTO scraped_rounds (season, round, event_name) VALUES (?, ?, ?)",
+            [(year, int(round_num), event_name) for round_num, event_name in rounds],
+        )
         
+        _apply_career_deltas(cursor, year)
+
+        cursor.execute("DROP TABLE season_stage")
         conn.commit()
         logger.info(f"✅ Saved {len(driver_stats)} drivers to database")
         
@@ -327,7 +629,203 @@ def save_season_to_db(year: int, driver_stats: Dict):
         conn.close()
 
 
-def scrape_multiple_seasons(start_year: int, end_year: int, force: bool = False):
+def _snapshot_season_standings(cursor: sqlite3.Cursor, year: int) -> None:
+    """Keep the season's standings as they were before a save, for _apply_career_deltas."""
+    cursor.execute("DROP TABLE IF EXISTS standings_before")
+    cursor.execute("""
+        CREATE TEMP TABLE standings_before AS
+        SELECT driver_code, position, points, wins FROM season_standings WHERE season = ?
+    """, (year,))
+
+
+def _apply_career_deltas(cursor: sqlite3.Cursor, year: int) -> None:
+    """Update career aggregates by the difference between the season's standings now
+    and the snapshot taken before the save, touching only drivers in either. Old rows
+    count negatively, so re-scraping a season never double-counts it and re-ranking
+    moves the average of drivers who did not race. average_position is kept exact
+    from the running position_sum / classified_seasons; only positions > 0 are
+    classified (0 and NULL mark an unclassified season)."""
+    cursor.execute("""
+        WITH delta AS (
+            SELECT driver_code,
+                   SUM(sign) AS d_seasons,
+                   SUM(sign * COALESCE(position > 0, 0)) AS d_classified,
+                   SUM(sign * CASE WHEN position > 0 THEN position ELSE 0 END) AS d_position_sum,
+                   SUM(sign * COALESCE(wins, 0)) AS d_wins,
+                   SUM(sign * COALESCE(points, 0)) AS d_points
+            FROM (
+                SELECT driver_code, position, points, wins, 1 AS sign
+                FROM season_standings WHERE season = ?
+                UNION ALL
+                SELECT driver_code, position, points, wins, -1 AS sign
+                FROM standings_before
+            )
+            GROUP BY driver_code
+        )
+        UPDATE drivers SET
+            total_seasons = total_seasons + delta.d_seasons,
+            classified_seasons = classified_seasons + delta.d_classified,
+            position_sum = position_sum + delta.d_position_sum,
+            average_position = CASE WHEN classified_seasons + delta.d_classified > 0
+                THEN CAST(position_sum + delta.d_position_sum AS REAL) / (classified_seasons + delta.d_classified)
+            END,
+            total_wins = total_wins + delta.d_wins,
+            total_points = total_points + delta.d_points
+        FROM delta
+        WHERE drivers.driver_code = delta.driver_code
+    """, (year,))
+    cursor.execute("DROP TABLE standings_before")
+
+
+# Career aggregates recomputed from scratch, as the reference for the incremental ones
+CAREER_AGGREGATES_SQL = """
+    SELECT d.driver_code,
+           COUNT(s.driver_code) AS total_seasons,
+           COUNT(CASE WHEN s.position > 0 THEN 1 END) AS classified_seasons,
+           COALESCE(SUM(CASE WHEN s.position > 0 THEN s.position END), 0) AS position_sum,
+           AVG(CASE WHEN s.position > 0 THEN s.position END) AS average_position,
+           COALESCE(SUM(s.wins), 0) AS total_wins,
+           COALESCE(SUM(s.points), 0) AS total_points
+    FROM drivers d
+    LEFT JOIN season_standings s ON s.driver_code = d.driver_code
+    GROUP BY d.driver_code
+"""
+CAREER_AGGREGATE_COLUMNS = (
+    'total_seasons', 'classified_seasons', 'position_sum', 'average_position', 'total_wins', 'total_points',
+)
+
+
+def check_career_aggregates(repair: bool = False) -> List[Dict]:
+    """Compare every driver's stored career aggregates with a full recompute from
+    season_standings. Returns one {'driver_code', 'column', 'stored', 'expected'} per
+    mismatch; with repair=True the mismatching drivers are overwritten with the recompute."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        stored = {
+            row['driver_code']: row
+            for row in cursor.execute(f"SELECT driver_code, {', '.join(CAREER_AGGREGATE_COLUMNS)} FROM drivers")
+        }
+        mismatches = []
+        repairs = []
+        for expected in cursor.execute(CAREER_AGGREGATES_SQL).fetchall():
+            row = stored[expected['driver_code']]
+            differs = False
+            for col in CAREER_AGGREGATE_COLUMNS:
+                a, b = row[col], expected[col]
+                same = (a is None and b is None) or (
+                    a is not None and b is not None and abs(a - b) <= 1e-6 * max(1.0, abs(b))
+                )
+                if not same:
+                    differs = True
+                    mismatches.append({'driver_code': expected['driver_code'], 'column': col, 'stored': a, 'expected': b})
+            if differs:
+                repairs.append((*(expected[col] for col in CAREER_AGGREGATE_COLUMNS), expected['driver_code']))
+
+        if mismatches:
+            logger.warning(f"⚠️ {len(mismatches)} career aggregate mismatches across {len(repairs)} drivers")
+        else:
+            logger.info(f"✅ Career aggregates consistent for {len(stored)} drivers")
+
+        if repair and repairs:
+            cursor.executemany(
+                f"UPDATE drivers SET {', '.join(f'{col} = ?' for col in CAREER_AGGREGATE_COLUMNS)} WHERE driver_code = ?",
+                repairs,
+            )
+            conn.commit()
+            logger.info(f"🔧 Repaired career aggregates for {len(repairs)} drivers")
+        return mismatches
+
+    finally:
+        conn.close()
+
+
+# Season standings from the per-round results tables, using the same rules as
+# aggregate_season: DNFs are unclassified non-finishers, poles and fastest laps
+# only count once the driver has a race result that season, and ties on points and
+# wins keep first-appearance order.
+STANDINGS_FROM_RESULTS_SQL = """
+    WITH first_appearance AS (
+        SELECT driver_code, round, result_order,
+               ROW_NUMBER() OVER (PARTITION BY driver_code ORDER BY round, result_order) AS n
+        FROM race_results
+        WHERE season = :season
+    ),
+    totals AS (
+        SELECT driver_code,
+               COALESCE(SUM(points), 0) AS points,
+               COUNT(CASE WHEN position = 1 THEN 1 END) AS wins,
+               COUNT(CASE WHEN position <= 3 THEN 1 END) AS podiums,
+               SUM(fastest_lap) AS fastest_laps,
+               COUNT(CASE WHEN status IS NOT NULL AND status != 'Finished' AND instr(status, '+') = 0
+                          AND (position IS NULL OR position > 20) THEN 1 END) AS dnfs
+        FROM race_results
+        WHERE season = :season
+        GROUP BY driver_code
+    ),
+    poles AS (
+        SELECT q.driver_code, COUNT(*) AS pole_positions
+        FROM qualifying_results q
+        WHERE q.season = :season AND q.result_order = 1
+          AND EXISTS (
+              SELECT 1 FROM race_results r
+              WHERE r.season = q.season AND r.driver_code = q.driver_code AND r.round <= q.round
+          )
+        GROUP BY q.driver_code
+    )
+    SELECT t.driver_code,
+           ROW_NUMBER() OVER (ORDER BY t.points DESC, t.wins DESC, f.round, f.result_order) AS position,
+           t.points, t.wins, t.podiums,
+           COALESCE(p.pole_positions, 0) AS pole_positions,
+           t.fastest_laps, t.dnfs
+    FROM totals t
+    JOIN first_appearance f ON f.driver_code = t.driver_code AND f.n = 1
+    LEFT JOIN poles p ON p.driver_code = t.driver_code
+    ORDER BY position
+"""
+
+
+def rebuild_standings_from_results(year: int) -> bool:
+    """Recompute season_standings for `year` from race_results / qualifying_results,
+    with no FastF1 reload. Returns False if no per-round results are stored for it."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        standings = cursor.execute(STANDINGS_FROM_RESULTS_SQL, {'season': year}).fetchall()
+        if not standings:
+            logger.warning(f"No stored race results for {year}; scrape it with --force first")
+            return False
+
+        _snapshot_season_standings(cursor, year)
+        cursor.execute("DELETE FROM season_standings WHERE season = ?", (year,))
+        cursor.executemany("""
+            INSERT INTO season_standings
+            (driver_code, season, position, points, wins, podiums,
+             pole_positions, fastest_laps, dnfs)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (row['driver_code'], year, row['position'], row['points'], row['wins'], row['podiums'],
+             row['pole_positions'], row['fastest_laps'], row['dnfs'])
+            for row in standings
+        ])
+        _apply_career_deltas(cursor, year)
+
+        conn.commit()
+        logger.info(f"✅ Rebuilt {year} standings for {len(standings)} drivers from stored results")
+        return True
+
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"❌ Error rebuilding {year} standings: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+def scrape_multiple_seasons(start_year: int, end_year: int, force: bool = False, workers: int = DEFAULT_ROUND_WORKERS,
+                            report: Optional[ScrapeReport] = None):
     """Scrape multiple seasons. Skips already-scraped years unless force=True."""
     logger.info(f"🏁 Starting scrape from {start_year} to {end_year}")
 
@@ -337,7 +835,7 @@ def scrape_multiple_seasons(start_year: int, end_year: int, force: bool = False)
         logger.info(f"Processing {year}")
         logger.info(f"{'='*50}")
 
-        if scrape_season(year, force=force):
+        if scrape_season(year, force=force, workers=workers, report=report):
             success_count += 1
 
     logger.info(f"\n🎉 Scraping complete! Processed {success_count}/{end_year - start_year + 1} seasons")
\ No newline at end of file
@@ -0,0 +1,368 @@
+"""Deterministic synthetic stand-in for the slice of FastF1 the analysis pipelines use.
+
+Mirrors `fastf1.get_event_schedule`, `fastf1.get_session(...).load(...)` with `.laps`,
+`.results`, `.weather_data`, `.name` and `.get_driver()`, FastF1's `weather_data` api
+call, plus Ergast's `get_driver_info`, so services/wet.py, scripts/scraper_utils.py and
+scripts/derive_playground_coefficients.py can be benchmarked and profiled on a clean
+machine with no network. Every value is a pure function of (seed, year, round, session),
+so two runs over the same configuration see identical data.
+
+Offline tooling; the FastAPI app never imports it. Typical use:
+
+    provider = SyntheticFastF1(SyntheticSeasonConfig(rounds=24, drivers=20))
+    with use_synthetic_fastf1(provider, wet_module, scraper_utils):
+        ...
+"""
+
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import fastf1
+import numpy as np
+import pandas as pd
+from fastf1.core import Laps
+from fastf1.exceptions import DataNotLoadedError
+
+# Real 2024 team names so the Playground derivation's team/engine tables apply.
+TEAMS = [
+    "Red Bull Racing", "Ferrari", "McLaren", "Mercedes", "Aston Martin",
+    "RB", "Haas F1 Team", "Alpine", "Williams", "Kick Sauber",
+]
+
+SESSION_NAMES = {
+    "FP1": "Practice 1",
+    "FP2": "Practice 2",
+    "FP3": "Practice 3",
+    "Q": "Qualifying",
+    "R": "Race",
+}
+
+POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+
+DRY_COMPOUNDS = ["SOFT", "MEDIUM", "HARD"]
+WET_COMPOUNDS = ["INTERMEDIATE", "WET"]
+
+
+@dataclass(frozen=True)
+class SyntheticSeasonConfig:
+    """Size and character of the generated seasons."""
+    rounds: int = 24
+    drivers: int = 20
+    laps_per_session: int = 25
+    race_laps: int = 57
+    wet_session_probability: float = 0.08
+    dnf_probability: float = 0.06
+    base_lap_time_s: float = 92.0
+    load_delay_s: float = 0.0          # simulated deserialization cost per load()
+    seed: int = 0
+
+
+def _rng(config: SyntheticSeasonConfig, *parts) -> np.random.Generator:
+    key = ":".join(str(p) for p in (config.seed, *parts))
+    return np.random.default_rng(zlib.crc32(key.encode()))
+
+
+class SyntheticSession:
+    """A session with the `.load()` / `.laps` / `.results` / `.weather_data` surface of fastf1.core.Session."""
+
+    def __init__(self, provider: "SyntheticFastF1", year: int, round_number: int, identifier: str):
+        self._provider = provider
+        self._config = provider.config
+        self.year = year
+        self.round_number = round_number
+        self.identifier = identifier
+        self.name = SESSION_NAMES[identifier]
+        self.event = provider.event(year, round_number)
+        self.api_path = f"{year}/{round_number:02d}/{identifier}/"
+        self._laps: Optional[Laps] = None
+        self._weather: Optional[pd.DataFrame] = None
+        self._results: Optional[pd.DataFrame] = None
+
+    def load(self, laps: bool = True, telemetry: bool = True, weather: bool = True, messages: bool = True) -> None:
+        self._provider.loads.append((self.year, self.round_number, self.identifier, laps, weather))
+        if self._config.load_delay_s:
+            time.sleep(self._config.load_delay_s)
+
+        self._results = self._build_results()
+        self._laps = self._build_laps() if laps else None
+        self._weather = self._build_weather() if weather else None
+
+    @property
+    def laps(self) -> Laps:
+        if self._laps is None:
+            raise DataNotLoadedError("The data you are trying to access has not been loaded yet.")
+        return self._laps
+
+    @property
+    def weather_data(self) -> pd.DataFrame:
+        if self._weather is None:
+            raise DataNotLoadedError("The data you are trying to access has not been loaded yet.")
+        return self._weather
+
+    @property
+    def results(self) -> pd.DataFrame:
+        if self._results is None:
+            raise DataNotLoadedError("The data you are trying to access has not been loaded yet.")
+        return self._results
+
+    def get_driver(self, identifier: str) -> pd.Series:
+        results = self.results
+        return results.loc[results["Abbreviation"] == identifier].iloc[0]
+
+    @property
+    def is_wet(self) -> bool:
+        rng = _rng(self._config, self.year, self.round_number, self.identifier, "weather")
+        return bool(rng.random() < self._config.wet_session_probability)
+
+    def _build_weather(self) -> pd.DataFrame:
+        rng = _rng(self._config, self.year, self.round_number, self.identifier, "weather-samples")
+        samples = 60
+        rainfall = np.zeros(samples, dtype=bool)
+        if self.is_wet:
+            start = int(rng.integers(0, samples // 2))
+            rainfall[start:] = True
+        return pd.DataFrame({
+            "Time": pd.to_timedelta(np.arange(samples), unit="min"),
+            "AirTemp": 25 + rng.normal(0, 1, samples),
+            "TrackTemp": 35 + rng.normal(0, 2, samples),
+            "Humidity": 50 + rng.normal(0, 5, samples),
+            "Pressure": 1010 + rng.normal(0, 1, samples),
+            "Rainfall": rainfall,
+            "WindSpeed": np.abs(rng.normal(2, 1, samples)),
+            "WindDirection": rng.integers(0, 360, samples),
+        })
+
+    def _build_laps(self) -> Laps:
+        config = self._config
+        rng = _rng(config, self.year, self.round_number, self.identifier, "laps")
+        wet = self.is_wet
+        lap_count = config.race_laps if self.identifier == "R" else config.laps_per_session
+        track_base = config.base_lap_time_s + _rng(config, self.year, self.round_number, "track").normal(0, 6)
+
+        frames = []
+        for driver in self._provider.drivers(self.year):
+            pace = track_base + driver["car_pace"] + driver["skill"]
+            if wet:
+                pace = pace * (1.09 + driver["wet_skill"])
+            times = pace + np.abs(rng.normal(0, 0.6, lap_count))
+            # A few slow laps (traffic, cool-downs) so the quick-lap filter has work to do
+            slow = rng.random(lap_count) < 0.12
+            times[slow] += rng.uniform(8, 30, slow.sum())
+
+            compounds = rng.choice(WET_COMPOUNDS if wet else DRY_COMPOUNDS, lap_count)
+            sector_split = np.array([0.32, 0.43, 0.25])
+            lap_time = pd.to_timedelta(np.round(times, 3), unit="s")
+            personal_best = np.zeros(lap_count, dtype=bool)
+            personal_best[int(np.argmin(times))] = True
+
+            frames.append(pd.DataFrame({
+                "Time": pd.to_timedelta(np.cumsum(times), unit="s"),
+                "Driver": driver["code"],
+                "DriverNumber": driver["number"],
+                "LapTime": lap_time,
+                "LapNumber": np.arange(1, lap_count + 1, dtype=float),
+                "Stint": 1.0,
+                "Sector1Time": pd.to_timedelta(np.round(times * sector_split[0], 3), unit="s"),
+                "Sector2Time": pd.to_timedelta(np.round(times * sector_split[1], 3), unit="s"),
+                "Sector3Time": pd.to_timedelta(np.round(times * sector_split[2], 3), unit="s"),
+                "IsPersonalBest": personal_best,
+                "Compound": compounds,
+                "TyreLife": np.arange(1, lap_count + 1, dtype=float),
+                "Team": driver["team"],
+                "Deleted": False,
+                "IsAccurate": ~slow,
+            }))
+
+        return Laps(pd.concat(frames, ignore_index=True), session=self)
+
+    def _build_results(self) -> pd.DataFrame:
+        config = self._config
+        rng = _rng(config, self.year, self.round_number, self.identifier, "results")
+        drivers = self._provider.drivers(self.year)
+        pace = np.array([d["car_pace"] + d["skill"] for d in drivers]) + rng.normal(0, 0.25, len(drivers))
+        order = np.argsort(pace, kind="stable")
+
+        rows = []
+        for position, idx in enumerate(order, start=1):
+            d = drivers[idx]
+            row = {
+                "DriverNumber": d["number"],
+                "Abbreviation": d["code"],
+                "FullName": d["full_name"],
+                "TeamName": d["team"],
+                "CountryCode": d["country_code"],
+                "Position": float(position),
+                "GridPosition": float(position),
+                "Status": "Finished",
+                "Points": 0.0,
+                "Q1": pd.NaT, "Q2": pd.NaT, "Q3": pd.NaT,
+            }
+            if self.identifier == "Q":
+                lap = config.base_lap_time_s + pace[idx]
+                row["Q1"] = pd.Timedelta(seconds=round(lap + 0.4, 3))
+                if position <= 15:
+                    row["Q2"] = pd.Timedelta(seconds=round(lap + 0.2, 3))
+                if position <= 10:
+                    row["Q3"] = pd.Timedelta(seconds=round(lap, 3))
+            elif self.identifier == "R":
+                if rng.random() < config.dnf_probability:
+                    row["Status"] = "Retired"
+                    row["Position"] = float("nan")
+                elif position > 12:
+                    row["Status"] = "+1 Lap"
+                row["Points"] = float(POINTS[position - 1]) if position <= len(POINTS) and row["Status"] != "Retired" else 0.0
+            rows.append(row)
+
+        results = pd.DataFrame(rows)
+        if self.identifier == "R":
+            # Retirements are classified at the back, like FastF1's results order
+            results = pd.concat([results[results["Status"] != "Retired"], results[results["Status"] == "Retired"]], ignore_index=True)
+        return results
+
+
+class SyntheticErgast:
+    """Stand-in for fastf1.ergast.Ergast, covering `get_driver_info(season=...)`."""
+
+    def __init__(self, provider: "SyntheticFastF1"):
+        self._provider = provider
+
+    def get_driver_info(self, season: int) -> pd.DataFrame:
+        return pd.DataFrame([
+            {
+                "driverCode": d["code"],
+                "givenName": d["full_name"].split()[0],
+                "familyName": d["full_name"].split()[-1],
+                "dateOfBirth": pd.Timestamp(d["date_of_birth"]),
+                "driverNationality": d["nationality"],
+            }
+            for d in self._provider.drivers(season)
+        ])
+
+
+class SyntheticApi:
+    """Stand-in for fastf1's api module, covering the `weather_data(path)` stream read."""
+
+    def __init__(self, provider: "SyntheticFastF1"):
+        self._provider = provider
+
+    def weather_data(self, path: str, response=None, livedata=None) -> Dict[str, list]:
+        year, round_number, identifier = path.strip("/").split("/")
+        self._provider.weather_reads.append((int(year), int(round_number), identifier))
+        session = SyntheticSession(self._provider, int(year), int(round_number), identifier)
+        return session._build_weather().to_dict(orient="list")
+
+
+class _SyntheticCache:
+    @staticmethod
+    def enable_cache(*args, **kwargs) -> None:
+        pass
+
+
+class SyntheticFastF1:
+    """Module-shaped provider: `get_event_schedule`, `get_session`, `Cache`, `Ergast` and `api`."""
+
+    Cache = _SyntheticCache
+
+    def __init__(self, config: SyntheticSeasonConfig = SyntheticSeasonConfig()):
+        self.config = config
+        self.loads: List[tuple] = []      # (year, round, session, laps, weather) for every load()
+        self.weather_reads: List[tuple] = []   # (year, round, session) for every weather-only api read
+        self.api = SyntheticApi(self)
+        self._drivers: Dict[int, List[Dict]] = {}
+
+    def Ergast(self, *args, **kwargs) -> SyntheticErgast:
+        return SyntheticErgast(self)
+
+    def get_event_schedule(self, year: int, include_testing: bool = True) -> pd.DataFrame:
+        rounds = range(1, self.config.rounds + 1)
+        schedule = pd.DataFrame({
+            "RoundNumber": list(rounds),
+            "Country": [f"Country {r}" for r in rounds],
+            "Location": [f"Circuit {r}" for r in rounds],
+            "EventName": [f"Synthetic Grand Prix {r:02d}" for r in rounds],
+            "EventDate": [pd.Timestamp(year=year, month=3, day=1) + pd.Timedelta(weeks=r) for r in rounds],
+            "EventFormat": "conventional",
+        })
+        if include_testing:
+            testing = pd.DataFrame([{
+                "RoundNumber": 0, "Country": "Testing", "Location": "Testing",
+                "EventName": "Pre-Season Testing", "EventDate": pd.Timestamp(year=year, month=2, day=20),
+                "EventFormat": "testing",
+            }])
+            schedule = pd.concat([testing, schedule], ignore_index=True)
+        return schedule
+
+    def get_session(self, year: int, gp: Union[int, str], identifier: str) -> SyntheticSession:
+        return SyntheticSession(self, year, self._round_number(year, gp), _normalise_identifier(identifier))
+
+    def event(self, year: int, round_number: int) -> pd.Series:
+        schedule = self.get_event_schedule(year, include_testing=False)
+        return schedule.loc[schedule["RoundNumber"] == round_number].iloc[0]
+
+    def drivers(self, year: int) -> List[Dict]:
+        """The season's grid: two drivers per team, with stable per-season pace traits."""
+        if year not in self._drivers:
+            rng = _rng(self.config, year, "grid")
+            team_pace = {team: rng.normal(0, 0.6) for team in TEAMS}
+            grid = []
+            for i in range(self.config.drivers):
+                team = TEAMS[(i // 2) % len(TEAMS)]
+                grid.append({
+                    "code": f"D{i + 1:02d}",
+                    "number": str(i + 1),
+                    "full_name": f"Driver {i + 1:02d}",
+                    "team": team,
+                    "country_code": "SYN",
+                    "nationality": "Synthetic",
+                    "date_of_birth": f"{1990 + i % 10}-01-{1 + i % 28:02d}",
+                    "car_pace": team_pace[team],
+                    "skill": rng.normal(0, 0.15),
+                    "wet_skill": rng.normal(0, 0.02),
+                })
+            self._drivers[year] = grid
+        return self._drivers[year]
+
+    def _round_number(self, year: int, gp: Union[int, str]) -> int:
+        if isinstance(gp, (int, np.integer)):
+            return int(gp)
+        schedule = self.get_event_schedule(year, include_testing=False)
+        match = schedule.loc[schedule["EventName"] == gp, "RoundNumber"]
+        if match.empty:
+            raise ValueError(f"No synthetic event named '{gp}' in {year}")
+        return int(match.iloc[0])
+
+
+def _normalise_identifier(identifier: str) -> str:
+    by_name = {name: code for code, name in SESSION_NAMES.items()}
+    return by_name.get(identifier, identifier)
+
+
+@contextmanager
+def use_synthetic_fastf1(provider: SyntheticFastF1, *modules):
+    """Point the given pipeline modules at `provider` instead of FastF1 for the block.
+
+    Swaps any module attribute that is the real `fastf1` package (however it was imported,
+    e.g. `import fastf1 as ff1`), fastf1's api module and any module-level `Ergast` class."""
+    from fastf1 import _api
+    from fastf1.ergast import Ergast
+
+    swapped = []
+    for module in modules:
+        for attr, value in list(vars(module).items()):
+            if value is fastf1:
+                swapped.append((module, attr, value))
+                setattr(module, attr, provider)
+            elif value is _api:
+                swapped.append((module, attr, value))
+                setattr(module, attr, provider.api)
+            elif value is Ergast:
+                swapped.append((module, attr, value))
+                setattr(module, attr, provider.Ergast)
+    try:
+        yield provider
+    finally:
+        for module, attr, value in swapped:
+            setattr(module, attr, value)
@@ -0,0 +1,344 @@
+"""Background seasonal wet analyses, queued through the API.
+
+Jobs are rows in the `analysis_jobs` table and run in a local process pool, so a
+season that takes tens of minutes never blocks an API worker. Rows outlive the
+process: a running job records its worker (host:pid) and keeps a heartbeat lease, and
+on startup queued jobs and running jobs whose worker is gone are submitted again and
+resume from their per-event checkpoints. Jobs still held by a live worker, e.g. in
+another API process, are left alone. Workers record each finished event on the job row,
+which is what /season/{year}/stream relays to its clients.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.cache import CACHE
+from app.core.config import settings
+from app.core.database import get_db
+from app.schemas.analysis import AnalysisJob
+
+_executor: Optional[ProcessPoolExecutor] = None
+# Succeeded-job count the analysis-derived CACHE entries were last checked against
+_cache_generation: Optional[int] = None
+
+
+class AnalysisJobService:
+    @staticmethod
+    def enqueue(year: int) -> AnalysisJob:
+        """Queue an analysis of `year`. An already queued or running job for that season is returned instead."""
+        with get_db() as conn:
+            cursor = conn.cursor()
+            # The partial unique index on active jobs per season makes this check-and-insert
+            # atomic, including against other API processes
+            while True:
+                cursor.execute("""
+                    INSERT INTO analysis_jobs (season, status, created_at) VALUES (?, 'queued', ?)
+                    ON CONFLICT DO NOTHING
+                """, (year, _now()))
+                if cursor.rowcount == 1:
+                    job_id = cursor.lastrowid
+                    break
+                cursor.execute("""
+                    SELECT * FROM analysis_jobs
+                    WHERE season = ? AND status IN ('queued', 'running')
+                """, (year,))
+                existing = cursor.fetchone()
+                if existing and _requeue_if_abandoned(cursor, existing):
+                    job_id = existing["id"]
+                    break
+                if existing:
+                    return _to_job(existing)
+                # The active job finished between the two statements; try again
+
+        _submit(job_id, year)
+        return AnalysisJobService.get_job(job_id)
+
+    @staticmethod
+    def get_active_job(year: int) -> Optional[AnalysisJob]:
+        """The season's queued or running job, if there is one."""
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM analysis_jobs WHERE season = ? AND status IN ('queued', 'running')", (year,))
+            row = cursor.fetchone()
+            return _to_job(row) if row else None
+
+    @staticmethod
+    def get_job(job_id: int) -> Optional[AnalysisJob]:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM analysis_jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            return _to_job(row) if row else None
+
+    @staticmethod
+    def get_job_progress(job_id: int) -> Tuple[Optional[AnalysisJob], Optional[Dict[str, Any]]]:
+        """The job and the latest progress update its worker recorded (None before the first event)."""
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM analysis_jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+        if row is None:
+            return None, None
+        return _to_job(row), json.loads(row["progress"]) if row["progress"] else None
+
+    @staticmethod
+    def sync_analysis_cache() -> None:
+        """
+        Drop this process's cached responses built from the analysis files if a job has
+        succeeded anywhere since the last check.
+
+        Jobs finish in worker processes and may be enqueued by any API process, so the
+        signal is the succeeded-job count in the shared database, checked on read.
+        """
+        global _cache_generation
+        with get_db() as conn:
+            generation = conn.execute(
+                "SELECT COUNT(*) FROM analysis_jobs WHERE status = 'succeeded'"
+            ).fetchone()[0]
+        if generation != _cache_generation:
+            _invalidate_analysis_cache()
+            _cache_generation = generation
+
+    @staticmethod
+    def resume_unfinished() -> int:
+        """Resubmit queued jobs and running jobs whose worker is gone. Returns how many.
+
+        Runs on every API process startup, so a job another live process is running
+        keeps its worker instead of being run a second time."""
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM analysis_jobs WHERE status = 'running'")
+            for row in cursor.fetchall():
+                _requeue_if_abandoned(cursor, row)
+            cursor.execute("SELECT id, season FROM analysis_jobs WHERE status = 'queued' ORDER BY id")
+            jobs = [(row["id"], row["season"]) for row in cursor.fetchall()]
+
+        for job_id, year in jobs:
+            _submit(job_id, year)
+        if jobs:
+            logging.info(f"Resumed {len(jobs)} unfinished analysis jobs")
+        return len(jobs)
+
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_alive(owner: Optional[str], heartbeat_at: Optional[str]) -> bool:
+    """True if a running job's worker still holds its lease: the heartbeat is recent and,
+    for a worker on this host, its process still exists."""
+    if not owner or not heartbeat_at:
+        return False
+    heartbeat = datetime.strptime(heartbeat_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    if (datetime.now(timezone.utc) - heartbeat).total_seconds() > settings.ANALYSIS_JOB_LEASE_SECONDS:
+        return False
+
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        pass  # exists under another user, or not a pid we wrote; trust the lease
+    return True
+
+
+def _requeue_if_abandoned(cursor, row) -> bool:
+    """Put a running job whose worker is gone back in the queue. True if it was."""
+    if row["status"] != "running" or _owner_alive(row["owner"], row["heartbeat_at"]):
+        return False
+    # Only if the worker did not refresh its lease in the meantime
+    cursor.execute("""
+        UPDATE analysis_jobs SET status = 'queued', started_at = NULL, owner = NULL, heartbeat_at = NULL
+        WHERE id = ? AND status = 'running' AND heartbeat_at IS ?
+    """, (row["id"], row["heartbeat_at"]))
+    if cursor.rowcount == 1:
+        logging.info(f"Analysis job {row['id']} ({row['season']}) lost its worker {row['owner']}; queued again")
+    return cursor.rowcount == 1
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn, not fork: the API process is multi-threaded
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.ANALYSIS_JOB_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _discard_executor() -> None:
+    """Drop a pool whose workers died (OOM, hard kill); the next _get_executor starts a fresh one."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _submit(job_id: int, year: int) -> None:
+    """Hand the job to the pool, replacing the pool once if it is broken.
+
+    If it still cannot be submitted the row is marked failed here, so a queued job is
+    never left without a worker (the active-job index would hand it to every later
+    enqueue of the season)."""
+    try:
+        try:
+            future = _get_executor().submit(_run_job, job_id, year)
+        except BrokenProcessPool:
+            logging.warning("Analysis worker pool is broken; starting a new one")
+            _discard_executor()
+            future = _get_executor().submit(_run_job, job_id, year)
+    except Exception as e:
+        logging.error(f"Could not submit analysis job {job_id} ({year}): {e}")
+        _finish(job_id, "failed", 0.0, error=f"Could not start a worker: {e}")
+        return
+    future.add_done_callback(lambda f: _on_job_done(job_id, f))
+
+
+def _run_job(job_id: int, year: int) -> None:
+    """Worker-process body: claim the job, run the season and record the outcome."""
+    # Imported here so the API process never loads FastF1 for this module
+    from app.services.wet import F1Service, ANALYSIS_DIR
+    from app.services.wet_checkpoints import EventCheckpoints
+
+    owner = _worker_id()
+    with get_db() as conn:
+        cursor = conn.cursor()
+        # Claim atomically so a job submitted twice (e.g. by two API processes on restart) runs once
+        now = _now()
+        cursor.execute("""
+            UPDATE analysis_jobs SET status = 'running', started_at = ?, owner = ?, heartbeat_at = ?
+            WHERE id = ? AND status = 'queued'
+        """, (now, owner, now, job_id))
+        if cursor.rowcount == 0:
+            return
+
+    stop_heartbeat = threading.Event()
+    threading.Thread(target=_heartbeat, args=(job_id, owner, stop_heartbeat), daemon=True).start()
+    started = time.perf_counter()
+    checkpoints = EventCheckpoints(year, include_practice=True)
+    try:
+        results = []
+        for update in F1Service().iter_seasonal_wet_performance(
+            year, include_practice=True, checkpoints=checkpoints, resume=True
+        ):
+            if update["type"] == "start":
+                _record_progress(job_id, 0, update["events_total"], None)
+            elif update["type"] == "event":
+                _record_progress(job_id, update["events_done"], update["events_total"], _progress_payload(update))
+            elif update["type"] == "complete":
+                results = update["standings"]
+        if results:
+            output_file = ANALYSIS_DIR / f"{year}.json"
+            tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(results, f, indent=2)
+            os.replace(tmp_file, output_file)
+        checkpoints.clear()
+        _finish(job_id, "succeeded", time.perf_counter() - started,
+                result="written" if results else "no data", owner=owner)
+    except Exception as e:
+        logging.error(f"Analysis job {job_id} ({year}) failed: {e}")
+        _finish(job_id, "failed", time.perf_counter() - started, error=str(e), owner=owner)
+    finally:
+        stop_heartbeat.set()
+
+
+def _heartbeat(job_id: int, owner: str, stop: threading.Event) -> None:
+    """Worker-process thread refreshing the job's lease until the job finishes."""
+    while not stop.wait(settings.ANALYSIS_JOB_LEASE_SECONDS / 4):
+        try:
+            with get_db() as conn:
+                conn.execute(
+                    "UPDATE analysis_jobs SET heartbeat_at = ? WHERE id = ? AND owner = ? AND status = 'running'",
+                    (_now(), job_id, owner),
+                )
+        except sqlite3.Error as e:
+            logging.warning(f"Could not refresh the lease of analysis job {job_id}: {e}")
+
+
+def _record_progress(job_id: int, events_done: int, events_total: int, progress: Optional[Dict[str, Any]]) -> None:
+    with get_db() as conn:
+        conn.execute(
+            "UPDATE analysis_jobs SET events_done = ?, events_total = ?, progress = ? WHERE id = ?",
+            (events_done, events_total, json.dumps(progress) if progress is not None else None, job_id),
+        )
+
+
+def _progress_payload(update: Dict[str, Any]) -> Dict[str, Any]:
+    """An event update with compact standings; only the analysis file carries every session."""
+    payload = dict(update)
+    payload["standings"] = [
+        {
+            "rank": row["rank"],
+            "driver_code": row["driver_code"],
+            "full_name": row["full_name"],
+            "team_name": row["team_name"],
+            "average_wet_to_dry_delta": row["average_wet_to_dry_delta"],
+            "sessions_analyzed_count": row["sessions_analyzed_count"],
+        }
+        for row in update["standings"]
+    ]
+    return payload
+
+
+def _finish(job_id: int, status: str, duration: float, result: Optional[str] = None, error: Optional[str] = None,
+            owner: Optional[str] = None) -> None:
+    """Record the outcome. With `owner`, only while that worker still holds the job (a
+    worker that lost its lease must not overwrite the run that replaced it)."""
+    with get_db() as conn:
+        conn.execute("""
+            UPDATE analysis_jobs
+            SET status = ?, result = ?, error = ?, finished_at = ?, duration_seconds = ?
+            WHERE id = ? AND (? IS NULL OR owner = ?)
+        """, (status, result, error, _now(), round(duration, 3), job_id, owner, owner))
+
+
+def _on_job_done(job_id: int, future: Future) -> None:
+    """Runs in the API process once the worker returns (or dies)."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        # The worker process itself died, so it could not record the failure
+        _finish(job_id, "failed", 0.0, error=f"Worker process failed: {error}")
+
+
+def _invalidate_analysis_cache() -> None:
+    """Drop cached responses built from the analysis files (season.py and the drivers wet route)."""
+    for key in list(CACHE):
+        if key.startswith(("analysis_", "driver_", "wet_")):
+            CACHE.pop(key, None)
+
+
+def _to_job(row) -> AnalysisJob:
+    return AnalysisJob(
+        id=row["id"],
+        season=row["season"],
+        status=row["status"],
+        result=row["result"],
+        error=row["error"],
+        created_at=row["created_at"],
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+        duration_seconds=row["duration_seconds"],
+        events_done=row["events_done"] or 0,
+        events_total=row["events_total"],
+    )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
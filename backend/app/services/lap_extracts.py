@@ -0,0 +1,128 @@
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from fastf1.events import Session
+
+APP_DIR = Path(__file__).resolve().parent.parent
+PIPELINE_CACHE_DIR = APP_DIR / "pipeline_cache"
+DEFAULT_EXTRACT_DIR = PIPELINE_CACHE_DIR / "extracts"
+
+# Bump when the stored columns change so stale extracts are re-extracted
+EXTRACT_VERSION = 1
+
+
+class SessionExtract:
+    """
+    The slice of a loaded FastF1 session the wet analysis reads: the session name, the
+    per-lap Driver / LapTime / Compound columns plus the lap validity flags, and each
+    driver's name, team and number. Mirrors the `.name`, `.laps` and `.get_driver()`
+    surface of a FastF1 Session.
+    """
+
+    def __init__(self, name: str, laps: pd.DataFrame, drivers: Dict[str, Dict[str, Any]]):
+        self.name = name
+        self.laps = laps
+        self.drivers = drivers
+
+    def get_driver(self, identifier: str) -> Dict[str, Any]:
+        return self.drivers[identifier]
+
+    @classmethod
+    def from_session(cls, session: Session) -> "SessionExtract":
+        laps = session.laps
+        frame = pd.DataFrame({
+            'Driver': laps['Driver'].to_numpy(),
+            'LapTime': laps['LapTime'].to_numpy(),
+            'Compound': laps['Compound'].to_numpy(),
+            'IsAccurate': laps['IsAccurate'].fillna(False).astype(bool).to_numpy() if 'IsAccurate' in laps else False,
+            'Deleted': laps['Deleted'].fillna(False).astype(bool).to_numpy() if 'Deleted' in laps else False,
+        })
+
+        drivers = {}
+        results = session.results
+        if results is not None and not results.empty:
+            for _, row in results.iterrows():
+                drivers[row['Abbreviation']] = {
+                    'FullName': row['FullName'],
+                    'TeamName': row['TeamName'],
+                    'DriverNumber': row['DriverNumber'],
+                }
+        return cls(session.name, frame, drivers)
+
+
+class LapExtractStore:
+    """
+    Compact per-session `.npz` files of SessionExtract data under `{root}/{year}/{event}/`.
+
+    Once a session is extracted the wet analysis never deserializes its FastF1 pickle
+    again, so reruns with a different threshold or baseline rule are cheap.
+    """
+
+    def __init__(self, root: Path = DEFAULT_EXTRACT_DIR):
+        self.root = Path(root)
+
+    def load(self, year: int, event_name: str, session_name: str) -> Optional[SessionExtract]:
+        path = self._path(year, event_name, session_name)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data['version']) != EXTRACT_VERSION:
+                    return None
+                compound = data['compound'].astype(object)
+                compound[compound == ''] = None
+                laps = pd.DataFrame({
+                    'Driver': data['driver'].astype(object),
+                    'LapTime': data['lap_time_ns'].view('timedelta64[ns]'),
+                    'Compound': compound,
+                    'IsAccurate': data['is_accurate'],
+                    'Deleted': data['deleted'],
+                })
+                drivers = {
+                    str(code): {'FullName': str(full_name), 'TeamName': str(team_name), 'DriverNumber': str(number)}
+                    for code, full_name, team_name, number in zip(
+                        data['info_driver'], data['info_full_name'], data['info_team_name'], data['info_driver_number']
+                    )
+                }
+                return SessionExtract(str(data['name']), laps, drivers)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable lap extract {path}: {e}")
+            return None
+
+    def save(self, year: int, event_name: str, session_name: str, extract: SessionExtract) -> None:
+        laps = extract.laps
+        drivers = extract.drivers
+        arrays = {
+            'version': np.array(EXTRACT_VERSION),
+            'name': np.array(extract.name),
+            'driver': laps['Driver'].astype(str).to_numpy(dtype=str),
+            # NaT is stored as its int64 sentinel and round-trips back to NaT
+            'lap_time_ns': pd.to_timedelta(laps['LapTime']).to_numpy(dtype='timedelta64[ns]').view('int64'),
+            'compound': laps['Compound'].fillna('').astype(str).to_numpy(dtype=str),
+            'is_accurate': laps['IsAccurate'].to_numpy(dtype=bool),
+            'deleted': laps['Deleted'].to_numpy(dtype=bool),
+            'info_driver': np.array(list(drivers), dtype=str),
+            'info_full_name': np.array([str(d['FullName']) for d in drivers.values()], dtype=str),
+            'info_team_name': np.array([str(d['TeamName']) for d in drivers.values()], dtype=str),
+            'info_driver_number': np.array([str(d['DriverNumber']) for d in drivers.values()], dtype=str),
+        }
+
+        path = self._path(year, event_name, session_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write lap extract {path}: {e}")
+
+    def _path(self, year: int, event_name: str, session_name: str) -> Path:
+        slug = re.sub(r"[^a-z0-9]+", "_", event_name.lower()).strip("_")
+        return self.root / str(year) / slug / f"{session_name}.npz"
@@ -1,21 +1,49 @@
 """Runtime service for the Playground lap-time estimator.
 
-Pure JSON-lookup + arithmetic over the coefficient bundle produced offline by
-scripts/derive_playground_coefficients.py. No FastF1, no database. See
-playground-math-spec.md §11 for the math and response contract.
+Pure JSON-lookup + arithmetic over the coefficient bundles produced offline by
+scripts/derive_playground_coefficients.py, one per season and track. No FastF1,
+no database. See playground-math-spec.md §11 for the math and response contract.
 """
 
 import json
 import logging
+import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from app.core.cache import CACHE
+from app.core.config import settings
+from app.schemas.playground import DEFAULT_UNCERTAINTY_SAMPLES
+
+logger = logging.getLogger(__name__)
 
 APP_DIR = Path(__file__).resolve().parent.parent          # backend/app
 ANALYSIS_DIR = APP_DIR / "analysis_results"
+MANIFEST_PATH = APP_DIR / "pipeline_cache" / "playground_manifest.json"
 
 DEFAULT_YEAR = 2024
+DEFAULT_TRACK = "bahrain"
+
+# Bundles are playground_{year}_{track}.json. The original playground_{year}.json
+# files predate per-track bundles and are Bahrain; an explicit file wins over one.
+BUNDLE_FILE_RE = re.compile(r"^playground_(\d{4})(?:_([a-z0-9_]+))?\.json$")
+# Track slugs as they appear in bundle file names; anything else never reaches the filesystem
+TRACK_PATTERN = r"^[a-z0-9_]+$"
+
+# Grid tensor axes, in order, and the slot name each axis is addressed by
+GRID_AXES = ("drivers", "chassis", "engines")
+GRID_SLOTS = ("driver", "chassis", "engine")
+
+# Percentile bands reported by the uncertainty mode
+UNCERTAINTY_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Tolerance for "match" challenges without match_tolerance_seconds (same as the frontend)
+DEFAULT_MATCH_TOLERANCE = 0.1
 
 
 class UnknownIdentifierError(ValueError):
@@ -30,56 +58,241 @@ class UnknownIdentifierError(ValueError):
         super().__init__(f"Unknown {identifier_type}: '{value}'")
 
 
-class PlaygroundService:
+class UncertaintyUnavailableError(ValueError):
+    """Raised when a bundle was derived without bootstrap residuals (--bootstrap 0 or
+    before they existed), so no uncertainty bands can be drawn from it."""
 
-    @staticmethod
-    def load_coefficients(year: int = DEFAULT_YEAR) -> Dict[str, Any]:
-        """Load and cache the coefficient bundle. Raises FileNotFoundError if absent."""
-        cache_key = f"playground_{year}"
-        if cache_key in CACHE:
-            return CACHE[cache_key]
+    def __init__(self, year: int, track: str):
+        self.year = year
+        self.track = track
+        super().__init__(f"Playground coefficients for {year} {track} have no bootstrap residuals")
+
+
+class UncertaintySamplesError(ValueError):
+    """Raised when more uncertainty samples are requested than the bundle stores
+    bootstrap replicates; each sample is a distinct replicate."""
+
+    def __init__(self, year: int, track: str, samples: int, replicates: int):
+        self.year = year
+        self.track = track
+        self.samples = samples
+        self.replicates = replicates
+        super().__init__(f"{samples} samples requested but the {year} {track} coefficients "
+                         f"store {replicates} bootstrap replicates")
+
+
+class BundleNotFoundError(FileNotFoundError):
+    """Raised when no coefficient bundle exists for a season/track pair."""
+
+    def __init__(self, year: int, track: str):
+        self.year = year
+        self.track = track
+        super().__init__(f"Playground coefficients for {year} {track} not found in {ANALYSIS_DIR}")
+
+
+def _bundle_path(year: int, track: str) -> Path:
+    if not re.match(TRACK_PATTERN, track):
+        raise BundleNotFoundError(year, track)
+    path = ANALYSIS_DIR / f"playground_{year}_{track}.json"
+    if path.exists():
+        return path
+    legacy = ANALYSIS_DIR / f"playground_{year}.json"
+    if track == DEFAULT_TRACK and legacy.exists():
+        return legacy
+    raise BundleNotFoundError(year, track)
+
+
+class _BundleLRU:
+    """Loaded bundles keyed by (year, track), least recently used evicted first once
+    their estimated size passes `max_bytes`.
+
+    Each entry is a dict holding the parsed "bundle" plus anything derived from it
+    (the "grid" tensors, "residuals", the "choices" list), so evicting a bundle frees
+    those too. A bundle counts as its file size; derived values are added with
+    `attach`, which counts their arrays. Bundles load lazily on first use; a worker
+    only holds the ones it serves. The bundle being served is never evicted, even if
+    it alone is over the bound."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[int, str], Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[Tuple[int, str], int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, year: int, track: str) -> Dict[str, Any]:
+        key = (year, track)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        path = _bundle_path(year, track)
+        nbytes = path.stat().st_size
+        with open(path) as f:
+            entry = {"bundle": json.load(f)}
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self._sizes[key] = nbytes
+                self._total_bytes += nbytes
+            self._entries.move_to_end(key)
+            self._evict()
+            return self._entries[key]
+
+    def attach(self, year: int, track: str, entry: Dict[str, Any], name: str, value: Any) -> Any:
+        """Stores a value derived from the bundle on its entry, counting its arrays toward the bound."""
+        key = (year, track)
+        nbytes = _array_bytes(value)
+        with self._lock:
+            entry[name] = value
+            # An entry evicted meanwhile is only referenced by its caller; nothing to count
+            if self._entries.get(key) is entry:
+                self._sizes[key] += nbytes
+                self._total_bytes += nbytes
+                self._entries.move_to_end(key)
+                self._evict()
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def _evict(self) -> None:
+        # The most recently used entry (the one being served) always stays
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            evicted, _ = self._entries.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(evicted)
+            logger.info(f"Evicted Playground bundle {evicted[0]} {evicted[1]} from memory")
+
+
+def _array_bytes(value: Any) -> int:
+    """Bytes held by the numpy arrays in a (nested) derived value; other parts are small."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_array_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_array_bytes(v) for v in value)
+    return 0
+
+
+_LOADED_BUNDLES = _BundleLRU(settings.PLAYGROUND_BUNDLE_CACHE_BYTES)
+
+
+class _BundleManifest:
+    """Index of available bundles, persisted at MANIFEST_PATH.
 
-        path = ANALYSIS_DIR / f"playground_{year}.json"
-        if not path.exists():
-            raise FileNotFoundError(f"Playground coefficients for {year} not found at {path}")
+    Listing only stats the bundle files: a bundle is parsed (to read its metadata and
+    slot counts) when it is new or its size/mtime changed since the manifest was
+    written, and the manifest is rewritten only when something changed."""
 
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _summarize(path: Path, year: int, track: str, stat: os.stat_result) -> Dict[str, Any]:
         with open(path) as f:
             bundle = json.load(f)
+        meta = bundle.get("metadata", {})
+        return {
+            "year": year,
+            "track": track,
+            "file": path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "methodology_version": meta.get("method_version"),
+            "derived_at": meta.get("derived_at"),
+            "drivers": len(bundle.get("drivers", {})),
+            "chassis": len(bundle.get("chassis", {})),
+            "engines": len(bundle.get("engines", {})),
+            # Bootstrap replicates behind /lap?uncertainty=true; None if derived without them
+            "uncertainty_replicates": (bundle.get("uncertainty") or {}).get("replicates"),
+        }
+
+    @staticmethod
+    def entries() -> List[Dict[str, Any]]:
+        with _BundleManifest._lock:
+            try:
+                with open(MANIFEST_PATH) as f:
+                    indexed = json.load(f).get("bundles", {})
+            except (OSError, ValueError):
+                indexed = {}
+
+            bundles = {}
+            for path in sorted(ANALYSIS_DIR.glob("playground_*.json")):
+                match = BUNDLE_FILE_RE.match(path.name)
+                if not match:
+                    continue
+                stat = path.stat()
+                entry = indexed.get(path.name)
+                # Entries indexed before the uncertainty field are summarized again
+                if (not entry or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns
+                        or "uncertainty_replicates" not in entry):
+                    entry = _BundleManifest._summarize(
+                        path, int(match.group(1)), match.group(2) or DEFAULT_TRACK, stat,
+                    )
+                bundles[path.name] = entry
 
-        CACHE[cache_key] = bundle
-        return bundle
+            if bundles != indexed:
+                _BundleManifest._write(bundles)
+
+        # One entry per (year, track): an explicit per-track file shadows a legacy one
+        available = {}
+        for name, entry in bundles.items():
+            key = (entry["year"], entry["track"])
+            if key not in available or BUNDLE_FILE_RE.match(name).group(2):
+                available[key] = entry
+        return [
+            {k: v for k, v in entry.items() if k not in ("size", "mtime_ns")}
+            for _, entry in sorted(available.items())
+        ]
 
     @staticmethod
-    def simulate_lap(driver: str, chassis: str, engine: str, year: int = DEFAULT_YEAR) -> Dict[str, Any]:
-        """Estimate a Bahrain lap from a driver/chassis/engine combo (spec §3.1/§3.2/§11.1)."""
-        bundle = PlaygroundService.load_coefficients(year)
+    def _write(bundles: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = MANIFEST_PATH.with_name(f".{MANIFEST_PATH.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"bundles": bundles}, f, indent=2)
+            os.replace(tmp_path, MANIFEST_PATH)
+        except OSError as e:
+            # Read-only deployments still list bundles; they just re-stat (and re-parse) each time
+            logger.warning(f"Could not write Playground manifest {MANIFEST_PATH}: {e}")
+
 
-        if driver not in bundle["drivers"]:
-            raise UnknownIdentifierError("driver", driver)
-        if chassis not in bundle["chassis"]:
-            raise UnknownIdentifierError("chassis", chassis)
-        if engine not in bundle["engines"]:
-            raise UnknownIdentifierError("engine", engine)
+class PlaygroundService:
+
+    @staticmethod
+    def load_coefficients(year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """Load the coefficient bundle for a season and track, kept in the bundle LRU.
+        Raises BundleNotFoundError (a FileNotFoundError) if there is none."""
+        return _LOADED_BUNDLES.get(year, track)["bundle"]
+
+    @staticmethod
+    def list_bundles() -> List[Dict[str, Any]]:
+        """Every available bundle, from the manifest index (see _BundleManifest)."""
+        return _BundleManifest.entries()
+
+    @staticmethod
+    def simulate_lap(driver: str, chassis: str, engine: str,
+                     year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """Estimate a lap from a driver/chassis/engine combo (spec §3.1/§3.2/§11.1)."""
+        bundle = PlaygroundService.load_coefficients(year, track)
+        grid = PlaygroundService.load_grid(year, track)
+
+        # O(1) lookup in the precomputed grid; unknown ids raise here
+        index = PlaygroundService._combo_index(grid, driver, chassis, engine)
+        total = float(grid["totals"][index])
+        sectors = grid["sectors"][index].tolist()
 
         d = bundle["drivers"][driver]
         c = bundle["chassis"][chassis]
         e = bundle["engines"][engine]
 
         baseline = bundle["baseline"]["lap_time_seconds"]
-        proportions = bundle["baseline"]["sector_proportions"]
-        weights = bundle["sector_weights"]
-
-        total = baseline + d["delta"] + c["delta"] + e["delta"]
-
-        sectors = []
-        for i in range(3):
-            sector = (
-                baseline * proportions[i]
-                + e["delta"] * weights["engine"][i]
-                + c["delta"] * weights["chassis"][i]
-                + d["delta"] * weights["driver"][i]
-            )
-            sectors.append(sector)
 
         reference_pole = bundle["metadata"].get("reference_pole_time_seconds")
 
@@ -100,13 +313,269 @@ class PlaygroundService:
         }
 
     @staticmethod
-    def list_eligible_choices(year: int = DEFAULT_YEAR) -> Dict[str, Any]:
+    def _residuals(year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """The bundle's bootstrap residuals as (ids, replicates) matrices in grid axis
+        order, cached with the bundle.
+
+        Gaps are widened, never zero-filled: a replicate that never drew a component's
+        sessions (stored as null) takes a residual resampled from that component's other
+        replicates, and an id with no residuals at all (the hand-assigned Renault engine,
+        or one missing from the section) borrows the widest row of its kind. Raises
+        UncertaintyUnavailableError if a kind has no residuals to borrow from."""
+        entry = _LOADED_BUNDLES.get(year, track)
+        if "residuals" in entry:
+            return entry["residuals"]
+
+        uncertainty = entry["bundle"].get("uncertainty")
+        if not uncertainty or not uncertainty.get("replicates"):
+            raise UncertaintyUnavailableError(year, track)
+
+        grid = PlaygroundService.load_grid(year, track)
+        replicates = uncertainty["replicates"]
+        missing = [None] * replicates
+        fill_rng = np.random.default_rng(0)  # fixed, so the cached bands are reproducible
+        residuals = {"method": uncertainty.get("method"), "replicates": replicates}
+        for kind in GRID_AXES:
+            ids = grid[kind][0]
+            # dtype=float turns the stored nulls into NaN
+            rows = np.array([uncertainty[kind].get(key) or missing for key in ids], dtype=float)
+            observed = ~np.isnan(rows)
+            estimated = observed.any(axis=1)
+            if not estimated.any():
+                raise UncertaintyUnavailableError(year, track)
+
+            for n in np.flatnonzero(estimated & ~observed.all(axis=1)):
+                gaps = ~observed[n]
+                rows[n, gaps] = fill_rng.choice(rows[n, observed[n]], size=int(gaps.sum()))
+            if not estimated.all():
+                widest = rows[estimated][np.argmax(rows[estimated].std(axis=1))]
+                rows[~estimated] = widest
+            residuals[kind] = rows
+
+        return _LOADED_BUNDLES.attach(year, track, entry, "residuals", residuals)
+
+    @staticmethod
+    def lap_uncertainty(driver: str, chassis: str, engine: str, samples: int = DEFAULT_UNCERTAINTY_SAMPLES,
+                        seed: Optional[int] = None,
+                        year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """Percentile bands for a combo's total and sector times by Monte Carlo.
+
+        Each sample picks one stored bootstrap replicate and adds its driver, chassis and
+        engine residuals to the point deltas, so the three stay jointly drawn. All samples
+        are evaluated at once as arrays. Draws are distinct replicates, so `samples` can
+        be at most the bundle's replicate count; at that count every replicate is
+        evaluated once, which is the exact bootstrap distribution. Raises
+        UncertaintyUnavailableError if the bundle has no residuals and
+        UncertaintySamplesError if `samples` exceeds its replicates."""
+        grid = PlaygroundService.load_grid(year, track)
+        residuals = PlaygroundService._residuals(year, track)
+        bundle = PlaygroundService.load_coefficients(year, track)
+        i, j, k = PlaygroundService._combo_index(grid, driver, chassis, engine)
+
+        replicates = residuals["replicates"]
+        if samples > replicates:
+            raise UncertaintySamplesError(year, track, samples, replicates)
+        if samples == replicates:
+            drawn = np.arange(replicates)
+        else:
+            drawn = np.random.default_rng(seed).choice(replicates, size=samples, replace=False)
+        d = bundle["drivers"][driver]["delta"] + residuals["drivers"][i, drawn]
+        c = bundle["chassis"][chassis]["delta"] + residuals["chassis"][j, drawn]
+        e = bundle["engines"][engine]["delta"] + residuals["engines"][k, drawn]
+
+        baseline = grid["baseline"]
+        proportions = np.array(bundle["baseline"]["sector_proportions"], dtype=float)
+        weights = bundle["sector_weights"]
+        totals = baseline + d + c + e
+        sectors = (
+            baseline * proportions
+            + np.outer(e, weights["engine"])
+            + np.outer(c, weights["chassis"])
+            + np.outer(d, weights["driver"])
+        )
+
+        total_bands = np.percentile(totals, UNCERTAINTY_PERCENTILES)
+        sector_bands = np.percentile(sectors, UNCERTAINTY_PERCENTILES, axis=0)
+        return {
+            "method": residuals["method"],
+            "replicates": replicates,
+            "samples": samples,
+            "total_time_seconds": {f"p{p}": v for p, v in zip(UNCERTAINTY_PERCENTILES, total_bands.tolist())},
+            "sectors": [
+                {f"p{p}": v for p, v in zip(UNCERTAINTY_PERCENTILES, sector_bands[:, n].tolist())}
+                for n in range(3)
+            ],
+        }
+
+    @staticmethod
+    def load_grid(year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """Every driver x chassis x engine estimate, precomputed once per bundle and cached.
+
+        `totals` is a dense (drivers, chassis, engines) tensor of lap times and `sectors`
+        the matching (..., 3) tensor, summed in the same order as the single-lap formula
+        so lookups are bit-identical to it. Each of drivers/chassis/engines maps to
+        (ids, {id: axis index}). `sorted_totals` is the flattened grid, ascending, for
+        ranks and percentiles; `best_partners` holds each slot's fastest pairing."""
+        entry = _LOADED_BUNDLES.get(year, track)
+        if "grid" in entry:
+            return entry["grid"]
+
+        bundle = entry["bundle"]
+        baseline = bundle["baseline"]["lap_time_seconds"]
+        proportions = np.array(bundle["baseline"]["sector_proportions"], dtype=float)
+        weights = {slot: np.array(w, dtype=float) for slot, w in bundle["sector_weights"].items()}
+
+        grid = {"baseline": baseline}
+        deltas = []
+        for kind in GRID_AXES:
+            ids = list(bundle[kind])
+            grid[kind] = (ids, {key: i for i, key in enumerate(ids)})
+            deltas.append(np.array([bundle[kind][key]["delta"] for key in ids], dtype=float))
+        d = deltas[0][:, None, None]
+        c = deltas[1][None, :, None]
+        e = deltas[2][None, None, :]
+
+        grid["totals"] = baseline + d + c + e
+        grid["sectors"] = (
+            baseline * proportions
+            + e[..., None] * weights["engine"]
+            + c[..., None] * weights["chassis"]
+            + d[..., None] * weights["driver"]
+        )
+        grid["sorted_totals"] = np.sort(grid["totals"], axis=None)
+        grid["best_partners"] = {
+            slot: PlaygroundService._best_partners(grid, axis) for axis, slot in enumerate(GRID_SLOTS)
+        }
+
+        return _LOADED_BUNDLES.attach(year, track, entry, "grid", grid)
+
+    @staticmethod
+    def _best_partners(grid: Dict[str, Any], axis: int) -> List[Dict[str, Any]]:
+        """For every id on `axis`, the fastest pairing of the other two slots."""
+        totals = np.moveaxis(grid["totals"], axis, 0)
+        flat = totals.reshape(totals.shape[0], -1)
+        best = flat.argmin(axis=1)
+        other_axes = [a for a in range(3) if a != axis]
+
+        rows = []
+        for i, (key, flat_index) in enumerate(zip(grid[GRID_AXES[axis]][0], best.tolist())):
+            partner_index = np.unravel_index(flat_index, totals.shape[1:])
+            combo = [None, None, None]
+            combo[axis] = i
+            for a, j in zip(other_axes, partner_index):
+                combo[a] = int(j)
+            rows.append({
+                GRID_SLOTS[axis]: key,
+                **{GRID_SLOTS[a]: grid[GRID_AXES[a]][0][combo[a]] for a in other_axes},
+                "total_time_seconds": float(flat[i, flat_index]),
+            })
+        return sorted(rows, key=lambda row: row["total_time_seconds"])
+
+    @staticmethod
+    def _combo_index(grid: Dict[str, Any], driver: str, chassis: str, engine: str) -> Tuple[int, int, int]:
+        """Grid coordinates of a combo; raises UnknownIdentifierError for unknown ids."""
+        index = []
+        for kind, slot, value in zip(GRID_AXES, GRID_SLOTS, (driver, chassis, engine)):
+            try:
+                index.append(grid[kind][1][value])
+            except KeyError:
+                raise UnknownIdentifierError(slot, value) from None
+        return tuple(index)
+
+    @staticmethod
+    def simulate_laps(combos: Sequence[Tuple[str, str, str]],
+                      year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """Estimate many (driver, chassis, engine) laps at once — the same model as
+        simulate_lap, gathered from the precomputed grid with one fancy-index per tensor."""
+        grid = PlaygroundService.load_grid(year, track)
+        meta = PlaygroundService.load_coefficients(year, track)["metadata"]
+
+        index = np.array(
+            [PlaygroundService._combo_index(grid, *combo) for combo in combos], dtype=np.intp,
+        ).reshape(-1, 3)
+        coords = (index[:, 0], index[:, 1], index[:, 2])
+        totals = grid["totals"][coords]
+        sectors = grid["sectors"][coords]
+        baseline_deltas = totals - grid["baseline"]
+
+        results: List[Dict[str, Any]] = [
+            {
+                "driver": driver,
+                "chassis": chassis,
+                "engine": engine,
+                "total_time_seconds": total,
+                "sectors": sector_times,
+                "baseline_delta": delta,
+            }
+            for (driver, chassis, engine), total, sector_times, delta
+            in zip(combos, totals.tolist(), sectors.tolist(), baseline_deltas.tolist())
+        ]
+        return {
+            "results": results,
+            "baseline_seconds": grid["baseline"],
+            "reference_pole_time_seconds": meta.get("reference_pole_time_seconds"),
+            "methodology_version": meta.get("method_version"),
+        }
+
+    @staticmethod
+    def leaderboard(limit: int = 10, year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """The `limit` fastest combos in the grid, fastest first."""
+        grid = PlaygroundService.load_grid(year, track)
+        totals = grid["totals"]
+        limit = min(limit, totals.size)
+
+        flat = totals.ravel()
+        top = np.argpartition(flat, limit - 1)[:limit]
+        top = top[np.argsort(flat[top], kind="stable")]
+
+        entries = []
+        for rank, flat_index in enumerate(top.tolist(), start=1):
+            i, j, k = np.unravel_index(flat_index, totals.shape)
+            entries.append({
+                "rank": rank,
+                "driver": grid["drivers"][0][i],
+                "chassis": grid["chassis"][0][j],
+                "engine": grid["engines"][0][k],
+                "total_time_seconds": float(totals[i, j, k]),
+                "sectors": grid["sectors"][i, j, k].tolist(),
+            })
+        return {"combos": int(totals.size), "entries": entries}
+
+    @staticmethod
+    def percentile_rank(driver: str, chassis: str, engine: str,
+                        year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """Where a combo sits among every combo in the grid. Rank 1 is the fastest (ties
+        share a rank); `faster_than_percent` is the share of combos strictly slower."""
+        grid = PlaygroundService.load_grid(year, track)
+        total = float(grid["totals"][PlaygroundService._combo_index(grid, driver, chassis, engine)])
+
+        sorted_totals = grid["sorted_totals"]
+        faster = int(np.searchsorted(sorted_totals, total, side="left"))
+        slower = sorted_totals.size - int(np.searchsorted(sorted_totals, total, side="right"))
+        return {
+            "driver": driver,
+            "chassis": chassis,
+            "engine": engine,
+            "total_time_seconds": total,
+            "rank": faster + 1,
+            "combos": int(sorted_totals.size),
+            "faster_than_percent": 100.0 * slower / sorted_totals.size,
+        }
+
+    @staticmethod
+    def best_partners(slot: str, year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
+        """For each driver, chassis or engine (`slot`), its fastest pairing of the other two."""
+        grid = PlaygroundService.load_grid(year, track)
+        return {"slot": slot, "partners": grid["best_partners"][slot]}
+
+    @staticmethod
+    def list_eligible_choices(year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
         """Selectable drivers/chassis/engines for the frontend (spec §11.2). Fastest-first."""
-        cache_key = f"playground_choices_{year}"
-        if cache_key in CACHE:
-            return CACHE[cache_key]
+        entry = _LOADED_BUNDLES.get(year, track)
+        if "choices" in entry:
+            return entry["choices"]
 
-        bundle = PlaygroundService.load_coefficients(year)
+        bundle = entry["bundle"]
 
         drivers = sorted(
             ({"code": code, "name": v.get("name"), "team_2024": v.get("team_2024")}
@@ -124,9 +593,8 @@ class PlaygroundService:
             key=lambda x: bundle["engines"][x["code"]]["delta"],
         )
 
-        result = {"year": year, "drivers": drivers, "chassis": chassis, "engines": engines}
-        CACHE[cache_key] = result
-        return result
+        result = {"year": year, "track": track, "drivers": drivers, "chassis": chassis, "engines": engines}
+        return _LOADED_BUNDLES.attach(year, track, entry, "choices", result)
 
     @staticmethod
     def list_challenges() -> Any:
@@ -145,10 +613,147 @@ class PlaygroundService:
         return challenges
 
     @staticmethod
-    def get_methodology(year: int = DEFAULT_YEAR) -> Dict[str, Any]:
+    def get_challenge(challenge_id: str) -> Optional[Dict[str, Any]]:
+        """One challenge by id, or None if there is no such challenge."""
+        return next((c for c in PlaygroundService.list_challenges() if c.get("id") == challenge_id), None)
+
+    @staticmethod
+    def _challenge_bundle(challenge: Dict[str, Any]) -> Tuple[int, str]:
+        """(year, track) of the bundle a challenge is scored against.
+
+        A target lap time only means something at one track in one season, so each
+        challenge is pinned to its own bundle: its "year"/"track" fields, or the default
+        bundle it was written for."""
+        return challenge.get("year", DEFAULT_YEAR), challenge.get("track", DEFAULT_TRACK)
+
+    @staticmethod
+    def _challenge_rule(challenge: Dict[str, Any]) -> Tuple[str, float, Optional[float]]:
+        """(pass_criterion, target, match tolerance or None for "beat")."""
+        criterion = challenge.get("pass_criterion", "beat")
+        tolerance = challenge.get("match_tolerance_seconds", DEFAULT_MATCH_TOLERANCE) if criterion == "match" else None
+        return criterion, challenge["target_lap_time_seconds"], tolerance
+
+    @staticmethod
+    def _meets_target(totals: np.ndarray, challenge: Dict[str, Any]) -> np.ndarray:
+        """Boolean array: "beat" is strictly under the target, "match" within tolerance."""
+        criterion, target, tolerance = PlaygroundService._challenge_rule(challenge)
+        if criterion == "match":
+            return np.abs(totals - target) <= tolerance
+        return totals < target
+
+    @staticmethod
+    def _locked_indexes(grid: Dict[str, Any], challenge: Dict[str, Any]) -> Dict[int, int]:
+        """{grid axis: index} for the challenge's locked slots."""
+        locked = {}
+        for axis, (kind, slot) in enumerate(zip(GRID_AXES, GRID_SLOTS)):
+            value = challenge.get("locked", {}).get(slot)
+            if value is None:
+                continue
+            if value not in grid[kind][1]:
+                raise UnknownIdentifierError(slot, value)
+            locked[axis] = grid[kind][1][value]
+        return locked
+
+    @staticmethod
+    def _challenge_summary(challenge: Dict[str, Any]) -> Dict[str, Any]:
+        criterion, target, tolerance = PlaygroundService._challenge_rule(challenge)
+        year, track = PlaygroundService._challenge_bundle(challenge)
+        return {
+            "challenge_id": challenge["id"],
+            "year": year,
+            "track": track,
+            "pass_criterion": criterion,
+            "target_lap_time_seconds": target,
+            "match_tolerance_seconds": tolerance,
+        }
+
+    @staticmethod
+    def evaluate_challenge(challenge: Dict[str, Any], combos: Sequence[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """Pass/fail for submitted combos, on the challenge's own bundle. A combo passes
+        only if it keeps the challenge's locked slots and its lap meets the target."""
+        grid = PlaygroundService.load_grid(*PlaygroundService._challenge_bundle(challenge))
+        locked = PlaygroundService._locked_indexes(grid, challenge)
+
+        index = np.array(
+            [PlaygroundService._combo_index(grid, *combo) for combo in combos], dtype=np.intp,
+        ).reshape(-1, 3)
+        totals = grid["totals"][index[:, 0], index[:, 1], index[:, 2]]
+
+        respects_locks = np.ones(len(combos), dtype=bool)
+        for axis, locked_index in locked.items():
+            respects_locks &= index[:, axis] == locked_index
+        passed = respects_locks & PlaygroundService._meets_target(totals, challenge)
+        gaps = totals - challenge["target_lap_time_seconds"]
+
+        results = [
+            {
+                "driver": driver,
+                "chassis": chassis,
+                "engine": engine,
+                "total_time_seconds": total,
+                "gap_seconds": gap,
+                "respects_locks": ok,
+                "passed": p,
+            }
+            for (driver, chassis, engine), total, gap, ok, p
+            in zip(combos, totals.tolist(), gaps.tolist(), respects_locks.tolist(), passed.tolist())
+        ]
+        return {
+            **PlaygroundService._challenge_summary(challenge),
+            "passed_count": int(passed.sum()),
+            "results": results,
+        }
+
+    @staticmethod
+    def solve_challenge(challenge: Dict[str, Any], limit: Optional[int] = None) -> Dict[str, Any]:
+        """Every combo that passes the challenge on its own bundle, best first: fastest for
+        "beat", closest to the target for "match". Locked slots are applied as a mask
+        over the grid."""
+        grid = PlaygroundService.load_grid(*PlaygroundService._challenge_bundle(challenge))
+        totals = grid["totals"]
+
+        allowed = np.ones(totals.shape, dtype=bool)
+        for axis, locked_index in PlaygroundService._locked_indexes(grid, challenge).items():
+            axis_mask = np.zeros(totals.shape[axis], dtype=bool)
+            axis_mask[locked_index] = True
+            allowed &= np.expand_dims(axis_mask, tuple(a for a in range(3) if a != axis))
+        passing = allowed & PlaygroundService._meets_target(totals, challenge)
+
+        coords = np.nonzero(passing)
+        passing_totals = totals[coords]
+        gaps = passing_totals - challenge["target_lap_time_seconds"]
+        criterion = PlaygroundService._challenge_rule(challenge)[0]
+        order = np.argsort(np.abs(gaps) if criterion == "match" else passing_totals, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+
+        drivers, chassis, engines = (grid[kind][0] for kind in GRID_AXES)
+        solutions = [
+            {
+                "driver": drivers[coords[0][n]],
+                "chassis": chassis[coords[1][n]],
+                "engine": engines[coords[2][n]],
+                "total_time_seconds": float(passing_totals[n]),
+                "gap_seconds": float(gaps[n]),
+            }
+            for n in order.tolist()
+        ]
+        return {
+            **PlaygroundService._challenge_summary(challenge),
+            "combos_considered": int(allowed.sum()),
+            "solution_count": int(passing.sum()),
+            "optimal": solutions[0] if solutions else None,
+            "solutions": solutions,
+        }
+
+    @staticmethod
+    def get_methodology(year: int = DEFAULT_YEAR, track: str = DEFAULT_TRACK) -> Dict[str, Any]:
         """Methodology metadata for the 'how this was calculated' panel (spec §11.3)."""
-        bundle = PlaygroundService.load_coefficients(year)
+        bundle = PlaygroundService.load_coefficients(year, track)
         meta = bundle["metadata"]
+        season = meta.get("season", year)
+        track_name = str(meta.get("track", track)).replace("_", " ").title()
+        hand_assigned = [e.get("manufacturer", code) for code, e in bundle["engines"].items() if e.get("note")]
         return {
             "methodology_version": meta.get("method_version"),
             "track": meta.get("track"),
@@ -158,8 +763,9 @@ class PlaygroundService:
             "reference_pole_time_seconds": meta.get("reference_pole_time_seconds"),
             "description": (
                 "A fan-built plausibility calculator, not a physics or ML model. Lap time is a "
-                "baseline (median 2024 Bahrain Q3 time) plus additive driver, chassis, and engine "
-                "deltas derived from real 2024 qualifying data. Deltas attribute to three sectors "
-                "via hand-tuned weights. The Renault engine delta is hand-assigned."
+                f"baseline (median {season} {track_name} Q3 time) plus additive driver, chassis, and engine "
+                f"deltas derived from real {season} qualifying data. Deltas attribute to three sectors "
+                "via hand-tuned weights."
+                + "".join(f" The {name} engine delta is hand-assigned." for name in hand_assigned)
             ),
         }
@@ -0,0 +1,126 @@
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import fastf1 as ff1
+import pandas as pd
+from fastf1.events import Session
+
+try:
+    # Private module: the weather-only read below falls back to Session.load without it
+    from fastf1 import _api as ff1_api
+except ImportError:
+    ff1_api = None
+
+# Loaded sessions are mostly their laps frame; a race is a few MB, so this holds a season's worth
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+SessionKey = Tuple[int, str, str, bool, bool]
+
+
+class SessionCache:
+    """
+    LRU of loaded FastF1 sessions, keyed on (year, event, session, laps, weather).
+
+    Bounded by an estimate of the sessions' in-memory size rather than by entry count.
+    A session loaded with more data than requested (e.g. laps+weather when only weather
+    is asked for) also satisfies the request, so nothing is deserialized twice.
+
+    `weather()` reads a session's weather stream on its own, without `Session.load`, so
+    the wet/dry prefilter never deserializes a session; the one `load()` happens only
+    for sessions whose laps are needed. That read goes through FastF1's private `_api`
+    (requirements.txt pins the version it was written against); if it is missing or
+    fails, the session is loaded with weather only instead. Weather frames are a few
+    tens of KB each and are kept outside the byte bound until `clear()`.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._sessions: "OrderedDict[SessionKey, Tuple[Session, int]]" = OrderedDict()
+        self._weather: "dict[Tuple[int, str, str], pd.DataFrame]" = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.weather_reads = 0
+
+    def load(self, year: int, event_name: str, session_name: str, laps: bool = True, weather: bool = True) -> Session:
+        """Returns the loaded session, loading it through FastF1 only on a cache miss."""
+        cached = self._lookup(year, event_name, session_name, laps, weather)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        session = ff1.get_session(year, event_name, session_name)
+        session.load(laps=laps, weather=weather, telemetry=False, messages=False)
+        self._store((year, event_name, session_name, laps, weather), session)
+        return session
+
+    def weather(self, year: int, event_name: str, session_name: str) -> pd.DataFrame:
+        """The session's weather data, from a cached load when there is one."""
+        key = (year, event_name, session_name)
+        if key in self._weather:
+            return self._weather[key]
+        for with_laps in (False, True):
+            cached = self._sessions.get((*key, with_laps, True))
+            if cached is not None:
+                return cached[0].weather_data
+
+        session = ff1.get_session(year, event_name, session_name)
+        try:
+            # Only the weather stream, as Session._load_weather_data reads it
+            weather = pd.DataFrame(ff1_api.weather_data(session.api_path))
+            if 'Rainfall' not in weather.columns:
+                raise ValueError(f"unexpected weather columns {list(weather.columns)}")
+        except Exception as e:
+            logging.warning(f"Weather-only read failed for {year} {event_name} {session_name} ({e}); "
+                            "loading the session's weather instead")
+            return self.load(year, event_name, session_name, laps=False, weather=True).weather_data
+
+        self.weather_reads += 1
+        self._weather[key] = weather
+        return weather
+
+    def clear(self) -> None:
+        self._sessions.clear()
+        self._weather.clear()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.weather_reads = 0
+
+    def _lookup(self, year: int, event_name: str, session_name: str, laps: bool, weather: bool) -> Optional[Session]:
+        # Exact key first, then any load that is a superset of the requested flags
+        for with_laps in dict.fromkeys((laps, True)):
+            for with_weather in dict.fromkeys((weather, True)):
+                key = (year, event_name, session_name, with_laps, with_weather)
+                if key in self._sessions:
+                    self._sessions.move_to_end(key)
+                    return self._sessions[key][0]
+        return None
+
+    def _store(self, key: SessionKey, session: Session) -> None:
+        nbytes = _estimate_bytes(session)
+        if nbytes > self.max_bytes:
+            logging.info(f"Session {key} (~{nbytes / 1e6:.0f} MB) exceeds the session cache bound; not cached")
+            return
+
+        self._sessions[key] = (session, nbytes)
+        self._total_bytes += nbytes
+        while self._total_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self._sessions.popitem(last=False)
+            self._total_bytes -= evicted_bytes
+
+
+def _estimate_bytes(session: Session) -> int:
+    """Approximate in-memory size of a loaded session from its data frames."""
+    total = 0
+    for attr in ('laps', 'weather_data', 'results'):
+        try:
+            frame = getattr(session, attr)
+        except Exception:
+            # FastF1 raises DataNotLoadedError for parts that were not requested
+            continue
+        if frame is not None:
+            total += int(frame.memory_usage(deep=True).sum())
+    return total
@@ -1,10 +1,18 @@
 import fastf1 as ff1
 from pathlib import Path
+import hashlib
 import json
 import logging
 import numpy as np
-from fastf1.events import Session
-from typing import Optional, List, Dict, Any
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fastf1.core import Laps
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+from .lap_extracts import LapExtractStore, SessionExtract, DEFAULT_EXTRACT_DIR, EXTRACT_VERSION
+from .session_cache import SessionCache, DEFAULT_MAX_BYTES
+from .wet_checkpoints import EventCheckpoints
+from .wet_verdicts import WetVerdictStore, RainSummary, summarize_rainfall, DEFAULT_VERDICT_DB
 
 APP_DIR = Path(__file__).resolve().parent.parent
 ANALYSIS_DIR = APP_DIR / "analysis_results"
@@ -15,29 +23,111 @@ cache_path = Path("ff1_cache")
 cache_path.mkdir(parents=True, exist_ok=True)
 ff1.Cache.enable_cache(cache_path)
 
+WET_COMPOUNDS = ['INTERMEDIATE', 'WET']
+
+# Service modules whose code decides an event's result
+EVENT_CODE_FILES = ('wet.py', 'session_cache.py', 'lap_extracts.py', 'wet_verdicts.py')
+
+# Driver info for a driver whose results row could not be read
+NO_DRIVER_INFO = {'full_name': 'N/A', 'team_name': 'N/A', 'driver_number': 'N/A'}
+
+
+def event_code_fingerprint(quicklap_threshold: float) -> str:
+    """Hash of the analysis code and options a single event's result depends on. Saved
+    with each event checkpoint, so a resumed run never mixes events from other code."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "extract_version": EXTRACT_VERSION,
+        "quicklap_threshold": quicklap_threshold,
+    }).encode())
+    services_dir = Path(__file__).resolve().parent
+    for name in EVENT_CODE_FILES:
+        digest.update((services_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def pick_quicklaps(laps: pd.DataFrame, threshold: float) -> pd.DataFrame:
+    """Laps faster than `threshold` x the fastest lap (FastF1's Laps.pick_quicklaps rule)."""
+    return laps[laps['LapTime'] < laps['LapTime'].min() * threshold]
+
+
+def compare_driver_pace(dry_laps: pd.DataFrame, wet_laps: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-driver dry vs wet pace for one wet session, as a single groupby per side.
+
+    Indexed by driver code in wet-session first-seen order, with columns dry_pace,
+    dry_laps, wet_pace, wet_laps (median seconds / lap counts), compound (modal wet
+    compound, ties to the alphabetically first like Series.mode) and delta (% slower
+    in the wet). Drivers with no dry laps are dropped.
+    """
+    dry = _pace_by_driver(dry_laps)
+    wet = _pace_by_driver(wet_laps)
+
+    compound_counts = (
+        wet_laps.groupby(['Driver', 'Compound'], sort=False).size()
+        .reset_index(name='count')
+        .sort_values(['count', 'Compound'], ascending=[False, True], kind='stable')
+    )
+    wet['compound'] = compound_counts.drop_duplicates('Driver').set_index('Driver')['Compound']
+    wet['compound'] = wet['compound'].fillna('N/A')
+
+    pace = wet.join(dry, how='inner', lsuffix='_wet', rsuffix='_dry')
+    pace = pace.rename(columns={
+        'pace_dry': 'dry_pace', 'laps_dry': 'dry_laps',
+        'pace_wet': 'wet_pace', 'laps_wet': 'wet_laps',
+    })
+    pace['delta'] = ((pace['wet_pace'] - pace['dry_pace']) / pace['dry_pace']) * 100
+    return pace
+
+
+def _pace_by_driver(laps: pd.DataFrame) -> pd.DataFrame:
+    """Median lap time in seconds and lap count per driver, in first-seen order."""
+    grouped = laps['LapTime'].dt.total_seconds().groupby(laps['Driver'], sort=False)
+    return pd.DataFrame({'pace': grouped.median(), 'laps': grouped.size()})
+
 
 class F1Service:
 
+    def __init__(
+        self,
+        workers: int = 1,
+        session_cache_bytes: int = DEFAULT_MAX_BYTES,
+        weather_prefilter: bool = True,
+        verdict_db: Optional[Path] = DEFAULT_VERDICT_DB,
+        extract_dir: Optional[Path] = DEFAULT_EXTRACT_DIR,
+        quicklap_threshold: float = Laps.QUICKLAP_THRESHOLD,
+    ):
+        # Number of processes used to analyse events in parallel; 1 keeps everything in-process
+        self.workers = max(1, workers)
+        self.session_cache_bytes = session_cache_bytes
+        # Per-run cache shared by baseline selection and the wet scan (cleared after each season)
+        self.sessions = SessionCache(max_bytes=session_cache_bytes)
+        # Two-phase mode: decide wet/dry from weather alone, load laps only for sessions that pass
+        self.weather_prefilter = weather_prefilter
+        self.verdict_db = verdict_db
+        self.verdicts = WetVerdictStore(verdict_db)
+        # Compact per-session lap extracts; once written, reruns don't deserialize FastF1 sessions
+        self.extract_dir = extract_dir
+        self.extracts = LapExtractStore(extract_dir) if extract_dir is not None else None
+        self.quicklap_threshold = quicklap_threshold
+
     def get_season(self, year: int) -> list[dict]:
         """Gets the F1 season schedule for a given year."""
         schedule = ff1.get_event_schedule(year, include_testing=False)
         return schedule.to_dict(orient="records")
 
-    def get_dry_baseline_session(self, year: int, event_name: str) -> Optional[Session]:
+    def get_dry_baseline_session(self, year: int, event_name: str) -> Optional[SessionExtract]:
         """Finds the first available fully dry practice session to use as a performance baseline."""
         for session_name in ['FP1', 'FP2', 'FP3']:
             try:
-                practice_session = ff1.get_session(year, event_name, session_name)
-                practice_session.load(laps=True, weather=True, telemetry=False, messages=False)
-
-                rain_series = practice_session.weather_data.get('Rainfall')
-                if rain_series is None or rain_series.empty:
+                rain = self.get_rain_summary(year, event_name, session_name)
+                if not rain.has_weather:
                     logging.warning(f"No rainfall data for {event_name} {session_name}")
                     continue
 
-                if not ((rain_series == True) | (rain_series > 0)).any():
+                if not rain.any_rain:
                     logging.info(f"Found dry baseline session for {event_name}: {session_name}")
-                    return practice_session
+                    return self.get_session_laps(year, event_name, session_name)
 
             except Exception as e:
                 logging.warning(f"Could not process {session_name} for {event_name} to find baseline: {e}")
@@ -46,100 +136,264 @@ class F1Service:
         logging.warning(f"Could not find any suitable dry baseline session for {event_name}")
         return None
 
-    def calculate_seasonal_wet_performance(self, year: int, include_practice=True) -> List[Dict[str, Any]]:
+    def get_rain_summary(self, year: int, event_name: str, session_name: str) -> RainSummary:
+        """
+        Wet/dry verdict for a session, from the verdict store when it has been seen before.
+
+        In weather-prefilter mode only the weather stream is read, without loading the
+        session, so a session that turns out to be needed is loaded once (laps only);
+        otherwise laps are loaded alongside so the later lap load is a session-cache hit.
+        """
+        rain = self.verdicts.get(year, event_name, session_name)
+        if rain is None:
+            if self.weather_prefilter:
+                weather = self.sessions.weather(year, event_name, session_name)
+            else:
+                weather = self.sessions.load(year, event_name, session_name, laps=True, weather=True).weather_data
+            rain = summarize_rainfall(weather)
+            self.verdicts.put(year, event_name, session_name, rain)
+        return rain
+
+    def get_session_laps(self, year: int, event_name: str, session_name: str) -> SessionExtract:
+        """The session's lap extract, extracting it from a FastF1 load on first use."""
+        extract = self.extracts.load(year, event_name, session_name) if self.extracts is not None else None
+        if extract is None:
+            session = self.sessions.load(year, event_name, session_name, laps=True, weather=False)
+            extract = SessionExtract.from_session(session)
+            if self.extracts is not None:
+                self.extracts.save(year, event_name, session_name, extract)
+        return extract
+
+    def calculate_seasonal_wet_performance(
+        self,
+        year: int,
+        include_practice=True,
+        checkpoints: Optional[EventCheckpoints] = None,
+        resume: bool = False,
+    ) -> List[Dict[str, Any]]:
         """
         Calculates driver performance in wet conditions compared to a dry baseline for a given season.
+
+        Runs iter_seasonal_wet_performance to completion and returns the final standings.
+        """
+        standings = []
+        for update in self.iter_seasonal_wet_performance(year, include_practice, checkpoints, resume):
+            if update["type"] == "complete":
+                standings = update["standings"]
+        return standings
+
+    def iter_seasonal_wet_performance(
+        self,
+        year: int,
+        include_practice=True,
+        checkpoints: Optional[EventCheckpoints] = None,
+        resume: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Incremental seasonal wet analysis. Yields a "start" update, one "event" update per
+        finished event (its session details plus standings over the events finished so far)
+        and a final "complete" update with the season standings.
+
+        Events are independent, so with `workers > 1` they are analysed in a process pool and
+        reported in completion order. Standings always merge events in schedule order, so the
+        final output is identical to a sequential run. With `checkpoints`, each event's result
+        is saved as it finishes; `resume=True` reuses saved events instead of starting again
+        from round 1.
         """
         logging.info(f"Starting detailed wet performance calculation for the {year} season...")
         schedule = ff1.get_event_schedule(year)
         races = schedule[schedule['EventFormat'] != 'testing'] if 'EventFormat' in schedule.columns else schedule
+        event_names = list(races['EventName'])
+
+        if checkpoints is not None and not resume:
+            checkpoints.clear()
+        fingerprint = event_code_fingerprint(self.quicklap_threshold) if checkpoints is not None else None
+
+        restored = {}
+        pending = []
+        for position, event_name in enumerate(event_names):
+            saved = checkpoints.load(position, event_name, fingerprint) if checkpoints is not None and resume else None
+            if saved is not None:
+                restored[position] = saved
+            else:
+                pending.append((position, event_name))
+        if resume:
+            logging.info(f"Resuming {year}: {len(restored)} events from checkpoints, {len(pending)} to analyse")
+
+        yield {"type": "start", "season": year, "events_total": len(event_names), "events_restored": len(restored)}
+
+        event_results = {}
+
+        def event_update(position: int, result, from_checkpoint: bool = False) -> Dict[str, Any]:
+            event_results[position] = result
+            if checkpoints is not None and not from_checkpoint:
+                checkpoints.save(position, event_names[position], result, fingerprint)
+            return {
+                "type": "event",
+                "season": year,
+                "event_name": event_names[position],
+                "from_checkpoint": from_checkpoint,
+                "events_done": len(event_results),
+                "events_total": len(event_names),
+                "session_details": result[0],
+                "standings": self._rank_event_results(event_results),
+            }
+
+        for position in sorted(restored):
+            yield event_update(position, restored[position], from_checkpoint=True)
+
+        if self.workers > 1 and len(pending) > 1:
+            logging.info(f"Analysing {len(pending)} events with {self.workers} worker processes")
+            failures = []
+            pool = ProcessPoolExecutor(max_workers=min(self.workers, len(pending)))
+            try:
+                futures = {
+                    pool.submit(_analyze_event_in_worker, self._event_config(), year, event_name, include_practice): (position, event_name)
+                    for position, event_name in pending
+                }
+                # Checkpoint in completion order; a failed event must not lose the others
+                for future in as_completed(futures):
+                    position, event_name = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logging.error(f"Event {event_name} failed: {e}")
+                        failures.append(e)
+                        continue
+                    yield event_update(position, result)
+            finally:
+                # Also reached when the consumer stops early; don't start events nobody will read
+                pool.shutdown(wait=True, cancel_futures=True)
+            if failures:
+                raise failures[0]
+        else:
+            try:
+                for position, event_name in pending:
+                    yield event_update(position, self.analyze_event(year, event_name, include_practice))
+                logging.info(f"Session cache: {self.sessions.hits} hits, {self.sessions.misses} loads, "
+                             f"{self.sessions.weather_reads} weather-only reads")
+            finally:
+                self.sessions.clear()
 
+        logging.info("--- Aggregating all season results ---")
+        yield {"type": "complete", "season": year, "standings": self._rank_event_results(event_results)}
+
+    def _rank_event_results(self, event_results: Dict[int, Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Merges per-event results in schedule order and ranks them."""
         driver_session_details = {} # ## Changed: More descriptive name, will store detailed objects
         driver_info = {}
 
-        for _, event in races.iterrows():
-            event_name = event['EventName']
-            logging.info(f"--- Processing Event: {event_name} ---")
+        # Schedule order, so first-seen driver info and per-driver session order match a sequential run
+        for position in sorted(event_results):
+            event_details, event_driver_info = event_results[position]
+            for driver, sessions_list in event_details.items():
+                if driver not in driver_session_details:
+                    driver_session_details[driver] = []
+                    driver_info[driver] = event_driver_info.get(driver, NO_DRIVER_INFO)
+                driver_session_details[driver].extend(sessions_list)
 
-            dry_baseline_session = self.get_dry_baseline_session(year, event_name)
-            if not dry_baseline_session:
-                logging.warning(f"Skipping {event_name} due to no valid dry baseline.")
-                continue
+        return self.rank_wet_performance(driver_session_details, driver_info)
 
-            dry_laps = dry_baseline_session.laps.pick_quicklaps()
+    def analyze_event(self, year: int, event_name: str, include_practice=True) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
+        """
+        Wet-vs-dry session details for a single event.
 
-            session_types = ['R', 'Q'] 
-            if include_practice:
-                 session_types.extend(['FP1', 'FP2', 'FP3'])
+        Returns (driver_session_details, driver_info) for this event only, both keyed by
+        driver code in first-seen order.
+        """
+        driver_session_details = {}
+        driver_info = {}
 
-            for session_type in session_types:
-                try:
-                    wet_session = ff1.get_session(year, event_name, session_type)
-                    wet_session.load(laps=True, weather=True, telemetry=False, messages=False)
+        logging.info(f"--- Processing Event: {event_name} ---")
 
-                    rain_series = wet_session.weather_data.get('Rainfall')
-                    if rain_series is None or not ((rain_series == True) | (rain_series > 0)).any():
-                        continue
-                    
-                    logging.info(f"Wet conditions detected for {event_name} {session_type}. Analyzing driver pace...")
+        dry_baseline_session = self.get_dry_baseline_session(year, event_name)
+        if not dry_baseline_session:
+            logging.warning(f"Skipping {event_name} due to no valid dry baseline.")
+            return driver_session_details, driver_info
+
+        dry_laps = pick_quicklaps(dry_baseline_session.laps, self.quicklap_threshold)
+
+        session_types = ['R', 'Q'] 
+        if include_practice:
+             session_types.extend(['FP1', 'FP2', 'FP3'])
+
+        for session_type in session_types:
+            try:
+                if not self.get_rain_summary(year, event_name, session_type).any_rain:
+                    continue
+
+                wet_session = self.get_session_laps(year, event_name, session_type)
+                
+                logging.info(f"Wet conditions detected for {event_name} {session_type}. Analyzing driver pace...")
+                
+                wet_laps = pick_quicklaps(
+                    wet_session.laps[wet_session.laps['Compound'].isin(WET_COMPOUNDS)],
+                    self.quicklap_threshold,
+                )
+                
+                if wet_laps.empty:
+                    continue
+
+                pace = compare_driver_pace(dry_laps, wet_laps)
+                for driver, dry_pace, dry_count, wet_pace, wet_count, compound, delta in zip(
+                    pace.index,
+                    pace['dry_pace'].to_numpy(),
+                    pace['dry_laps'].to_numpy(),
+                    pace['wet_pace'].to_numpy(),
+                    pace['wet_laps'].to_numpy(),
+                    pace['compound'].to_numpy(),
+                    pace['delta'].to_numpy(),
+                ):
+                    if driver not in driver_session_details:
+                        d_info = wet_session.get_driver(driver)
+                        # ## Added driver number to the stored info
+                        driver_info[driver] = {
+                            'full_name': d_info['FullName'], 
+                            'team_name': d_info['TeamName'],
+                            'driver_number': d_info['DriverNumber']
+                        }
+                        # Only once the info is in, so every detailed driver has an info entry
+                        driver_session_details[driver] = []
                     
-                    wet_laps = (
-                        wet_session.laps
-                        .pick_compounds(['INTERMEDIATE', 'WET'])
-                        .pick_quicklaps()
-                    )
+                    # ## Changed: Store a detailed dictionary for each session
+                    session_detail = {
+                        "session_name": f"{event_name} {session_type}",
+                        "dry_baseline_session_name": dry_baseline_session.name,
+                        "dry_lap_time_median": round(dry_pace, 3),
+                        "dry_laps_analyzed_count": int(dry_count),
+                        "wet_lap_time_median": round(wet_pace, 3),
+                        "wet_laps_analyzed_count": int(wet_count),
+                        "wet_compound_used": compound,
+                        "delta_percentage": round(delta, 2)
+                    }
                     
-                    if wet_laps.empty:
-                        continue
+                    driver_session_details[driver].append(session_detail)
+                    logging.info(f"  {driver}: Dry Pace={dry_pace:.3f}s ({dry_count} laps), Wet Pace={wet_pace:.3f}s ({wet_count} laps), Delta={delta:+.2f}%")
 
-                    drivers_in_wet_session = wet_laps['Driver'].unique()
-                    for driver in drivers_in_wet_session:
-                        driver_dry_laps = dry_laps.pick_driver(driver)
-                        if driver_dry_laps.empty:
-                            continue
-                        
-                        dry_pace = driver_dry_laps['LapTime'].dt.total_seconds().median()
-
-                        driver_wet_laps = wet_laps.pick_driver(driver)
-                        wet_pace = driver_wet_laps['LapTime'].dt.total_seconds().median()
-
-                        delta = ((wet_pace - dry_pace) / dry_pace) * 100
-                        
-                        if driver not in driver_session_details:
-                            driver_session_details[driver] = []
-                            d_info = wet_session.get_driver(driver)
-                            # ## Added driver number to the stored info
-                            driver_info[driver] = {
-                                'full_name': d_info['FullName'], 
-                                'team_name': d_info['TeamName'],
-                                'driver_number': d_info['DriverNumber']
-                            }
-                        
-                        # ## Changed: Store a detailed dictionary for each session
-                        session_detail = {
-                            "session_name": f"{event_name} {session_type}",
-                            "dry_baseline_session_name": dry_baseline_session.name,
-                            "dry_lap_time_median": round(dry_pace, 3),
-                            "dry_laps_analyzed_count": len(driver_dry_laps),
-                            "wet_lap_time_median": round(wet_pace, 3),
-                            "wet_laps_analyzed_count": len(driver_wet_laps),
-                            "wet_compound_used": driver_wet_laps['Compound'].mode()[0] if not driver_wet_laps.empty else 'N/A',
-                            "delta_percentage": round(delta, 2)
-                        }
-                        
-                        driver_session_details[driver].append(session_detail)
-                        logging.info(f"  {driver}: Dry Pace={dry_pace:.3f}s ({len(driver_dry_laps)} laps), Wet Pace={wet_pace:.3f}s ({len(driver_wet_laps)} laps), Delta={delta:+.2f}%")
+            except Exception as e:
+                logging.warning(f"Could not process {session_type} for {event_name}: {e}")
 
-                except Exception as e:
-                    logging.warning(f"Could not process {session_type} for {event_name}: {e}")
+        return driver_session_details, driver_info
 
-        logging.info("--- Aggregating all season results ---")
+    def _event_config(self) -> Dict[str, Any]:
+        """Constructor arguments a worker process needs to analyse events like this instance."""
+        return {
+            "session_cache_bytes": self.session_cache_bytes,
+            "weather_prefilter": self.weather_prefilter,
+            "verdict_db": self.verdict_db,
+            "extract_dir": self.extract_dir,
+            "quicklap_threshold": self.quicklap_threshold,
+        }
+
+    @staticmethod
+    def rank_wet_performance(driver_session_details: Dict[str, List[Dict[str, Any]]], driver_info: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Aggregates per-driver session details into the ranked season standings."""
         aggregated_results = []
         # ## Changed: Loop through the new detailed data structure
         for driver, sessions_list in driver_session_details.items():
             if sessions_list:
                 deltas = [dp['delta_percentage'] for dp in sessions_list]
-                info = driver_info.get(driver, {'full_name': 'N/A', 'team_name': 'N/A', 'driver_number': 'N/A'})
+                info = driver_info.get(driver, NO_DRIVER_INFO)
 
                 # ## Changed: Structure now matches the updated Pydantic model
                 aggregated_results.append({
@@ -238,4 +492,11 @@ class F1Service:
             "best_session": best_session,
             "worst_session": worst_session,
             "per_season": per_season,
-        }
\ No newline at end of file
+        }
+
+
+def _analyze_event_in_worker(config: Dict[str, Any], year: int, event_name: str, include_practice: bool):
+    """Process-pool entry point: analyses one event in a fresh, in-process F1Service.
+
+    Sessions never span events, so a cache scoped to the event loses no hits."""
+    return F1Service(**config).analyze_event(year, event_name, include_practice)
@@ -0,0 +1,82 @@
+import json
+import logging
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+APP_DIR = Path(__file__).resolve().parent.parent
+PIPELINE_CACHE_DIR = APP_DIR / "pipeline_cache"
+DEFAULT_CHECKPOINT_DIR = PIPELINE_CACHE_DIR / "checkpoints"
+
+# Bumped when checkpoints written by earlier code must not be reused
+# (2: events no longer contain drivers without a driver info entry)
+CHECKPOINT_VERSION = 2
+
+EventResult = Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, Any]]]
+
+
+class EventCheckpoints:
+    """
+    Per-event partial results of a seasonal wet analysis, one JSON file per event under
+    `{root}/{year}/`. Written atomically as each event finishes so a killed run can resume.
+
+    A checkpoint is only reused for the same event at the same schedule position, with
+    the same `include_practice` setting and CHECKPOINT_VERSION, and when it was written
+    under the same `fingerprint` (wet.event_code_fingerprint: the analysis code, the
+    extract version and the quick-lap threshold).
+    """
+
+    def __init__(self, year: int, include_practice: bool, root: Path = DEFAULT_CHECKPOINT_DIR):
+        self.year = year
+        self.include_practice = include_practice
+        self.directory = Path(root) / str(year)
+
+    def load(self, position: int, event_name: str, fingerprint: Optional[str] = None) -> Optional[EventResult]:
+        """The saved (session details, driver info) for this event, or None if not finished."""
+        path = self._path(position, event_name)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path) as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+        if (payload.get("version") != CHECKPOINT_VERSION
+                or payload.get("event_name") != event_name
+                or payload.get("include_practice") != self.include_practice
+                or payload.get("fingerprint") != fingerprint):
+            logging.info(f"Ignoring checkpoint {path.name}: written by other code or settings")
+            return None
+        return payload["session_details"], payload["driver_info"]
+
+    def save(self, position: int, event_name: str, result: EventResult, fingerprint: Optional[str] = None) -> None:
+        session_details, driver_info = result
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "year": self.year,
+            "event_name": event_name,
+            "include_practice": self.include_practice,
+            "fingerprint": fingerprint,
+            "session_details": session_details,
+            "driver_info": driver_info,
+        }
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(position, event_name)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Drop every checkpoint for the season (start over, or the final file is written)."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _path(self, position: int, event_name: str) -> Path:
+        slug = re.sub(r"[^a-z0-9]+", "_", event_name.lower()).strip("_")
+        return self.directory / f"{position:02d}_{slug}.json"
@@ -0,0 +1,142 @@
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+APP_DIR = Path(__file__).resolve().parent.parent
+PIPELINE_CACHE_DIR = APP_DIR / "pipeline_cache"
+DEFAULT_VERDICT_DB = PIPELINE_CACHE_DIR / "wet_verdicts.db"
+
+
+@dataclass(frozen=True)
+class RainSummary:
+    """
+    What a session's FastF1 `Rainfall` series said. Both fields are None when the
+    session had no usable weather data.
+
+    Consumers apply their own rule: the wet pipeline treats any rain sample as wet,
+    while the Playground derivation only looks at the wet fraction (advisory).
+    """
+    any_rain: Optional[bool]
+    rain_fraction: Optional[float]
+
+    @property
+    def has_weather(self) -> bool:
+        return self.any_rain is not None
+
+
+def summarize_rainfall(weather_data: Optional[pd.DataFrame]) -> RainSummary:
+    """Reduces a session's weather frame to a RainSummary."""
+    rain_series = weather_data.get('Rainfall') if weather_data is not None else None
+    if rain_series is None or rain_series.empty:
+        return RainSummary(any_rain=None, rain_fraction=None)
+
+    return RainSummary(
+        any_rain=bool(((rain_series == True) | (rain_series > 0)).any()),
+        rain_fraction=float(rain_series.astype(bool).mean()),
+    )
+
+
+class WetVerdictStore:
+    """
+    Persistent per-session rain summaries, keyed on (year, event name, session identifier).
+
+    Backed by SQLite so several analysis processes can share it, and so reruns can
+    decide wet/dry without loading even the weather data. With `path=None` verdicts
+    are only kept in memory.
+
+    A summary without weather data is not a verdict: it may just be a failed fetch, so
+    it is only remembered for the life of the store and the session is checked again
+    on the next run.
+    """
+
+    def __init__(self, path: Optional[Path] = DEFAULT_VERDICT_DB):
+        self.path = Path(path) if path is not None else None
+        self._memory: Dict[Tuple[int, str, str], RainSummary] = {}
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS session_rain (
+                        year INTEGER NOT NULL,
+                        event_name TEXT NOT NULL,
+                        session_name TEXT NOT NULL,
+                        any_rain INTEGER,
+                        rain_fraction REAL,
+                        recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (year, event_name, session_name)
+                    )
+                """)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def get(self, year: int, event_name: str, session_name: str) -> Optional[RainSummary]:
+        """The stored summary, or None if this session has never been checked."""
+        key = (year, event_name, session_name)
+        if key in self._memory or self.path is None:
+            return self._memory.get(key)
+
+        conn = self._connect()
+        try:
+            # Rows without weather were written by older versions; treat them as unchecked
+            row = conn.execute("""
+                SELECT any_rain, rain_fraction FROM session_rain
+                WHERE year = ? AND event_name = ? AND session_name = ? AND any_rain IS NOT NULL
+            """, key).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        summary = RainSummary(any_rain=bool(row[0]), rain_fraction=row[1])
+        self._memory[key] = summary
+        return summary
+
+    def season_summaries(self, year: int) -> List[Tuple[str, str, bool, Optional[float]]]:
+        """Every stored (event, session, any_rain, rain_fraction) for a season, in key order."""
+        if self.path is None:
+            return sorted(
+                (event_name, session_name, summary.any_rain, summary.rain_fraction)
+                for (y, event_name, session_name), summary in self._memory.items()
+                if y == year and summary.has_weather
+            )
+
+        conn = self._connect()
+        try:
+            rows = conn.execute("""
+                SELECT event_name, session_name, any_rain, rain_fraction FROM session_rain
+                WHERE year = ? AND any_rain IS NOT NULL
+                ORDER BY event_name, session_name
+            """, (year,)).fetchall()
+        finally:
+            conn.close()
+        return [(event_name, session_name, bool(any_rain), rain_fraction) for event_name, session_name, any_rain, rain_fraction in rows]
+
+    def put(self, year: int, event_name: str, session_name: str, summary: RainSummary) -> None:
+        key = (year, event_name, session_name)
+        self._memory[key] = summary
+        if self.path is None or not summary.has_weather:
+            return
+
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("""
+                    INSERT OR REPLACE INTO session_rain (year, event_name, session_name, any_rain, rain_fraction)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (*key, int(summary.any_rain), summary.rain_fraction))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            # A lost verdict only costs a weather load on the next run
+            logging.warning(f"Could not persist wet verdict for {event_name} {session_name}: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)